@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Run the AI Daily Digest web server."""
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -11,8 +12,31 @@ import uvicorn
 from web.config import HOST, PORT, DEBUG
 
 
+def refresh_caches():
+    """Clear cached scenario/research results so they are regenerated."""
+    from web.database import SessionLocal, init_db
+    from web.services.linkedin_service import LinkedInService
+
+    init_db()
+    db = SessionLocal()
+    try:
+        cleared = LinkedInService(db).clear_generation_caches()
+        print(f"Cleared generation caches for {cleared} articles")
+    finally:
+        db.close()
+
+
 def main():
     """Run the web server."""
+    parser = argparse.ArgumentParser(description="AI Daily Digest web server")
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="clear cached scenario detection / research results before starting",
+    )
+    args = parser.parse_args()
+    if args.refresh_cache:
+        refresh_caches()
+
     print(f"Starting AI Daily Digest web server...")
     print(f"Open http://localhost:{PORT} in your browser")
 
@@ -54,6 +54,13 @@ class ContentParser:
         r"(?:https?://)?(?:www\.)?github\.com/([^/]+/[^/]+)",
     ]
 
+    # 이메일 한 통에 URL이 수십 개 — 패턴은 클래스 로드 시 한 번만 컴파일
+    _YOUTUBE_RES = tuple(re.compile(p) for p in YOUTUBE_PATTERNS)
+    _TWITTER_RES = tuple(re.compile(p) for p in TWITTER_PATTERNS)
+    _GITHUB_RES = tuple(re.compile(p) for p in GITHUB_PATTERNS)
+    # URL 추출 패턴
+    _URL_RE = re.compile(r'https?://[^\s<>"\')\]}>]+')
+
     def classify_url(self, url: str) -> ContentType:
         """URL 타입 분류"""
         url_lower = url.lower()
@@ -61,18 +68,18 @@ class ContentParser:
         path = parsed.path.lower()
 
         # YouTube 체크
-        for pattern in self.YOUTUBE_PATTERNS:
-            if re.search(pattern, url):
+        for pattern in self._YOUTUBE_RES:
+            if pattern.search(url):
                 return ContentType.YOUTUBE
 
         # Twitter/X 체크
-        for pattern in self.TWITTER_PATTERNS:
-            if re.search(pattern, url):
+        for pattern in self._TWITTER_RES:
+            if pattern.search(url):
                 return ContentType.TWITTER
 
         # GitHub 체크
-        for pattern in self.GITHUB_PATTERNS:
-            if re.search(pattern, url):
+        for pattern in self._GITHUB_RES:
+            if pattern.search(url):
                 return ContentType.GITHUB
 
         # 이미지 체크
@@ -89,8 +96,8 @@ class ContentParser:
 
     def extract_youtube_id(self, url: str) -> Optional[str]:
         """YouTube 비디오 ID 추출"""
-        for pattern in self.YOUTUBE_PATTERNS:
-            match = re.search(pattern, url)
+        for pattern in self._YOUTUBE_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
 
@@ -104,16 +111,16 @@ class ContentParser:
 
     def extract_twitter_id(self, url: str) -> Optional[str]:
         """Twitter 트윗 ID 추출"""
-        for pattern in self.TWITTER_PATTERNS:
-            match = re.search(pattern, url)
+        for pattern in self._TWITTER_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
 
     def extract_github_repo(self, url: str) -> Optional[str]:
         """GitHub 저장소 경로 추출"""
-        for pattern in self.GITHUB_PATTERNS:
-            match = re.search(pattern, url)
+        for pattern in self._GITHUB_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
@@ -150,14 +157,11 @@ class ContentParser:
         contents = []
         seen_urls = set()
 
-        # URL 추출 패턴
-        url_pattern = r'https?://[^\s<>"\')\]}>]+'
-
         for body in [text, html]:
             if not body:
                 continue
 
-            urls = re.findall(url_pattern, body)
+            urls = self._URL_RE.findall(body)
             for url in urls:
                 # 정리
                 url = url.rstrip(".,;:!?")
@@ -120,9 +120,10 @@ JSON만 응답해주세요."""
         "depth": 1.0,
     }
 
-    def __init__(self):
-        self.client = None
-        if Anthropic and os.getenv("ANTHROPIC_API_KEY"):
+    def __init__(self, client=None):
+        # 웹 서비스는 공유 클라이언트(연결 풀 재사용)를 넘김 — 없으면 자체 생성
+        self.client = client
+        if self.client is None and Anthropic and os.getenv("ANTHROPIC_API_KEY"):
             self.client = Anthropic()
 
     @staticmethod
@@ -169,9 +170,9 @@ JSON만 응답해주세요."""
 
             # JSON 파싱
             if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
+                result_text = result_text.partition("```json")[2].partition("```")[0]
             elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0]
+                result_text = result_text.partition("```")[2].partition("```")[0]
 
             data = json.loads(result_text.strip())
 
@@ -235,9 +235,9 @@ JSON만 응답해주세요."""
 
                 # JSON 파싱
                 if "```json" in result_text:
-                    result_text = result_text.split("```json")[1].split("```")[0]
+                    result_text = result_text.partition("```json")[2].partition("```")[0]
                 elif "```" in result_text:
-                    result_text = result_text.split("```")[1].split("```")[0]
+                    result_text = result_text.partition("```")[2].partition("```")[0]
 
                 evaluations = json.loads(result_text.strip())
 
@@ -294,9 +294,9 @@ JSON만 응답해주세요."""
 
             # JSON 파싱
             if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
+                result_text = result_text.partition("```json")[2].partition("```")[0]
             elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0]
+                result_text = result_text.partition("```")[2].partition("```")[0]
 
             data = json.loads(result_text.strip())
 
@@ -373,9 +373,9 @@ JSON만 응답해주세요."""
 
             # JSON 파싱
             if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
+                result_text = result_text.partition("```json")[2].partition("```")[0]
             elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0]
+                result_text = result_text.partition("```")[2].partition("```")[0]
 
             data = json.loads(result_text.strip())
 
@@ -194,23 +194,41 @@ LinkedIn 포스트 본문만 작성해주세요. (1200-1600자)""",
 LinkedIn 포스트 본문만 작성해주세요. (1300-1800자)"""
     }
 
+    # 지침서 캐시 {경로: (st_mtime_ns, 지침서 섹션)} — 인스턴스 간 공유
+    _guidelines_cache: dict[str, tuple[int, str]] = {}
+
     def __init__(self, guidelines_path: str = "data/linkedin_guidelines.md"):
         self.client = None
         if Anthropic and os.getenv("ANTHROPIC_API_KEY"):
             self.client = Anthropic()
 
         self.guidelines_path = Path(guidelines_path)
-        self.guidelines = self._load_guidelines()
+
+    @property
+    def guidelines(self) -> str:
+        """프롬프트용 지침서 섹션 (파일 수정 시 자동 반영)"""
+        return self._load_guidelines()
 
     def _load_guidelines(self) -> str:
-        """LinkedIn 지침서 로드"""
-        if self.guidelines_path.exists():
-            try:
-                content = self.guidelines_path.read_text(encoding="utf-8")
-                return f"\n## 추가 지침\n{content}"
-            except Exception as e:
-                print(f"지침서 로드 실패: {e}")
-        return ""
+        """LinkedIn 지침서 로드 (mtime이 바뀔 때만 다시 읽음)"""
+        try:
+            mtime = self.guidelines_path.stat().st_mtime_ns
+        except OSError:
+            return ""
+
+        key = str(self.guidelines_path)
+        cached = LinkedInGenerator._guidelines_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            content = self.guidelines_path.read_text(encoding="utf-8")
+        except Exception as e:
+            print(f"지침서 로드 실패: {e}")
+            return ""
+        guidelines = f"\n## 추가 지침\n{content}"
+        LinkedInGenerator._guidelines_cache[key] = (mtime, guidelines)
+        return guidelines
 
     def is_available(self) -> bool:
         """API 사용 가능 여부"""
@@ -15,9 +15,10 @@ if TYPE_CHECKING:
 class Summarizer:
     """Claude API를 사용한 기사 요약 및 링크드인 포스트 생성"""
 
-    def __init__(self):
-        self.client = None
-        if Anthropic and os.getenv("ANTHROPIC_API_KEY"):
+    def __init__(self, client=None):
+        # 웹 서비스는 공유 클라이언트(연결 풀 재사용)를 넘김 — 없으면 자체 생성
+        self.client = client
+        if self.client is None and Anthropic and os.getenv("ANTHROPIC_API_KEY"):
             self.client = Anthropic()
 
     def summarize_article(self, article: "Article") -> str:
@@ -394,7 +394,7 @@ async def batch_summarize(
     if not ANTHROPIC_API_KEY:
         raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not configured")
 
-    import anthropic
+    from web.services.anthropic_client import get_client
 
     if force:
         # Re-summarize all articles (overwrite English summaries)
@@ -419,7 +419,7 @@ async def batch_summarize(
     if not articles:
         return {"processed": 0, "remaining": 0, "message": "처리할 기사가 없습니다"}
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = get_client()
     processed = 0
 
     for article in articles:
@@ -1,6 +1,5 @@
 """Inspiration Library API endpoints for managing reference posts and style profiles."""
 
-import json
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Depends
@@ -10,6 +9,8 @@ from sqlalchemy import func
 
 from web.database import get_db
 from web.models import ReferencePost
+from web.services import json_compat
+from web.services.style_brief import invalidate_brief_cache
 
 router = APIRouter(prefix="/api/inspiration", tags=["inspiration"])
 
@@ -60,20 +61,21 @@ async def create_inspiration_post(
         analysis = learner.analyze_post(data.content)
 
         # 태그 직렬화
-        tags_json = json.dumps(data.tags, ensure_ascii=False) if data.tags else None
+        tags_json = json_compat.dumps(data.tags) if data.tags else None
 
         # DB 저장
         post = ReferencePost(
             content=data.content,
             author=data.author,
             source_url=data.source_url,
-            analysis=json.dumps(analysis, ensure_ascii=False) if analysis else None,
+            analysis=json_compat.dumps(analysis) if analysis else None,
             scenario=data.scenario,
             tags=tags_json,
         )
         db.add(post)
         db.commit()
         db.refresh(post)
+        invalidate_brief_cache()
 
         return {
             "success": True,
@@ -141,8 +143,8 @@ async def get_inspiration_post(
     # analysis를 파싱된 JSON으로 제공
     if post.analysis:
         try:
-            result["analysis_parsed"] = json.loads(post.analysis)
-        except json.JSONDecodeError:
+            result["analysis_parsed"] = json_compat.loads(post.analysis)
+        except json_compat.JSONDecodeError:
             result["analysis_parsed"] = None
 
     return {"post": result}
@@ -162,11 +164,12 @@ async def update_inspiration_post(
     if data.scenario is not None:
         post.scenario = data.scenario
     if data.tags is not None:
-        post.tags = json.dumps(data.tags, ensure_ascii=False)
+        post.tags = json_compat.dumps(data.tags)
     if data.author is not None:
         post.author = data.author
 
     db.commit()
+    invalidate_brief_cache()
     return {"success": True, "post": post.to_dict()}
 
 
@@ -182,6 +185,7 @@ async def delete_inspiration_post(
 
     db.delete(post)
     db.commit()
+    invalidate_brief_cache()
     return {"success": True}
 
 
@@ -193,10 +197,10 @@ async def list_tags(db: Session = Depends(get_db)):
     tag_counts: dict[str, int] = {}
     for post in posts:
         try:
-            tags = json.loads(post.tags) if post.tags else []
+            tags = json_compat.loads(post.tags) if post.tags else []
             for tag in tags:
                 tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        except json.JSONDecodeError:
+        except json_compat.JSONDecodeError:
             continue
 
     # 사용 횟수 내림차순 정렬
@@ -223,7 +227,7 @@ async def reanalyze_inspiration_post(
 
     try:
         analysis = learner.analyze_post(post.content)
-        post.analysis = json.dumps(analysis, ensure_ascii=False)
+        post.analysis = json_compat.dumps(analysis)
         db.commit()
 
         return {
@@ -252,14 +256,14 @@ async def learn_from_post(
         # 분석이 없으면 먼저 분석
         if post.analysis:
             try:
-                analysis = json.loads(post.analysis)
-            except json.JSONDecodeError:
+                analysis = json_compat.loads(post.analysis)
+            except json_compat.JSONDecodeError:
                 analysis = learner.analyze_post(post.content)
-                post.analysis = json.dumps(analysis, ensure_ascii=False)
+                post.analysis = json_compat.dumps(analysis)
                 db.commit()
         else:
             analysis = learner.analyze_post(post.content)
-            post.analysis = json.dumps(analysis, ensure_ascii=False)
+            post.analysis = json_compat.dumps(analysis)
             db.commit()
 
         # 지침 업데이트 제안 생성
@@ -1,7 +1,8 @@
 """LinkedIn API endpoints."""
 
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -9,7 +10,7 @@ from typing import Optional
 
 from web.database import get_db
 from web.models import Article, LinkedInDraft
-from web.services.linkedin_service import LinkedInService, SCENARIOS
+from web.services.linkedin_service import LinkedInService, SCENARIOS, start_draft_batch_collection
 
 router = APIRouter(prefix="/api/linkedin", tags=["linkedin"])
 
@@ -35,6 +36,10 @@ class PostUpdate(BaseModel):
     linkedin_url: Optional[str] = None
 
 
+class BatchGenerateRequest(BaseModel):
+    article_ids: list[int]
+
+
 # --- Existing endpoints ---
 
 @router.get("/scenarios")
@@ -89,7 +94,7 @@ async def generate_hooks(
     service = LinkedInService(db)
 
     try:
-        hooks = service.generate_hooks(article, scenario=scenario, count=count)
+        hooks = await service.generate_hooks(article, scenario=scenario, count=count)
         return {
             "article_id": article_id,
             "scenario": scenario or service.detect_scenario(article),
@@ -121,7 +126,7 @@ async def generate_draft(
     service = LinkedInService(db)
 
     try:
-        draft = service.generate_draft(article, scenario=scenario, hook=hook)
+        draft = await service.generate_draft(article, scenario=scenario, hook=hook)
         return {
             "message": "Draft generated successfully",
             "draft": draft.to_dict(),
@@ -131,6 +136,103 @@ async def generate_draft(
         raise HTTPException(status_code=500, detail=f"Generation failed: {str(e)}")
 
 
+@router.post("/generate/{article_id}/stream")
+async def generate_draft_stream(
+    article_id: int,
+    scenario: Optional[str] = Query(default=None, regex="^[A-F]$"),
+    hook: Optional[str] = Query(default=None),
+    db: Session = Depends(get_db),
+):
+    """Generate a LinkedIn draft, streaming the Opus output as SSE while it is written."""
+    article = db.query(Article).filter(Article.id == article_id).first()
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    service = LinkedInService(db)
+
+    return StreamingResponse(
+        service.generate_draft_stream(article, scenario=scenario, hook=hook),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.post("/generate-batch")
+async def generate_drafts_batch(
+    body: BatchGenerateRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Generate drafts for several articles (e.g. a daily digest) via the Message Batches API.
+
+    Returns immediately with the batch id; drafts are saved in the background
+    once the batch ends. Interactive generation keeps using /generate.
+    """
+    article_ids = list(dict.fromkeys(body.article_ids))
+    if not article_ids:
+        raise HTTPException(status_code=400, detail="article_ids is empty")
+
+    articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+    if len(articles) != len(article_ids):
+        found = {a.id for a in articles}
+        missing = [i for i in article_ids if i not in found]
+        raise HTTPException(status_code=404, detail=f"Articles not found: {missing}")
+
+    service = LinkedInService(db)
+
+    try:
+        batch_id, targets = await service.submit_drafts_batch(articles)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch submission failed: {str(e)}")
+
+    start_draft_batch_collection(batch_id, targets)
+
+    return {
+        "message": "Draft batch submitted",
+        "batch_id": batch_id,
+        "count": len(targets),
+    }
+
+
+@router.post("/generate-many")
+async def generate_drafts_many(
+    body: BatchGenerateRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Generate drafts for several articles right away, with the Claude calls in parallel.
+
+    Full-price alternative to /generate-batch when the drafts are needed now.
+    """
+    article_ids = list(dict.fromkeys(body.article_ids))
+    if not article_ids:
+        raise HTTPException(status_code=400, detail="article_ids is empty")
+
+    articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+    if len(articles) != len(article_ids):
+        found = {a.id for a in articles}
+        missing = [i for i in article_ids if i not in found]
+        raise HTTPException(status_code=404, detail=f"Articles not found: {missing}")
+
+    service = LinkedInService(db)
+
+    try:
+        drafts, failed = await service.generate_drafts_many(articles)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Generation failed: {str(e)}")
+
+    return {
+        "message": "Drafts generated successfully" if not failed else f"{len(failed)} draft(s) failed",
+        "drafts": [d.to_dict() for d in drafts],
+        "failed_article_ids": list(failed),
+        "errors": {str(article_id): error for article_id, error in failed.items()},
+    }
+
+
 @router.get("/drafts/{article_id}")
 async def get_drafts(
     article_id: int,
@@ -157,14 +259,14 @@ async def regenerate_draft(
     db: Session = Depends(get_db),
 ):
     """Regenerate a draft with the same scenario."""
-    existing = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    existing = db.get(LinkedInDraft, draft_id)
     if not existing:
         raise HTTPException(status_code=404, detail="Draft not found")
 
     service = LinkedInService(db)
 
     try:
-        new_draft = service.regenerate_draft(draft_id)
+        new_draft = await service.regenerate_draft(draft_id)
         return {
             "message": "Draft regenerated successfully",
             "draft": new_draft.to_dict(),
@@ -180,7 +282,7 @@ async def delete_draft(
     db: Session = Depends(get_db),
 ):
     """Delete a specific draft."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
 
@@ -194,6 +296,7 @@ async def delete_draft(
 
 @router.post("/agent/start/{article_id}")
 async def agent_start(
+    request: Request,
     article_id: int,
     scenario: Optional[str] = Query(default=None, regex="^[A-F]$"),
     hook: Optional[str] = Query(default=None),
@@ -209,9 +312,24 @@ async def agent_start(
 
     agent = LinkedInAgent(db)
 
+    disconnect_event = asyncio.Event()
+
+    async def watch_disconnect():
+        # 클라이언트가 떠나면 입력 대기 중인 세션을 즉시 종료시킴
+        while not await request.is_disconnected():
+            await asyncio.sleep(1)
+        disconnect_event.set()
+
     async def event_generator():
-        async for event in agent.run(article_id, scenario, hook=hook, instructions=instructions):
-            yield event
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            async for event in agent.run(
+                article_id, scenario, hook=hook, instructions=instructions,
+                disconnect_event=disconnect_event,
+            ):
+                yield event
+        finally:
+            watcher.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -239,9 +357,8 @@ async def agent_input(
     if session.status != "waiting":
         raise HTTPException(status_code=400, detail=f"Session not waiting for input (status: {session.status})")
 
-    # Store input data and signal the event
-    session.input_data = data.model_dump(exclude_none=True)
-    session.input_event.set()
+    # Store input data and wake the waiting step
+    await session.provide_input(data.model_dump(exclude_none=True))
 
     return {"success": True, "session_id": session_id}
 
@@ -294,7 +411,7 @@ async def update_post(
     db: Session = Depends(get_db),
 ):
     """Update post status or LinkedIn URL."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Post not found")
 
@@ -330,7 +447,7 @@ async def learn_from_draft(
     db: Session = Depends(get_db),
 ):
     """Trigger StyleProfile learning from a draft's evaluation + feedback."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
 
@@ -354,7 +471,7 @@ async def finalize_draft(
     db: Session = Depends(get_db),
 ):
     """Mark a draft as final (ready to post)."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
 
@@ -396,7 +513,7 @@ async def draft_chat(
     db: Session = Depends(get_db),
 ):
     """Send a chat message to refine a draft (draft-based, no session needed)."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
 
@@ -416,7 +533,7 @@ async def update_draft_content(
     db: Session = Depends(get_db),
 ):
     """Directly update draft content (manual edit)."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
 
@@ -1,5 +1,6 @@
 """FastAPI main application."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
@@ -17,15 +18,25 @@ from web.models import Article, Collection, LinkedInDraft, Schedule
 from web.services.digest_service import DigestService
 from web.services.linkedin_service import SCENARIOS
 from web.services.scheduler_service import scheduler_service
-from web.config import LINKEDIN_GUIDELINES_PATH
+from web.config import LINKEDIN_GUIDELINES_PATH, EVAL_VIA_BATCH
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for startup/shutdown events."""
+    from web.services.linkedin_agent import cleanup_old_sessions, session_sweeper
+    from web.services.linkedin_service import resume_draft_batches
+
     # Startup
     init_db()
     scheduler_service.start()
+    sweeper_task = asyncio.create_task(session_sweeper())
+    batch_poller_task = None
+    if EVAL_VIA_BATCH:
+        from web.services.eval_batch import eval_batch_poller
+        batch_poller_task = asyncio.create_task(eval_batch_poller())
+    # 이전 프로세스에서 수집하지 못한 초안 배치 (DraftBatch 행) 수집 재개
+    await resume_draft_batches()
 
     yield
 
@@ -33,7 +44,9 @@ async def lifespan(app: FastAPI):
     scheduler_service.shutdown()
 
     # Cleanup agent sessions
-    from web.services.linkedin_agent import cleanup_old_sessions
+    sweeper_task.cancel()
+    if batch_poller_task:
+        batch_poller_task.cancel()
     cleanup_old_sessions(max_age_seconds=0)
 
 # Initialize app
@@ -233,6 +246,8 @@ async def article_detail(
     from web.services.linkedin_service import LinkedInService
     linkedin_service = LinkedInService(db)
     scenario_result = linkedin_service.detect_scenario_detailed(article)
+    if article in db.dirty:
+        db.commit()  # 새로 감지한 시나리오를 Article.scenario_json에 저장
 
     return templates.TemplateResponse(
         "articles/detail.html",
@@ -284,7 +299,7 @@ async def post_detail(
     db: Session = Depends(get_db),
 ):
     """Post detail page."""
-    post = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    post = db.get(LinkedInDraft, draft_id)
     if not post:
         return templates.TemplateResponse(
             "404.html",
@@ -324,7 +339,7 @@ async def draft_partial(
     db: Session = Depends(get_db),
 ):
     """HTMX partial for draft card."""
-    draft = db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+    draft = db.get(LinkedInDraft, draft_id)
     return templates.TemplateResponse(
         "partials/draft_card.html",
         {"request": request, "draft": draft, "scenarios": SCENARIOS},
@@ -465,6 +480,7 @@ async def inspiration_detail(
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request, db: Session = Depends(get_db)):
     """Settings page for managing LinkedIn guidelines."""
+    # 편집기는 항상 디스크 내용 그대로 (mtime 캐시는 생성 경로 전용)
     content = ""
     try:
         content = LINKEDIN_GUIDELINES_PATH.read_text(encoding="utf-8")
@@ -13,6 +13,10 @@ DB_PATH = DATA_DIR / "app.db"
 
 # Database
 DATABASE_URL = f"sqlite:///{DB_PATH}"
+# 커넥션 풀 (기본 QueuePool 5+10은 executor 스레드·배치 생성이 동시에 돌면 부족)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 
 # Server
 HOST = os.getenv("WEB_HOST", "0.0.0.0")
@@ -33,6 +37,15 @@ DEFAULT_ARTICLE_LIMIT = 50
 # LinkedIn settings
 LINKEDIN_GUIDELINES_PATH = DATA_DIR / "linkedin_guidelines.md"
 
+# Claude 호출 전용 스레드 풀 크기 (Anthropic 조직 rate limit의 동시 요청 수에 맞출 것)
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "32"))
+
+# 일괄 초안 생성(generate-many) 시 동시에 여는 Opus 스트림 수 (조직 RPM/OTPM 한도에 맞출 것)
+DRAFT_MAX_CONCURRENCY = int(os.getenv("DRAFT_MAX_CONCURRENCY", "4"))
+
+# Agent Step 5 최종 평가를 Message Batches API로 처리 (비용 ~50% 절감, 결과는 백그라운드에서 초안에 저장)
+EVAL_VIA_BATCH = os.getenv("EVAL_VIA_BATCH", "false").lower() == "true"
+
 # Google Custom Search (LinkedIn 리서치용)
 GOOGLE_CSE_API_KEY = os.getenv("GOOGLE_CSE_API_KEY")
 GOOGLE_CSE_ENGINE_ID = os.getenv("GOOGLE_CSE_ENGINE_ID")
@@ -1,18 +1,24 @@
 """SQLite database configuration with SQLAlchemy."""
 
+import json
+
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from contextlib import contextmanager
 
-from web.config import DATABASE_URL, DATA_DIR
+from web.config import DATABASE_URL, DATA_DIR, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT
 
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # Create engine
+# SQLite 파일 DB는 서버 측 idle 종료가 없어 pool_recycle/pool_pre_ping은 불필요
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # SQLite specific
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
     echo=False,
 )
 
@@ -25,7 +31,7 @@ Base = declarative_base()
 
 def init_db():
     """Initialize database tables."""
-    from web.models import article, collection, linkedin_draft, reference_post, style_profile  # noqa: F401
+    from web.models import article, collection, draft_batch, draft_message, linkedin_draft, reference_post, style_profile  # noqa: F401
     Base.metadata.create_all(bind=engine)
     migrate_db()
 
@@ -50,6 +56,8 @@ def migrate_db():
             "published_at": "DATETIME",
             "chat_history": "TEXT",
             "guidelines_checklist": "TEXT",
+            "eval_batch_id": "VARCHAR(64)",
+            "evaluating": "BOOLEAN DEFAULT 0",
         }
         with engine.begin() as conn:
             for col_name, col_type in new_columns.items():
@@ -57,6 +65,14 @@ def migrate_db():
                     conn.execute(text(
                         f"ALTER TABLE linkedin_drafts ADD COLUMN {col_name} {col_type}"
                     ))
+            # 기사별 버전 조회용 복합 인덱스 (기존 DB)
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_linkedin_drafts_article_version "
+                "ON linkedin_drafts (article_id, version)"
+            ))
+            _backfill_draft_messages(conn)
+            # 재시작으로 중단된 백그라운드 평가 표시 해제 (평가 태스크는 프로세스와 함께 사라짐)
+            conn.execute(text("UPDATE linkedin_drafts SET evaluating = 0 WHERE evaluating = 1"))
 
     # Articles 테이블 AI 평가 컬럼 마이그레이션
     if "articles" in inspector.get_table_names():
@@ -65,6 +81,8 @@ def migrate_db():
             "ai_score": "FLOAT",
             "linkedin_potential": "FLOAT",
             "eval_data": "TEXT",
+            "scenario_json": "TEXT",
+            "research_text": "TEXT",
         }
         with engine.begin() as conn:
             for col_name, col_type in article_columns.items():
@@ -96,6 +114,44 @@ def migrate_db():
                     ))
 
 
+def _backfill_draft_messages(conn):
+    """Copy legacy chat_history JSON into draft_messages rows.
+
+    The column is left intact; drafts that already have draft_messages rows
+    count as migrated and are skipped, so the copy runs once per draft.
+    """
+    legacy = conn.execute(text(
+        "SELECT id, chat_history FROM linkedin_drafts d WHERE chat_history IS NOT NULL "
+        "AND NOT EXISTS (SELECT 1 FROM draft_messages m WHERE m.draft_id = d.id)"
+    )).fetchall()
+    migrated = 0
+    for draft_id, chat_history in legacy:
+        inserted = False
+        try:
+            messages = json.loads(chat_history)
+        except json.JSONDecodeError:
+            messages = []  # 읽을 수 없는 이력은 기존에도 빈 대화로 취급
+        for msg in messages:
+            if not isinstance(msg, dict) or not msg.get("content"):
+                continue
+            conn.execute(
+                text(
+                    "INSERT INTO draft_messages (draft_id, role, content, timestamp) "
+                    "VALUES (:draft_id, :role, :content, :timestamp)"
+                ),
+                {
+                    "draft_id": draft_id,
+                    "role": msg.get("role", "user"),
+                    "content": msg["content"],
+                    "timestamp": msg.get("timestamp"),
+                },
+            )
+            inserted = True
+        migrated += inserted
+    if migrated:
+        print(f"[DB] 채팅 이력 {migrated}건을 draft_messages로 복사 (chat_history 컬럼은 보존)")
+
+
 def get_db():
     """Dependency for FastAPI to get DB session."""
     db = SessionLocal()
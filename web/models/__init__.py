@@ -2,9 +2,11 @@
 
 from web.models.article import Article
 from web.models.collection import Collection
+from web.models.draft_batch import DraftBatch
+from web.models.draft_message import DraftMessage
 from web.models.linkedin_draft import LinkedInDraft
 from web.models.reference_post import ReferencePost
 from web.models.schedule import Schedule
 from web.models.style_profile import StyleProfile
 
-__all__ = ["Article", "Collection", "LinkedInDraft", "ReferencePost", "Schedule", "StyleProfile"]
+__all__ = ["Article", "Collection", "DraftBatch", "DraftMessage", "LinkedInDraft", "ReferencePost", "Schedule", "StyleProfile"]
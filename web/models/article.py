@@ -26,6 +26,10 @@ class Article(Base):
     ai_score = Column(Float, nullable=True, index=True)          # AI 종합 점수 (0-10)
     linkedin_potential = Column(Float, nullable=True)              # LinkedIn 잠재력 (0-10)
     eval_data = Column(Text, nullable=True)                        # 전체 평가 JSON
+
+    # LinkedIn 생성 입력 캐시 (워커 재시작·프로세스 간 공유, run_web.py --refresh-cache로 초기화)
+    scenario_json = Column(Text, nullable=True)                    # 시나리오 감지 결과 JSON
+    research_text = Column(Text, nullable=True)                    # 웹 리서치 결과
     published_at = Column(DateTime, nullable=True)
     collected_at = Column(DateTime, default=datetime.utcnow, index=True)
 
@@ -0,0 +1,30 @@
+"""Pending draft Message Batch model (persisted so collection survives restarts)."""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Text
+
+from web.database import Base
+from web.services import json_compat
+
+
+class DraftBatch(Base):
+    """A submitted draft batch whose results have not been saved as drafts yet.
+
+    Deleted in the same transaction that saves its drafts; rows left at
+    startup are resumed by resume_draft_batches().
+    """
+
+    __tablename__ = "draft_batches"
+
+    batch_id = Column(String(64), primary_key=True)
+    targets = Column(Text, nullable=False)                # JSON {custom_id: [article_id, scenario, article_url]}
+    repair_batch_id = Column(String(64), nullable=True)   # 검증 실패분 수정 배치 (제출된 경우)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DraftBatch {self.batch_id}>"
+
+    @property
+    def target_map(self) -> dict:
+        """targets as {custom_id: (article_id, scenario, article_url)}."""
+        return {custom_id: tuple(target) for custom_id, target in json_compat.loads(self.targets).items()}
@@ -0,0 +1,36 @@
+"""Draft chat message model (one row per chat-refine message)."""
+
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from web.database import Base
+
+
+class DraftMessage(Base):
+    """A single user/assistant message in a draft's chat-refine history (append-only)."""
+
+    __tablename__ = "draft_messages"
+    # 드래프트별 대화 조회(WHERE draft_id=? ORDER BY id)용 복합 인덱스
+    __table_args__ = (
+        Index("ix_draft_messages_draft_id_id", "draft_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    draft_id = Column(Integer, ForeignKey("linkedin_drafts.id"), nullable=False)
+    role = Column(String(20), nullable=False)       # "user" | "assistant"
+    content = Column(Text, nullable=False)
+    timestamp = Column(String(32), nullable=True)   # 메시지 시각 (문자열 그대로 표시)
+
+    # Relationships
+    draft = relationship("LinkedInDraft", back_populates="messages")
+
+    def __repr__(self):
+        return f"<DraftMessage {self.id}: Draft {self.draft_id}, {self.role}>"
+
+    def to_dict(self) -> dict:
+        """Convert to the chat history entry shape ({role, content, timestamp})."""
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+        }
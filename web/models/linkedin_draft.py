@@ -1,16 +1,21 @@
 """LinkedIn draft model for storing generated posts."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Text, ForeignKey, Index, func, select
+from sqlalchemy.orm import object_session, relationship
 
 from web.database import Base
+from web.models.draft_message import DraftMessage
 
 
 class LinkedInDraft(Base):
     """Represents a generated LinkedIn draft for an article."""
 
     __tablename__ = "linkedin_drafts"
+    # 기사별 버전 조회(MAX(version), ORDER BY version DESC)용 복합 인덱스
+    __table_args__ = (
+        Index("ix_linkedin_drafts_article_version", "article_id", "version"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
@@ -27,8 +32,10 @@ class LinkedInDraft(Base):
     evaluation = Column(Text, nullable=True)        # 가이드라인 평가 JSON
     user_feedback = Column(Text, nullable=True)     # 사용자 피드백 JSON
     iteration_count = Column(Integer, default=1)    # 검토 반복 횟수
-    chat_history = Column(Text, nullable=True)      # JSON: [{role, content, timestamp}]
+    chat_history = Column(Text, nullable=True)      # (레거시, 미사용) migrate_db가 draft_messages로 복사 — 원본은 보존
     guidelines_checklist = Column(Text, nullable=True)  # 가이드라인 체크리스트 (agent 모드)
+    eval_batch_id = Column(String(64), nullable=True)   # 배치 평가 대기 중인 Message Batch ID
+    evaluating = Column(Boolean, default=False)         # Simple 모드 평가-수정 루프가 백그라운드에서 진행 중
 
     # 포스팅 상태 관련
     status = Column(String(20), default="draft")    # "draft" | "final" | "published"
@@ -37,10 +44,42 @@ class LinkedInDraft(Base):
 
     # Relationships
     article = relationship("Article", back_populates="linkedin_drafts")
+    messages = relationship(
+        "DraftMessage", back_populates="draft", order_by=DraftMessage.id, cascade="all, delete-orphan",
+    )
 
     def __repr__(self):
         return f"<LinkedInDraft {self.id}: Article {self.article_id}, Scenario {self.scenario}, v{self.version}>"
 
+    @classmethod
+    def next_version(cls, article_id: int):
+        """Next version number for an article's drafts, as a scalar subquery.
+
+        Assign it to `version` so MAX(version) + 1 is computed inside the INSERT
+        itself — no separate SELECT round-trip (index-only lookup).
+        """
+        return (
+            select(func.coalesce(func.max(cls.version), 0) + 1)
+            .where(cls.article_id == article_id)
+            .scalar_subquery()
+        )
+
+    @property
+    def chat_messages(self) -> list[dict]:
+        """Chat history as [{role, content, timestamp}] from draft_messages rows."""
+        return [m.to_dict() for m in self.messages]
+
+    def add_chat_turn(self, user_message: str, assistant_message: str, timestamp: str):
+        """Append a user/assistant message pair as two draft_messages rows.
+
+        The rows go straight into the session — `messages` is not loaded just to
+        append (O(1) per turn); it is refreshed from the DB after the commit.
+        """
+        object_session(self).add_all([
+            DraftMessage(draft_id=self.id, role="user", content=user_message, timestamp=timestamp),
+            DraftMessage(draft_id=self.id, role="assistant", content=assistant_message, timestamp=timestamp),
+        ])
+
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
         return {
@@ -57,8 +96,9 @@ class LinkedInDraft(Base):
             "evaluation": self.evaluation,
             "user_feedback": self.user_feedback,
             "iteration_count": self.iteration_count or 1,
-            "chat_history": self.chat_history,
+            "chat_history": self.chat_messages,
             "guidelines_checklist": self.guidelines_checklist,
+            "eval_pending": bool(self.eval_batch_id or self.evaluating),
             "status": self.status or "draft",
             "linkedin_url": self.linkedin_url,
             "published_at": self.published_at.isoformat() if self.published_at else None,
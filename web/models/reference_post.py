@@ -1,10 +1,10 @@
 """Reference post model for storing LinkedIn post examples for guideline learning."""
 
-import json
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Text
 
 from web.database import Base
+from web.services import json_compat
 
 
 class ReferencePost(Base):
@@ -33,6 +33,6 @@ class ReferencePost(Base):
             "source_url": self.source_url,
             "analysis": self.analysis,
             "scenario": self.scenario,
-            "tags": json.loads(self.tags) if self.tags else [],
+            "tags": json_compat.loads(self.tags) if self.tags else [],
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
@@ -1,10 +1,10 @@
 """Style profile model for storing dynamic writing style analysis."""
 
-import json
 from datetime import datetime
 from sqlalchemy import Column, Integer, DateTime, Text
 
 from web.database import Base
+from web.services import json_compat
 
 
 class StyleProfile(Base):
@@ -25,8 +25,8 @@ class StyleProfile(Base):
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
         try:
-            profile = json.loads(self.profile_data) if self.profile_data else {}
-        except json.JSONDecodeError:
+            profile = json_compat.loads(self.profile_data) if self.profile_data else {}
+        except json_compat.JSONDecodeError:
             profile = {}
 
         return {
@@ -1,6 +1,21 @@
 """Service layer for web application."""
 
-from web.services.digest_service import DigestService
-from web.services.linkedin_service import LinkedInService
+import importlib
+
+# 서비스는 처음 접근할 때 import (PEP 562) — `web.services.json_compat` 같은 하위 모듈만 쓰는
+# 경로가 digest 수집기(src.*)·anthropic SDK까지 끌어오지 않도록
+_LAZY_EXPORTS = {
+    "DigestService": "web.services.digest_service",
+    "LinkedInService": "web.services.linkedin_service",
+}
 
 __all__ = ["DigestService", "LinkedInService"]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,82 @@
+"""Shared Anthropic clients.
+
+Creating `Anthropic(...)` per request builds a fresh httpx connection pool,
+so every first call pays a new TCP + TLS handshake. Services share these
+process-wide clients instead so keep-alive connections are reused.
+
+- get_client()       : sync client (service methods, executor threads)
+- get_async_client() : AsyncAnthropic for coroutines on the event loop
+"""
+
+import functools
+import importlib.util
+from typing import TYPE_CHECKING
+
+import httpx
+
+from web.config import ANTHROPIC_API_KEY
+
+if TYPE_CHECKING:
+    # SDK import는 첫 클라이언트 생성 시점으로 미룸 (서비스 모듈 import 비용 절감)
+    from anthropic import Anthropic, AsyncAnthropic
+
+# Connection pool sizing (동시 agent 세션 수 기준)
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+# 유휴 연결 유지 시간 — 다이제스트 처리 중 연속 호출이 TLS 세션을 재사용하도록
+KEEPALIVE_EXPIRY = 30.0
+# Opus 응답은 수십 초 걸릴 수 있으므로 read timeout은 넉넉하게
+REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+# HTTP/2: 동시 세션의 요청을 연결 하나에 다중화 (h2 패키지가 있을 때만 — httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> "Anthropic":
+    """Return the process-wide Anthropic client (lazily created)."""
+    from anthropic import Anthropic
+
+    return Anthropic(
+        api_key=ANTHROPIC_API_KEY,
+        http_client=httpx.Client(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            timeout=REQUEST_TIMEOUT,
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> "AsyncAnthropic":
+    """Return the process-wide AsyncAnthropic client (lazily created).
+
+    Must be first used from the running event loop (the uvicorn loop).
+    """
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(
+        api_key=ANTHROPIC_API_KEY,
+        http_client=httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            timeout=REQUEST_TIMEOUT,
+        ),
+    )
+
+
+def cached_system(text: str) -> list[dict]:
+    """`system` param with a prompt-caching breakpoint on `text` (ephemeral, ~5 min).
+
+    Calls that send the same text reuse the cached prefix instead of paying
+    for (and re-processing) it again.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
@@ -3,11 +3,27 @@
 Shared by both Agent mode (linkedin_agent.py) and Simple mode (linkedin_service.py).
 """
 
+import re
+
 from web.models import Article
 
+# 권위 있는 연구/기술 기관 (출처명 소문자 부분 일치)
+AUTHORITY_SOURCES = frozenset(("mit", "stanford", "google", "deepmind", "openai", "anthropic", "meta ai", "microsoft research"))
+# 위 기관명을 하나의 교대 패턴으로 — 출처명 1회 스캔 (대소문자 무시로 lower() 복사도 생략)
+_AUTHORITY_SOURCES_RE = re.compile("|".join(map(re.escape, sorted(AUTHORITY_SOURCES))), re.IGNORECASE)
+
+
+def article_header_key(article: Article) -> tuple:
+    """The article fields build_article_header() reads — a cache key that changes on row updates."""
+    return (
+        article.id, article.title, article.source, article.url, article.category,
+        article.ai_summary, article.summary, article.ai_score, article.score,
+        article.linkedin_potential, article.viral_score,
+    )
 
-def build_article_context(article: Article, source_content: str = "", research_context: str = "") -> str:
-    """Build enriched article context with metadata, source content, and research."""
+
+def build_article_header(article: Article) -> str:
+    """Build the "## 기사 정보" metadata block (title, source, scores, authority)."""
     lines = [
         f"## 기사 정보",
         f"- 제목: {article.title}",
@@ -33,31 +49,37 @@ def build_article_context(article: Article, source_content: str = "", research_c
         lines.append(f"- 바이럴 점수: {article.viral_score} (화제성 높은 뉴스 → 독자의 관심을 활용하되, 과장은 피하세요)")
 
     # Source 기반 맥락
-    authority_sources = ["mit", "stanford", "google", "deepmind", "openai", "anthropic", "meta ai", "microsoft research"]
-    if article.source and any(src in article.source.lower() for src in authority_sources):
+    if article.source and _AUTHORITY_SOURCES_RE.search(article.source):
         lines.append(f"- 출처 권위: {article.source}는 권위 있는 연구/기술 기관입니다. 연구 권위를 강조하세요.")
 
-    result = "\n".join(lines)
+    return "\n".join(lines)
+
+
+def build_article_context(
+    article: Article, source_content: str = "", research_context: str = "", header: str = "",
+) -> str:
+    """Build enriched article context with metadata, source content, and research.
+
+    `header` is a precomputed build_article_header() result; built here when empty.
+    """
+    # 섹션을 모아 마지막에 한 번만 join (긴 원문/리서치 텍스트 재복사 방지)
+    sections = [header or build_article_header(article)]
 
     # Append source content if available
     if source_content:
-        result += f"""
-
-## 원문 콘텐츠 (반드시 깊이 읽고 활용하세요)
+        sections.append(f"""## 원문 콘텐츠 (반드시 깊이 읽고 활용하세요)
 아래는 기사 원문에서 추출한 핵심 내용입니다. 이 원문이 포스트의 근거입니다.
 - 구체적 수치, 통계, 퍼센티지를 그대로 인용하세요
 - 인물의 직접 발언이 있으면 따옴표로 인용하세요
 - 대비/비교 소재(이전 vs 이후, A사 vs B사)를 활용하세요
 - 원문에서 가장 놀라운 팩트를 포스트의 핵심 소재로 삼으세요
 
-{source_content}"""
+{source_content}""")
 
     # Append research context if available
     if research_context:
-        result += f"""
-
-{research_context}
+        sections.append(f"""{research_context}
 
-위 리서치 결과에서 신뢰도 있는 수치, 인용구, 업계 맥락, 경쟁사 비교 데이터를 활용하여 포스트의 깊이를 높이세요."""
+위 리서치 결과에서 신뢰도 있는 수치, 인용구, 업계 맥락, 경쟁사 비교 데이터를 활용하여 포스트의 깊이를 높이세요.""")
 
-    return result
+    return "\n\n".join(sections)
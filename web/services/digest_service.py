@@ -20,7 +20,8 @@ from src.collectors.arxiv_enricher import ArxivEnricher
 from src.outputs.notion_output import NotionOutput
 
 from web.models import Article, Collection
-from web.config import DEFAULT_COLLECTION_HOURS, DEFAULT_HN_LIMIT, DEFAULT_ARTICLE_LIMIT
+from web.config import ANTHROPIC_API_KEY, DEFAULT_COLLECTION_HOURS, DEFAULT_HN_LIMIT, DEFAULT_ARTICLE_LIMIT
+from web.services.anthropic_client import get_client
 
 
 CollectionType = Literal["news", "viral", "all"]
@@ -36,7 +37,7 @@ class DigestService:
         self.viral_aggregator = ViralAggregator()
         self.deduplicator = Deduplicator()
         self.scorer = Scorer()
-        self.summarizer = Summarizer()
+        self.summarizer = Summarizer(get_client() if ANTHROPIC_API_KEY else None)
         self.arxiv_enricher = ArxivEnricher()
         self.notion_output = NotionOutput()
 
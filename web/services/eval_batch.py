@@ -0,0 +1,102 @@
+"""Background collection of Message Batches evaluation results (EVAL_VIA_BATCH).
+
+Agent Step 5 submits the final evaluation as a batch and saves the draft
+with `eval_batch_id` set; draft batches (collect_draft_batch) submit one
+evaluation batch for all their drafts, keyed by `draft-<id>`. This poller checks those batches and writes the
+evaluation back to the draft once the batch has ended.
+"""
+
+import asyncio
+from typing import Optional
+
+from web.database import SessionLocal
+from web.models import LinkedInDraft
+from web.services import json_compat
+from web.services.anthropic_client import get_client
+from web.services.evaluator import parse_evaluation
+
+# 폴링 간격: 대기 중인 배치가 있으면 1초부터 2배씩 늘려 최대 30초
+POLL_MIN_SECONDS = 1
+POLL_MAX_SECONDS = 30
+
+# 새 배치 제출 시 poller를 깨워 간격을 초기화
+_submitted = asyncio.Event()
+
+
+def notify_batch_submitted():
+    """Wake the poller so a freshly submitted batch is checked with a short interval."""
+    _submitted.set()
+
+
+def poll_pending_batches() -> int:
+    """Check every pending evaluation batch once. Returns how many are still pending."""
+    db = SessionLocal()
+    try:
+        drafts = (
+            db.query(LinkedInDraft)
+            .filter(LinkedInDraft.eval_batch_id.isnot(None))
+            .all()
+        )
+        if not drafts:
+            return 0
+
+        client = get_client()
+        pending = 0
+        # 한 배치에 여러 초안이 묶일 수 있으므로 배치별로 1회만 조회
+        results: dict[str, Optional[dict]] = {}
+        for draft in drafts:
+            batch_id = draft.eval_batch_id
+            try:
+                if batch_id not in results:
+                    results[batch_id] = _collect_results(client, batch_id)
+                by_custom_id = results[batch_id]
+                if by_custom_id is None:
+                    pending += 1
+                    continue
+
+                # 초안 배치 평가는 draft-<id>, 단건 제출(Agent)은 유일한 항목
+                evaluation = by_custom_id.get(f"draft-{draft.id}")
+                if evaluation is None and len(by_custom_id) == 1:
+                    evaluation = next(iter(by_custom_id.values()))
+                if evaluation is None:
+                    evaluation = json_compat.dumps({"overall_score": 0, "error": "배치 평가 실패"})
+
+                draft.evaluation = evaluation
+                draft.eval_batch_id = None
+            except Exception as e:
+                results[batch_id] = None
+                print(f"[EvalBatch] 배치 조회 실패 [draft {draft.id}]: {e}")
+                pending += 1
+
+        db.commit()
+        return pending
+    finally:
+        db.close()
+
+
+def _collect_results(client, batch_id: str) -> Optional[dict]:
+    """Parsed evaluations keyed by custom_id, or None while the batch is still running."""
+    batch = client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        return None
+    evaluations = {}
+    for entry in client.messages.batches.results(batch_id):
+        if entry.result.type == "succeeded":
+            evaluations[entry.custom_id], _ = parse_evaluation(entry.result.message.content[0].text)
+    return evaluations
+
+
+async def eval_batch_poller():
+    """Background loop started from app lifespan when EVAL_VIA_BATCH is on."""
+    loop = asyncio.get_running_loop()
+    delay = POLL_MIN_SECONDS
+    while True:
+        try:
+            await asyncio.wait_for(_submitted.wait(), timeout=delay)
+            _submitted.clear()
+            delay = POLL_MIN_SECONDS
+        except asyncio.TimeoutError:
+            pass
+
+        pending = await loop.run_in_executor(None, poll_pending_batches)
+        delay = min(delay * 2, POLL_MAX_SECONDS) if pending else POLL_MAX_SECONDS
@@ -1,13 +1,13 @@
 """AI evaluation service for articles using Claude Haiku."""
 
-import json
 from typing import Optional
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
 from web.models import Article
 from web.config import ANTHROPIC_API_KEY
+from web.services import json_compat
+from web.services.anthropic_client import get_client
 from src.processors.evaluator import ArticleEvaluator
 
 
@@ -18,8 +18,8 @@ class EvaluationService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
-        self.evaluator = ArticleEvaluator()
+        self.client = get_client() if ANTHROPIC_API_KEY else None
+        self.evaluator = ArticleEvaluator(self.client)
 
     def evaluate_article(self, article: Article, force: bool = False) -> Optional[dict]:
         """단건 AI 평가 → DB 저장, 결과 반환"""
@@ -27,7 +27,7 @@ class EvaluationService:
             return None
 
         if article.ai_score is not None and not force:
-            return json.loads(article.eval_data) if article.eval_data else None
+            return json_compat.loads(article.eval_data) if article.eval_data else None
 
         raw = self._call_evaluator(article)
         if not raw:
@@ -37,7 +37,7 @@ class EvaluationService:
 
         article.ai_score = ai_score
         article.linkedin_potential = linkedin_potential
-        article.eval_data = json.dumps(raw, ensure_ascii=False)
+        article.eval_data = json_compat.dumps(raw)
         self.db.commit()
 
         return raw
@@ -78,7 +78,7 @@ class EvaluationService:
                 ai_score, linkedin_potential = ArticleEvaluator.calculate_scores(raw)
                 article.ai_score = ai_score
                 article.linkedin_potential = linkedin_potential
-                article.eval_data = json.dumps(raw, ensure_ascii=False)
+                article.eval_data = json_compat.dumps(raw)
                 processed += 1
 
         self.db.commit()
@@ -116,11 +116,11 @@ class EvaluationService:
 
             # JSON 파싱
             if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
+                result_text = result_text.partition("```json")[2].partition("```")[0]
             elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0]
+                result_text = result_text.partition("```")[2].partition("```")[0]
 
-            return json.loads(result_text.strip())
+            return json_compat.loads(result_text.strip())
 
         except Exception as e:
             print(f"[EvalService] 평가 실패 [{article.title[:30]}]: {e}")
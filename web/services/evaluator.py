@@ -7,13 +7,12 @@ Consolidates three evaluation modes:
 
 import json
 import re
-import unicodedata
 from typing import Optional
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
-from web.config import ANTHROPIC_API_KEY
+from web.services import json_compat
+from web.services.anthropic_client import cached_system, get_client
 from web.services.style_brief import StyleBrief
 
 
@@ -22,6 +21,54 @@ MODEL_WRITING = "claude-opus-4-20250514"
 MODEL_CLASSIFY = "claude-haiku-4-5-20251001"
 
 
+# 평가 응답에서 첫 '{'부터 JSON 객체 하나만 디코딩 (뒤에 붙은 설명은 무시)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def parse_evaluation(raw: str) -> tuple[str, dict]:
+    """Parse a Claude evaluation reply into (json_str, dict).
+
+    On failure the dict carries an "error" key (and the string is its JSON form).
+    """
+    json_start = raw.find("{")
+    if json_start >= 0:
+        try:
+            data, json_end = _JSON_DECODER.raw_decode(raw, json_start)
+            if isinstance(data, dict):
+                return raw[json_start:json_end], data
+        except ValueError:
+            pass
+
+    error = {"overall_score": 0, "error": "평가 결과 파싱 실패"}
+    return json_compat.dumps(error), error
+
+
+# full 평가 프롬프트의 불변 출력 형식 (초안/지침서 뒤에 그대로 이어 붙임)
+_FULL_EVAL_OUTPUT_FORMAT = """## 출력 형식 (JSON)
+다음 JSON 형식으로 평가 결과를 출력해주세요 (코드 블록 없이 JSON 객체만):
+
+{
+  "overall_score": 85,
+  "items": [
+    {"category": "문체", "rule": "하십시오체 기본", "pass": true, "comment": "적절히 사용됨"},
+    {"category": "문체", "rule": "리듬 전환 (해요체)", "pass": true, "comment": "자연스러운 전환"},
+    {"category": "구조", "rule": "훅 (1-2문장)", "pass": true, "comment": "강력한 숫자 훅"},
+    {"category": "구조", "rule": "본문 구조", "pass": true, "comment": "시나리오에 맞는 전개"},
+    {"category": "구조", "rule": "마무리", "pass": true, "comment": "행동 선언으로 마무리"},
+    {"category": "금지", "rule": "이모지 없음", "pass": true, "comment": "이모지 미사용"},
+    {"category": "금지", "rule": "여러분 호칭 없음", "pass": true, "comment": "적절한 톤"},
+    {"category": "금지", "rule": "과장 표현 없음", "pass": true, "comment": "절제된 표현"},
+    {"category": "금지", "rule": "조언톤 없음", "pass": true, "comment": "1인칭 서술"},
+    {"category": "형식", "rule": "길이 (1800-2800자)", "pass": true, "comment": "약 2400자"},
+    {"category": "형식", "rule": "단락 구분", "pass": true, "comment": "명확한 구분"},
+    {"category": "형식", "rule": "원문 링크 포함", "pass": true, "comment": "링크 포함됨"}
+  ],
+  "summary": "전체적으로 지침을 잘 준수한 포스트입니다."
+}
+
+JSON만 출력하세요. 다른 설명은 불필요합니다."""
+
+
 # 금지어 목록
 FORBIDDEN_WORDS = [
     "여러분", "혁명", "패러다임 시프트", "게임체인저",
@@ -42,13 +89,93 @@ FEAR_PATTERNS = [
 ]
 
 
+def _compile_pattern_scan(patterns: list[str]) -> re.Pattern:
+    """One-pass scan for several patterns: lookahead alternation of named groups p0..pN.
+
+    finditer reports every start position (overlaps included); match.lastgroup
+    names the pattern. No pattern here is a prefix of another at the same position.
+    """
+    return re.compile("(?=" + "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns)) + ")")
+
+
+def _scan_patterns(regex: re.Pattern, patterns: list[str], content: str) -> list[str]:
+    """Patterns that occur in `content`, in list order."""
+    found = {m.lastgroup for m in regex.finditer(content)}
+    return [p for i, p in enumerate(patterns) if f"p{i}" in found]
+
+
+# validate()용 사전 컴파일 — 금지어·조언톤·공포마케팅 각각 단일 패스 스캔
+# 금지어는 서로 겹칠 수 있음 (예: "대전환점" → 대전환 + 전환점) — 겹침까지 잡는 lookahead 스캔
+_FORBIDDEN_RE = _compile_pattern_scan([re.escape(word) for word in FORBIDDEN_WORDS])
+_ADVICE_RE = _compile_pattern_scan(ADVICE_PATTERNS)
+_FEAR_RE = _compile_pattern_scan(FEAR_PATTERNS)
+# 이모지 블록: Misc Technical, Geometric Shapes, Misc Symbols·Dingbats, Misc Symbols and Arrows,
+# ㊗㊙, 그리고 U+1F000 이후 이모지/픽토그램 평면 전체
+_EMOJI_RE = re.compile(
+    "[\u2300-\u23FF\u25A0-\u25FF\u2600-\u27BF\u2B00-\u2BFF\u3297\u3299\U0001F000-\U0001FAFF]"
+)
+
+
+def autofix(content: str, article_url: str) -> str:
+    """Fix the one rule violation that needs no rewrite: a missing source link.
+
+    Run before validate() so a Claude repair call is not spent on it. Forbidden
+    words are left to the Claude fix — swapping the noun alone breaks the
+    particle that follows (혁명이 → 큰 변화이).
+    """
+    if article_url and article_url not in content:
+        return f"{content.rstrip()}\n\n원문: {article_url}"
+    return content
+
+
+# 생성 프롬프트 끝에 붙이는 자체 검증 체크리스트 — validate()와 같은 규칙을 모델이 출력 전에 확인하도록
+# (사후 수정 호출 감소). 규칙을 바꾸면 validate()와 함께 바꿀 것
+DRAFT_SELF_CHECKLIST = f"""
+
+## 자동 검증 체크리스트 (출력 전 반드시 확인)
+출력 전에 아래 항목을 스스로 점검하고, 하나라도 어기면 출력하지 말고 해당 부분을 다시 작성하세요.
+- 글자수 1800-2800자 (출력 전 글자수를 세고 범위를 벗어나면 즉시 재작성)
+- 금지어 없음: {", ".join(FORBIDDEN_WORDS)}
+- 조언톤(~하세요, ~해보세요, ~합시다) 없음 — 1인칭 서술
+- 공포마케팅(뒤처짐, 늦으면, 놓치면, 도태, 살아남기) 없음
+- 이모지 없음
+- 단락 3개 이상 (빈 줄로 구분)
+- 첫 줄(훅) 210자 이내
+- 마지막 줄에 원문 링크 포함"""
+
+
+def build_fix_prompt(content: str, issues: list[str], article_url: str) -> str:
+    """Targeted-fix prompt: rewrite only the listed issue lines ("- [category] ...")."""
+    return f"""다음 LinkedIn 포스트에서 문제 항목만 수정해주세요.
+
+## 현재 초안
+{content}
+
+""" + _fix_instructions(issues, article_url)
+
+
+def build_fix_followup(issues: list[str], article_url: str) -> str:
+    """Fix request sent as the next user turn after the draft (the draft is the previous assistant turn)."""
+    return "방금 작성한 포스트에서 문제 항목만 수정해주세요.\n\n" + _fix_instructions(issues, article_url)
+
+
+def _fix_instructions(issues: list[str], article_url: str) -> str:
+    return f"""## 수정 필요 항목
+{chr(10).join(issues)}
+
+## 중요
+- 문제 항목만 수정하고, 잘 된 부분은 그대로 유지
+- LinkedIn 포스트 본문만 출력
+- 원문 링크 유지: {article_url}"""
+
+
 class LinkedInEvaluator:
     """Unified evaluation for LinkedIn drafts."""
 
     def __init__(self, db: Session, brief: Optional[StyleBrief] = None):
         self.db = db
         self.brief = brief
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()
 
     def validate(self, content: str, article_url: str) -> dict:
         """Regex-based rule validation (no LLM). Fast quality gate."""
@@ -61,26 +188,21 @@ class LinkedInEvaluator:
         elif char_count > 2800:
             issues.append(f"글자수 초과: {char_count}자 (최대 2800자)")
 
-        # 2. 금지어 체크
-        for word in FORBIDDEN_WORDS:
-            if word in content:
-                issues.append(f"금지어 포함: '{word}'")
+        # 2. 금지어 체크 (보고 순서는 FORBIDDEN_WORDS 순서 유지)
+        for word in _scan_patterns(_FORBIDDEN_RE, FORBIDDEN_WORDS, content):
+            issues.append(f"금지어 포함: '{word}'")
 
-        # 3. 조언톤 정규식 체크
-        for pattern in ADVICE_PATTERNS:
-            if re.search(pattern, content):
-                issues.append(f"조언톤 감지: '{pattern}'")
+        # 3. 조언톤 정규식 체크 (패턴 전체를 한 번에 스캔)
+        for pattern in _scan_patterns(_ADVICE_RE, ADVICE_PATTERNS, content):
+            issues.append(f"조언톤 감지: '{pattern}'")
 
         # 4. 공포마케팅 패턴 체크
-        for pattern in FEAR_PATTERNS:
-            if re.search(pattern, content):
-                issues.append(f"공포마케팅 감지: '{pattern}'")
+        for pattern in _scan_patterns(_FEAR_RE, FEAR_PATTERNS, content):
+            issues.append(f"공포마케팅 감지: '{pattern}'")
 
         # 5. 이모지 체크
-        for char in content:
-            if unicodedata.category(char).startswith("So"):
-                issues.append("이모지 포함됨")
-                break
+        if _EMOJI_RE.search(content):
+            issues.append("이모지 포함됨")
 
         # 6. 원문 링크 포함 여부
         if article_url and article_url not in content:
@@ -92,7 +214,7 @@ class LinkedInEvaluator:
             issues.append(f"단락 수 부족: {len(paragraphs)}개 (최소 3개 필요)")
 
         # 8. 훅(첫 줄) 210자 이내
-        first_line = content.strip().split("\n")[0] if content.strip() else ""
+        first_line = content.strip().partition("\n")[0]
         if len(first_line) > 210:
             issues.append(f"훅이 너무 김: {len(first_line)}자 (최대 210자)")
 
@@ -103,29 +225,32 @@ class LinkedInEvaluator:
         }
 
     def evaluate_and_fix(
-        self, content: str, article_url: str, max_iterations: int = 2
+        self, content: str, article_url: str, max_iterations: int = 2,
+        prompt: Optional[tuple[str, str]] = None,
     ) -> tuple[str, str, int]:
         """AI 평가 → FAIL 타겟 수정 루프. Simple/Agent 모두 사용.
 
+        prompt: 초안을 만든 (system, user) 프롬프트. 주면 수정 요청을 그 대화의 다음 턴으로
+        보내 생성 때 캐시된 system prefix를 재사용함.
+
         Returns: (final_content, evaluation_json, iteration_count)
         """
         current = content
         eval_json = ""
 
         for i in range(max_iterations):
-            # 1. 정규식 validate
+            # 1. 로컬 자동 수정(누락된 원문 링크) 후 정규식 validate
+            current = autofix(current, article_url)
             validation = self.validate(current, article_url)
 
-            # 2. AI evaluate (full mode)
-            eval_json = self.evaluate(current, mode="full")
-
-            try:
-                eval_data = json.loads(eval_json)
-                score = eval_data.get("overall_score", 100)
-                fail_items = [it for it in eval_data.get("items", []) if not it.get("pass", True)]
-            except (json.JSONDecodeError, KeyError):
+            # 2. AI evaluate (full mode) — 파싱된 객체를 함께 받아 재파싱하지 않음
+            eval_json, eval_data = self.evaluate_with_data(current, mode="full")
+            if "error" in eval_data:
                 break
 
+            score = eval_data.get("overall_score", 100)
+            fail_items = [it for it in eval_data.get("items", ()) if not it.get("pass", True)]
+
             # 3. 통과 조건
             if score >= 70 and len(fail_items) < 3 and validation["valid"]:
                 break
@@ -137,24 +262,21 @@ class LinkedInEvaluator:
             for issue in validation.get("issues", []):
                 issues.append(f"- [규칙] {issue}")
 
-            fix_prompt = f"""다음 LinkedIn 포스트에서 문제 항목만 수정해주세요.
-
-## 현재 초안
-{current}
-
-## 수정 필요 항목
-{chr(10).join(issues)}
-
-## 중요
-- 문제 항목만 수정하고, 잘 된 부분은 그대로 유지
-- LinkedIn 포스트 본문만 출력
-- 원문 링크 유지: {article_url}"""
+            if prompt:
+                system, user = prompt
+                fix_params = {
+                    "system": cached_system(system),
+                    "messages": [
+                        {"role": "user", "content": user},
+                        {"role": "assistant", "content": current},
+                        {"role": "user", "content": build_fix_followup(issues, article_url)},
+                    ],
+                }
+            else:
+                fix_params = {"messages": [{"role": "user", "content": build_fix_prompt(current, issues, article_url)}]}
 
             try:
-                response = self.client.messages.create(
-                    model=MODEL_WRITING, max_tokens=4000,
-                    messages=[{"role": "user", "content": fix_prompt}],
-                )
+                response = self.client.messages.create(model=MODEL_WRITING, max_tokens=4000, **fix_params)
                 current = response.content[0].text
             except Exception:
                 break
@@ -166,6 +288,39 @@ class LinkedInEvaluator:
 
         Returns JSON string with evaluation results.
         """
+        return self.evaluate_with_data(content, mode)[0]
+
+    def evaluate_with_data(self, content: str, mode: str = "quick") -> tuple[str, dict]:
+        """Same as evaluate(), but also returns the parsed evaluation dict.
+
+        The JSON is decoded once here; callers that need fields use the dict
+        instead of parsing the string again. On failure the dict carries an
+        "error" key (and the string is its JSON form).
+        """
+        try:
+            response = self.client.messages.create(**self._build_eval_request(content, mode))
+            return parse_evaluation(response.content[0].text)
+        except Exception as e:
+            error = {"overall_score": 0, "error": str(e)}
+            return json_compat.dumps(error), error
+
+    def submit_batch_evaluation(self, content: str, custom_id: str) -> str:
+        """Submit a full-mode evaluation via the Message Batches API. Returns the batch id.
+
+        Results are collected later by eval_batch.poll_pending_batches().
+        """
+        batch = self.client.messages.batches.create(requests=[self.batch_request(content, custom_id)])
+        return batch.id
+
+    def batch_request(self, content: str, custom_id: str, mode: str = "full") -> dict:
+        """One Message Batches request entry evaluating `content` against this evaluator's brief.
+
+        Lets callers pack evaluations for several drafts (different briefs) into one batch.
+        """
+        return {"custom_id": custom_id, "params": self._build_eval_request(content, mode=mode)}
+
+    def _build_eval_request(self, content: str, mode: str) -> dict:
+        """Build messages.create params for an evaluation (shared by sync and batch paths)."""
         guidelines_text = self.brief.to_reviewer_prompt_section() if self.brief else "기본 LinkedIn 포스팅 규칙"
         model = MODEL_CLASSIFY if mode == "quick" else MODEL_WRITING
 
@@ -196,49 +351,10 @@ class LinkedInEvaluator:
 ## 지침서
 {guidelines_text}
 
-## 출력 형식 (JSON)
-다음 JSON 형식으로 평가 결과를 출력해주세요:
-
-```json
-{{
-  "overall_score": 85,
-  "items": [
-    {{"category": "문체", "rule": "하십시오체 기본", "pass": true, "comment": "적절히 사용됨"}},
-    {{"category": "문체", "rule": "리듬 전환 (해요체)", "pass": true, "comment": "자연스러운 전환"}},
-    {{"category": "구조", "rule": "훅 (1-2문장)", "pass": true, "comment": "강력한 숫자 훅"}},
-    {{"category": "구조", "rule": "본문 구조", "pass": true, "comment": "시나리오에 맞는 전개"}},
-    {{"category": "구조", "rule": "마무리", "pass": true, "comment": "행동 선언으로 마무리"}},
-    {{"category": "금지", "rule": "이모지 없음", "pass": true, "comment": "이모지 미사용"}},
-    {{"category": "금지", "rule": "여러분 호칭 없음", "pass": true, "comment": "적절한 톤"}},
-    {{"category": "금지", "rule": "과장 표현 없음", "pass": true, "comment": "절제된 표현"}},
-    {{"category": "금지", "rule": "조언톤 없음", "pass": true, "comment": "1인칭 서술"}},
-    {{"category": "형식", "rule": "길이 (1800-2800자)", "pass": true, "comment": "약 2400자"}},
-    {{"category": "형식", "rule": "단락 구분", "pass": true, "comment": "명확한 구분"}},
-    {{"category": "형식", "rule": "원문 링크 포함", "pass": true, "comment": "링크 포함됨"}}
-  ],
-  "summary": "전체적으로 지침을 잘 준수한 포스트입니다."
-}}
-```
-
-JSON만 출력하세요. 다른 설명은 불필요합니다."""
+""" + _FULL_EVAL_OUTPUT_FORMAT
 
-        try:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=1000 if mode == "quick" else 2000,
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            raw = response.content[0].text
-
-            # Extract JSON from response
-            json_start = raw.find("{")
-            json_end = raw.rfind("}") + 1
-            if json_start >= 0 and json_end > json_start:
-                evaluation_json = raw[json_start:json_end]
-                json.loads(evaluation_json)  # validate
-                return evaluation_json
-
-            return json.dumps({"overall_score": 0, "error": "평가 결과 파싱 실패"})
-        except Exception as e:
-            return json.dumps({"overall_score": 0, "error": str(e)})
+        return {
+            "model": model,
+            "max_tokens": 1000 if mode == "quick" else 2000,
+            "messages": [{"role": "user", "content": prompt}],
+        }
@@ -3,11 +3,13 @@
 import json
 from typing import Optional
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
 from web.models import ReferencePost
-from web.config import ANTHROPIC_API_KEY, LINKEDIN_GUIDELINES_PATH
+from web.config import LINKEDIN_GUIDELINES_PATH
+from web.services import json_compat
+from web.services.anthropic_client import get_client
+from web.services.style_brief import invalidate_brief_cache, load_guidelines
 
 
 class GuidelinesLearner:
@@ -15,14 +17,11 @@ class GuidelinesLearner:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()
 
     def _load_guidelines(self) -> str:
-        """Load current LinkedIn guidelines."""
-        try:
-            return LINKEDIN_GUIDELINES_PATH.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            return ""
+        """Load current LinkedIn guidelines (shared mtime-keyed cache)."""
+        return load_guidelines()
 
     def analyze_post(self, content: str) -> dict:
         """
@@ -88,8 +87,8 @@ JSON만 출력하세요."""
             json_start = raw.find("{")
             json_end = raw.rfind("}") + 1
             if json_start >= 0 and json_end > json_start:
-                return json.loads(raw[json_start:json_end])
-        except json.JSONDecodeError:
+                return json_compat.loads(raw[json_start:json_end])
+        except json_compat.JSONDecodeError:
             pass
 
         return {"error": "분석 실패", "raw": raw}
@@ -148,8 +147,8 @@ JSON만 출력하세요. 기존 지침과 충돌하는 제안은 하지 마세
             json_start = raw.find("{")
             json_end = raw.rfind("}") + 1
             if json_start >= 0 and json_end > json_start:
-                return json.loads(raw[json_start:json_end])
-        except json.JSONDecodeError:
+                return json_compat.loads(raw[json_start:json_end])
+        except json_compat.JSONDecodeError:
             pass
 
         return {"error": "제안 생성 실패", "raw": raw}
@@ -218,10 +217,11 @@ JSON만 출력하세요. 기존 지침과 충돌하는 제안은 하지 마세
             content=content,
             author=author,
             source_url=source_url,
-            analysis=json.dumps(analysis, ensure_ascii=False) if analysis else None,
+            analysis=json_compat.dumps(analysis) if analysis else None,
             scenario=scenario,
         )
         self.db.add(post)
         self.db.commit()
         self.db.refresh(post)
+        invalidate_brief_cache()
         return post
@@ -0,0 +1,38 @@
+"""JSON helpers — orjson when installed, stdlib json otherwise.
+
+Both paths produce UTF-8 JSON without ASCII escaping (ensure_ascii=False),
+so Korean text is sent as-is over SSE and stored as-is in the DB.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스 → 호출부는 이 하나만 잡으면 됨
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+else:
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize to a JSON string."""
+    return dumps_bytes(obj).decode("utf-8")
@@ -1,24 +1,31 @@
 """LinkedIn Agent service for multi-step post generation with SSE streaming."""
 
 import asyncio
-import json
 import re
 import uuid
 import time
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, AsyncGenerator
 from dataclasses import dataclass, field
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
+from web.database import SessionLocal
 from web.models import Article, LinkedInDraft
-from web.config import ANTHROPIC_API_KEY
-from web.services.linkedin_service import SCENARIOS, MODEL_WRITING
+from web.config import LLM_POOL_SIZE, EVAL_VIA_BATCH
+from web.services.anthropic_client import get_client, get_async_client
+from web.services.eval_batch import notify_batch_submitted
+from web.services.linkedin_service import (
+    SCENARIOS, MODEL_WRITING, DRAFT_PROMPT_RULES, DRAFT_PROMPT_PRINCIPLES, DRAFT_STREAM_ABORT_CHARS,
+)
 from web.services.source_fetcher import fetch as fetch_source_content
 from web.services.web_researcher import research_article
 from web.services.style_brief import StyleBriefBuilder
-from web.services.article_context import build_article_context
+from web.services.article_context import build_article_context, build_article_header
 from web.services.evaluator import LinkedInEvaluator
+from web.services import json_compat
 
 
 # Agent step definitions
@@ -31,6 +38,37 @@ AGENT_STEPS = [
     {"id": 5, "name": "최종 발행", "description": "최종 평가 후 저장합니다"},
 ]
 
+# AGENT_STEPS는 불변 → 세션마다 반복되는 직렬화를 import 시 1회로
+_STEPS_PAYLOAD_JSON = json_compat.dumps_bytes(
+    [{"id": s["id"], "name": s["name"], "description": s["description"]} for s in AGENT_STEPS]
+)
+_STEP_START_EVENTS = [
+    b"event: step_start\ndata: %s\n\n" % json_compat.dumps_bytes({"step": s["id"], "name": s["name"]})
+    for s in AGENT_STEPS
+]
+
+# 프롬프트의 불변 부분 — 요청마다 f-string으로 다시 포맷하지 않고 동적 헤더 뒤에 이어 붙임
+_HOOK_PROMPT_TAIL = """## 훅 작성 원칙
+1. 첫 1-3줄로 스크롤을 멈추게 하는 강력한 오프닝
+2. 구체적 수치/이름/대비를 포함
+3. 각 훅은 서로 다른 접근 (수치, 질문, 선언, 대비, 인용)
+4. "~에 대해 이야기하겠습니다" 같은 약한 오프닝 금지
+5. 이모지 사용 금지
+
+## 출력 형식
+각 훅을 다음 형식으로 출력:
+
+---HOOK 1---
+[훅 텍스트 1-3줄]
+---HOOK 2---
+[훅 텍스트 1-3줄]
+---HOOK 3---
+[훅 텍스트 1-3줄]
+---HOOK 4---
+[훅 텍스트 1-3줄]
+---HOOK 5---
+[훅 텍스트 1-3줄]"""
+
 
 @dataclass
 class AgentSession:
@@ -39,13 +77,15 @@ class AgentSession:
     article_id: int
     scenario: str
     current_step: int = -1
-    status: str = "running"  # running, waiting, completed, error
+    status: str = "running"  # running, waiting, completed, error, abandoned
+    article_header: str = ""  # build_article_header 결과 (run 시작 시 1회 생성, Step 0/1 공용)
     # Step 0: Hook
     hooks: list = field(default_factory=list)
     selected_hook: str = ""
     # Step 1: Research
     source_content: str = ""
     research_context: str = ""
+    article_context: str = ""  # build_article_context 결과 (Step 1에서 1회 생성)
     analysis: str = ""
     # Step 2: Outline
     outline: str = ""
@@ -58,10 +98,15 @@ class AgentSession:
     user_feedback: str = ""
     guidelines_checklist: str = ""
     iteration_count: int = 0
+    sent_draft: str = ""  # Step 4 step_complete로 클라이언트에 이미 보낸 초안
+    eval_batch_id: str = ""  # Step 5 배치 평가 ID (EVAL_VIA_BATCH)
     # Session meta
     created_at: float = field(default_factory=time.time)
-    input_event: asyncio.Event = field(default_factory=asyncio.Event)
+    # 사용자 입력 대기: input_ready / cancel_requested 변경 시 notify_all
+    input_cond: asyncio.Condition = field(default_factory=asyncio.Condition)
     input_data: dict = field(default_factory=dict)
+    input_ready: bool = False
+    cancel_requested: bool = False  # 클라이언트 이탈 / 세션 만료
     guidelines_raw: str = ""
     reference_examples: str = ""
     style_brief: Optional[object] = None  # StyleBrief object
@@ -69,23 +114,215 @@ class AgentSession:
     draft_id: int = 0
     hook: str = ""  # 사전 선택된 훅 (Hook Lab에서)
     additional_instructions: str = ""
+    # 사용자 입력 대기 중 미리 실행하는 작업
+    research_task: Optional[asyncio.Task] = None
+    source_task: Optional[asyncio.Task] = None  # 원문 fetch (Step 1은 상한까지만 대기, Step 3에서 재확인)
+    # Step 5 DB 저장 (agent_complete 이후 완료 → draft_saved 이벤트)
+    save_task: Optional[asyncio.Task] = None
+
+    async def provide_input(self, data: dict):
+        """Store user input and wake the step waiting for it."""
+        async with self.input_cond:
+            self.input_data = data
+            self.input_ready = True
+            self.input_cond.notify_all()
+
+    async def request_cancel(self):
+        """Release a parked input waiter without injecting input."""
+        async with self.input_cond:
+            self.cancel_requested = True
+            self.input_cond.notify_all()
+
+
+# Step 0 출력의 "---HOOK n---" 구분자
+_HOOK_SPLIT_RE = re.compile(r"---HOOK \d+---")
+
+# 동기 SDK를 쓰는 평가기(LinkedInEvaluator)·웹 리서치 전용 풀 — 기본 executor와 분리
+_LLM_POOL = ThreadPoolExecutor(max_workers=LLM_POOL_SIZE, thread_name_prefix="claude")
+
+# DB 쓰기/조회 전용 풀 — commit(fsync) 동안 이벤트 루프(다른 SSE 스트림)가 멈추지 않도록.
+# 한 세션의 DB 작업은 항상 await로 순차 실행되므로 Session을 동시에 공유하지 않음.
+_DB_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="db")
+
+
+def _save_draft(article_id: int, fields: dict) -> int:
+    """Save the final agent draft in its own DB session. Returns the new draft id.
+
+    Runs on _DB_POOL and may outlive the request, so it must not touch the
+    request-scoped Session (closed when the client disconnects).
+    """
+    db = SessionLocal()
+    try:
+        draft = LinkedInDraft(article_id=article_id, version=LinkedInDraft.next_version(article_id), **fields)
+        db.add(draft)
+        db.query(Article).filter(Article.id == article_id).update(
+            {Article.linkedin_status: "generated"}, synchronize_session=False,
+        )
+        db.commit()
+        return draft.id
+    finally:
+        db.close()
+
+
+def _log_save_failure(task: asyncio.Task):
+    """Report a failed draft save — nobody awaits save_task once the stream is gone."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[Agent] 초안 저장 실패: {task.exception()}")
+
+# Step별 출력 토큰 상한 — 4000을 일괄 예약하지 않고 실제 출력 길이에 맞춤.
+# 한국어는 글자당 토큰 수가 많아 본문(1800-2800자)을 쓰는 Step 3/4는 여유를 유지.
+DEFAULT_MAX_TOKENS = 4000
+STEP_MAX_TOKENS = {
+    0: 1200,  # 훅 5개
+    1: 1500,  # 리서치 종합 분석
+    2: 1200,  # 아웃라인
+    3: 4000,  # 초안
+    4: 4000,  # 수정본
+}
+CHECKLIST_MAX_TOKENS = 800
+
+# token 이벤트 묶음 단위 — 이 크기(문자)나 간격(초)을 넘으면 한 번에 전송
+TOKEN_FLUSH_CHARS = 64
+TOKEN_FLUSH_SECONDS = 0.05
+
+# 사용자 입력 대기 시간 (초)
+INPUT_TIMEOUT_SECONDS = 600
+
+# Step 1 분석이 원문 fetch를 기다리는 최대 시간 (초) — 넘으면 원문 없이 분석하고
+# fetch는 계속 진행해 Step 3 초안에서 사용
+SOURCE_WAIT_SECONDS = 10
+
+# Session store limits
+MAX_SESSIONS = 512
+SESSION_MAX_AGE_SECONDS = 3600
+SESSION_SWEEP_INTERVAL_SECONDS = 300
+
+
+class _SessionStore(OrderedDict):
+    """Session dict kept in creation order, bounded to MAX_SESSIONS.
+
+    Sessions are only ever inserted at creation time, so the oldest session
+    is always at the front — the dict doubles as the expiry queue. Expired
+    sessions are dropped lazily on every insert/lookup (amortized O(1)).
+    """
+
+    def __setitem__(self, session_id: str, session: "AgentSession"):
+        self.expire()
+        super().__setitem__(session_id, session)
+        while len(self) > MAX_SESSIONS:
+            self.popitem(last=False)
+
+    def expire(self, max_age_seconds: int = SESSION_MAX_AGE_SECONDS) -> list:
+        """Pop sessions older than max_age_seconds from the front; returns them."""
+        cutoff = time.time() - max_age_seconds
+        removed = []
+        while self:
+            session = next(iter(self.values()))
+            if session.created_at >= cutoff:
+                break
+            removed.append(self.popitem(last=False)[1])
+        return removed
 
 
 # Global session store
-_sessions: dict[str, AgentSession] = {}
+_sessions: _SessionStore = _SessionStore()
 
 
 def get_session(session_id: str) -> Optional[AgentSession]:
     """Get an agent session by ID."""
+    _sessions.expire()
     return _sessions.get(session_id)
 
 
-def cleanup_old_sessions(max_age_seconds: int = 3600):
-    """Remove sessions older than max_age_seconds."""
-    now = time.time()
-    expired = [sid for sid, s in _sessions.items() if now - s.created_at > max_age_seconds]
-    for sid in expired:
-        del _sessions[sid]
+def cleanup_old_sessions(max_age_seconds: int = SESSION_MAX_AGE_SECONDS) -> list:
+    """Remove sessions older than max_age_seconds. Returns the removed sessions."""
+    return _sessions.expire(max_age_seconds)
+
+
+async def session_sweeper(interval_seconds: int = SESSION_SWEEP_INTERVAL_SECONDS):
+    """Background loop that expires old sessions (started from app lifespan)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for session in cleanup_old_sessions():
+            # 아직 입력 대기 중인 만료 세션은 즉시 풀어줌 (600초 타임아웃까지 붙잡지 않도록)
+            if session.status == "waiting":
+                await session.request_cancel()
+
+
+class TokenCoalescer:
+    """Buffer streamed text deltas and release them in larger chunks.
+
+    One SSE frame per ~3-character delta means dozens of frames (and JSON
+    encodes, and browser re-renders) per second; flushing by size/interval
+    cuts that by ~10x with no visible latency.
+    """
+
+    def __init__(self, flush_chars: int = TOKEN_FLUSH_CHARS, flush_seconds: float = TOKEN_FLUSH_SECONDS):
+        self.flush_chars = flush_chars
+        self.flush_seconds = flush_seconds
+        self._buf: list = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str) -> Optional[str]:
+        """Buffer text; return the buffered chunk when it is due for flushing."""
+        self._buf.append(text)
+        self._size += len(text)
+        if self._size >= self.flush_chars or time.monotonic() - self._last_flush >= self.flush_seconds:
+            return self.drain()
+        return None
+
+    def drain(self) -> str:
+        """Return and clear everything buffered so far."""
+        chunk = "".join(self._buf)
+        self._buf.clear()
+        self._size = 0
+        self._last_flush = time.monotonic()
+        return chunk
+
+
+def _format_checklist(items: list) -> str:
+    """Render evaluator items as the guidelines checklist ("[PASS|FAIL] [category] rule — comment")."""
+    lines = []
+    for item in items:
+        mark = "[PASS]" if item.get("pass", True) else "[FAIL]"
+        line = f"{mark} [{item.get('category', '')}] {item.get('rule', '')}"
+        if item.get("comment"):
+            line += f" — {item['comment']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class SessionAbandoned(Exception):
+    """Raised when a session is cancelled (client gone) while waiting for input."""
+
+
+async def wait_for_input(session: AgentSession, timeout: float = INPUT_TIMEOUT_SECONDS) -> bool:
+    """Wait for user input or a cancel request, whichever comes first.
+
+    Returns True if input arrived, False on timeout.
+    Raises SessionAbandoned if the session was cancelled — the remaining
+    steps (and their Claude calls) are skipped instead of running for nobody.
+    """
+    async with session.input_cond:
+        session.input_ready = False
+        try:
+            await asyncio.wait_for(
+                session.input_cond.wait_for(lambda: session.input_ready or session.cancel_requested),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            return False
+
+    if session.cancel_requested:
+        raise SessionAbandoned(session.session_id)
+    return True
+
+
+async def _cancel_on_disconnect(session: AgentSession, disconnect_event: asyncio.Event):
+    """Cancel the session once the SSE client disconnects."""
+    await disconnect_event.wait()
+    await session.request_cancel()
 
 
 class LinkedInAgent:
@@ -93,7 +330,8 @@ class LinkedInAgent:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()  # chat_refine 등 동기 경로용
+        self.async_client = get_async_client()
 
     async def run(
         self,
@@ -101,22 +339,32 @@ class LinkedInAgent:
         scenario: Optional[str] = None,
         hook: Optional[str] = None,
         instructions: Optional[str] = None,
-    ) -> AsyncGenerator[str, None]:
+        disconnect_event: Optional[asyncio.Event] = None,
+    ) -> AsyncGenerator[bytes, None]:
         """
         Run the agent pipeline, yielding SSE events.
 
-        Yields SSE-formatted strings: "event: <type>\ndata: <json>\n\n"
+        Yields SSE-formatted UTF-8 bytes: b"event: <type>\ndata: <json>\n\n"
+        `disconnect_event` is set by the caller when the SSE client goes away.
         """
-        # Load article
-        article = self.db.query(Article).filter(Article.id == article_id).first()
+        # Load article (identity map hit — the endpoint already loaded it on this Session)
+        article = self.db.get(Article, article_id)
         if not article:
             yield self._sse("agent_error", {"message": "Article not found"})
             return
 
+        loop = asyncio.get_running_loop()
+        # 원문 fetch는 시나리오와 무관 → 시나리오 감지(Haiku)와 동시에 시작
+        source_task = asyncio.create_task(self._fetch_source(article.url))
         if scenario is None:
+            # 동기 Haiku 호출 → 이벤트 루프를 막지 않도록 LLM 풀에서 (워커는 값만 반환)
             from web.services.linkedin_service import LinkedInService
             service = LinkedInService(self.db)
-            scenario = service.detect_scenario(article)
+            detected = await loop.run_in_executor(_LLM_POOL, service._detect_scenario_result, article)
+            scenario = detected["scenario"]
+            # L2 캐시 컬럼은 루프 스레드에서 쓰고 바로 저장 — run()은 요청 Session에 다른 쓰기가 없음
+            service._write_back_scenario(article)
+            service._commit_cache_writes()
 
         # Create session
         session_id = str(uuid.uuid4())[:8]
@@ -126,24 +374,35 @@ class LinkedInAgent:
             scenario=scenario,
             hook=hook or "",
             additional_instructions=instructions or "",
+            source_task=source_task,
         )
+        session.article_header = build_article_header(article)
         _sessions[session_id] = session
 
         # Send session info
-        yield self._sse("session_created", {
-            "session_id": session_id,
-            "steps": [{"id": s["id"], "name": s["name"], "description": s["description"]} for s in AGENT_STEPS],
-        })
+        yield self._sse_prebuilt(
+            "session_created",
+            b'{"session_id":%s,"steps":%s}' % (json_compat.dumps_bytes(session_id), _STEPS_PAYLOAD_JSON),
+        )
 
-        # StyleBrief 빌드 (guidelines + StyleProfile + references)
-        builder = StyleBriefBuilder(self.db)
-        session.style_brief = builder.build(scenario)
-        session.guidelines_raw = session.style_brief.guidelines_raw
-        session.reference_examples = session.style_brief.reference_examples
+        scenario_info = SCENARIOS.get(scenario, SCENARIOS["A"])
 
-        scenario_info = session.style_brief.scenario_info
+        # Step 1 리서치(원문 fetch + 웹 리서치 + 분석)는 StyleBrief·훅 선택과 무관
+        # → 세션 시작 즉시 실행해 StyleBrief 빌드, 훅 생성, 사용자 선택 대기와 겹치게 함
+        session.research_task = asyncio.create_task(
+            self._run_research(session, article, scenario_info)
+        )
+        disconnect_watch = None
+        if disconnect_event is not None:
+            disconnect_watch = asyncio.create_task(_cancel_on_disconnect(session, disconnect_event))
 
         try:
+            # StyleBrief 빌드 (guidelines + StyleProfile + references)
+            builder = StyleBriefBuilder(self.db)
+            session.style_brief = await loop.run_in_executor(_DB_POOL, builder.build_cached, scenario)
+            session.guidelines_raw = session.style_brief.guidelines_raw
+            session.reference_examples = session.style_brief.reference_examples
+
             # Step 0: Hook 생성 (사용자 선택 대기)
             async for event in self._step_hooks(session, article, scenario_info):
                 yield event
@@ -169,22 +428,41 @@ class LinkedInAgent:
                 yield event
 
             session.status = "completed"
-            yield self._sse("agent_complete", {
+            # 최종 본문은 DB 저장을 기다리지 않고 먼저 전송 — draft_id는 draft_saved 이벤트로
+            complete_data = {
                 "session_id": session_id,
-                "draft_id": session.draft_id,
-                "final_draft": session.improved_draft or session.draft,
-            })
+                "draft_id": None,
+            }
+            # 사용자 피드백으로 바뀐 경우에만 본문 재전송 (아니면 클라이언트가 Step 4 본문 재사용)
+            final_draft = session.improved_draft or session.draft
+            if final_draft != session.sent_draft:
+                complete_data["final_draft"] = final_draft
+            yield self._sse("agent_complete", complete_data)
+
+            draft_id = await session.save_task
+            yield self._sse("draft_saved", {"session_id": session_id, "draft_id": draft_id})
+
+        except SessionAbandoned:
+            # 클라이언트가 떠남 → 이벤트를 보낼 곳이 없으므로 조용히 종료
+            session.status = "abandoned"
 
         except Exception as e:
             session.status = "error"
             yield self._sse("agent_error", {"message": str(e), "session_id": session_id})
 
+        finally:
+            for task in (session.research_task, session.source_task):
+                if task and not task.done():
+                    task.cancel()
+            if disconnect_watch is not None:
+                disconnect_watch.cancel()
+
     # ── Step 0: Hook 생성 ──────────────────────────────────────────────
 
-    async def _step_hooks(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[str, None]:
+    async def _step_hooks(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[bytes, None]:
         """Step 0: Generate 5 hooks and wait for user selection."""
         session.current_step = 0
-        yield self._sse("step_start", {"step": 0, "name": "Hook 생성"})
+        yield _STEP_START_EVENTS[0]
 
         # Fast path: Hook Lab에서 사전 선택된 훅이 있으면 skip
         if session.hook:
@@ -211,47 +489,22 @@ class LinkedInAgent:
 
         prompt = f"""다음 기사에 대한 LinkedIn 포스트 훅(오프닝) 5개를 생성해주세요.
 
-## 기사 정보
-- 제목: {article.title}
-- 출처: {article.source}
-- 요약: {article.ai_summary or article.summary or '없음'}
-- URL: {article.url}
+{session.article_header}
 
 ## 시나리오: {session.scenario} - {scenario_info['name']}
 - 훅 스타일: {scenario_info['hook_style']}
 
 {hook_style_section}
 {instructions_section}
-## 훅 작성 원칙
-1. 첫 1-3줄로 스크롤을 멈추게 하는 강력한 오프닝
-2. 구체적 수치/이름/대비를 포함
-3. 각 훅은 서로 다른 접근 (수치, 질문, 선언, 대비, 인용)
-4. "~에 대해 이야기하겠습니다" 같은 약한 오프닝 금지
-5. 이모지 사용 금지
-
-## 출력 형식
-각 훅을 다음 형식으로 출력:
+""" + _HOOK_PROMPT_TAIL
 
----HOOK 1---
-[훅 텍스트 1-3줄]
----HOOK 2---
-[훅 텍스트 1-3줄]
----HOOK 3---
-[훅 텍스트 1-3줄]
----HOOK 4---
-[훅 텍스트 1-3줄]
----HOOK 5---
-[훅 텍스트 1-3줄]"""
-
-        result = await self._call_claude(prompt, session)
+        chunks: list = []
+        async for event in self._stream_step(prompt, 0, chunks):
+            yield event
+        result = "".join(chunks)
 
         # Parse hooks
-        hooks = []
-        hook_parts = re.split(r'---HOOK \d+---', result)
-        for part in hook_parts:
-            part = part.strip()
-            if part:
-                hooks.append(part)
+        hooks = [part for part in map(str.strip, _HOOK_SPLIT_RE.split(result)) if part]
 
         # fallback: 파싱 실패 시 전체를 하나의 훅으로
         if not hooks:
@@ -259,9 +512,10 @@ class LinkedInAgent:
 
         session.hooks = hooks
 
+        # 본문은 token 이벤트로 이미 전송됨 → 메타데이터만
         yield self._sse("step_complete", {
             "step": 0,
-            "content": result,
+            "length": len(result),
         })
 
         # Wait for user to select a hook
@@ -273,9 +527,7 @@ class LinkedInAgent:
             "hooks": hooks,
         })
 
-        try:
-            session.input_event.clear()
-            await asyncio.wait_for(session.input_event.wait(), timeout=600)
+        if await wait_for_input(session):
             hook_index = session.input_data.get("hook_index", 0)
             if isinstance(hook_index, int) and 0 <= hook_index < len(hooks):
                 session.selected_hook = hooks[hook_index]
@@ -283,33 +535,50 @@ class LinkedInAgent:
                 session.selected_hook = hooks[0]
             session.status = "running"
             yield self._sse("input_received", {"step": 0, "selected_hook": session.selected_hook})
-        except asyncio.TimeoutError:
+        else:
             session.selected_hook = hooks[0] if hooks else ""
             session.status = "running"
             yield self._sse("input_timeout", {"step": 0, "default": 0})
 
     # ── Step 1: 소스 보강 리서치 ──────────────────────────────────────
 
-    async def _step_research(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[str, None]:
+    async def _step_research(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[bytes, None]:
         """Step 1: Fetch source content + web research + synthesis."""
         session.current_step = 1
-        yield self._sse("step_start", {"step": 1, "name": "소스 보강 리서치"})
+        yield _STEP_START_EVENTS[1]
 
+        # run()에서 미리 시작한 리서치 결과 대기
+        if session.research_task is None:
+            session.research_task = asyncio.create_task(
+                self._run_research(session, article, scenario_info)
+            )
+        article_context = await session.research_task
+
+        yield self._sse("step_complete", {
+            "step": 1,
+            "content": session.analysis,
+            "reference_data": {"article_context": article_context},
+        })
+
+    async def _run_research(self, session: AgentSession, article: Article, scenario_info: dict) -> str:
+        """Source fetch + web research + Claude analysis. Returns the article context used."""
         # Fetch source content and run research in parallel
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        if session.source_task is None:
+            session.source_task = asyncio.create_task(self._fetch_source(article.url))
 
-        async def fetch_source():
+        async def wait_source():
+            # shield: 상한을 넘겨도 fetch는 취소하지 않음 (Step 3에서 다시 확인)
             try:
-                return await loop.run_in_executor(
-                    None, lambda: fetch_source_content(article.url) or ""
-                )
-            except Exception:
+                return await asyncio.wait_for(asyncio.shield(session.source_task), SOURCE_WAIT_SECONDS)
+            except asyncio.TimeoutError:
+                print(f"[Agent] 원문 fetch {SOURCE_WAIT_SECONDS}초 초과 — 원문 없이 분석 진행")
                 return ""
 
         async def run_research():
             try:
                 return await loop.run_in_executor(
-                    None, lambda: research_article(
+                    _LLM_POOL, lambda: research_article(
                         title=article.title,
                         summary=article.ai_summary or article.summary or "",
                     ) or ""
@@ -318,7 +587,7 @@ class LinkedInAgent:
                 return ""
 
         source_content, research_result = await asyncio.gather(
-            fetch_source(), run_research()
+            wait_source(), run_research()
         )
 
         session.source_content = source_content
@@ -334,16 +603,17 @@ class LinkedInAgent:
 위 지시 사항을 분석에 반영하세요.
 """
 
-        article_context = build_article_context(
+        session.article_context = build_article_context(
             article,
             source_content=session.source_content,
             research_context=session.research_context,
+            header=session.article_header,
         )
 
         # Claude로 종합 분석
         prompt = f"""다음 기사와 리서치 결과를 종합 분석해주세요.
 
-{article_context}
+{session.article_context}
 {instructions_section}
 ## 분석 항목
 1. **핵심 팩트/수치**: 기사의 주요 사실과 구체적 숫자 3-5개
@@ -355,21 +625,24 @@ class LinkedInAgent:
 
 간결하고 구조화된 형태로 분석해주세요."""
 
-        analysis = await self._call_claude(prompt, session)
-        session.analysis = analysis
+        session.analysis = await self._call_claude(prompt, session, STEP_MAX_TOKENS[1])
+        return session.article_context
 
-        yield self._sse("step_complete", {
-            "step": 1,
-            "content": analysis,
-            "reference_data": {"article_context": article_context},
-        })
+    @staticmethod
+    async def _fetch_source(url: str) -> str:
+        """Fetch the article source text off the event loop ("" on failure)."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, lambda: fetch_source_content(url) or "")
+        except Exception:
+            return ""
 
     # ── Step 2: 글 흐름 구성 ──────────────────────────────────────────
 
-    async def _step_outline(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[str, None]:
+    async def _step_outline(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[bytes, None]:
         """Step 2: Design post outline and wait for user feedback."""
         session.current_step = 2
-        yield self._sse("step_start", {"step": 2, "name": "글 흐름 구성"})
+        yield _STEP_START_EVENTS[2]
 
         # StyleBrief 아웃라인 프롬프트
         outline_style = session.style_brief.to_outline_prompt_section() if session.style_brief else ""
@@ -415,12 +688,15 @@ class LinkedInAgent:
 
 7. **원문 링크**: {article.url}"""
 
-        outline = await self._call_claude(prompt, session)
+        chunks: list = []
+        async for event in self._stream_step(prompt, 2, chunks):
+            yield event
+        outline = "".join(chunks)
         session.outline = outline
 
         yield self._sse("step_complete", {
             "step": 2,
-            "content": outline,
+            "length": len(outline),
         })
 
         # Wait for user feedback on outline
@@ -431,9 +707,7 @@ class LinkedInAgent:
             "type": "outline_feedback",
         })
 
-        try:
-            session.input_event.clear()
-            await asyncio.wait_for(session.input_event.wait(), timeout=600)
+        if await wait_for_input(session):
             outline_feedback = session.input_data.get("feedback", "")
             session.status = "running"
             yield self._sse("input_received", {"step": 2, "feedback": outline_feedback})
@@ -452,19 +726,30 @@ class LinkedInAgent:
 - 사용자 피드백만 반영하고 나머지는 유지
 - 같은 출력 형식으로 수정된 아웃라인을 출력"""
 
-                revised_outline = await self._call_claude(revise_prompt, session)
+                revised_outline = await self._call_claude(revise_prompt, session, STEP_MAX_TOKENS[2])
                 session.outline = revised_outline
-
-        except asyncio.TimeoutError:
+        else:
             session.status = "running"
             yield self._sse("input_timeout", {"step": 2})
 
     # ── Step 3: 초안 작성 ──────────────────────────────────────────────
 
-    async def _step_draft(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[str, None]:
+    async def _step_draft(self, session: AgentSession, article: Article, scenario_info: dict) -> AsyncGenerator[bytes, None]:
         """Step 3: Write the draft using hook + research + outline + StyleBrief."""
         session.current_step = 3
-        yield self._sse("step_start", {"step": 3, "name": "초안 작성"})
+        yield _STEP_START_EVENTS[3]
+
+        # Step 1이 원문 없이 진행됐고 그 사이 fetch가 끝났으면 초안 컨텍스트에 반영 (대기 없음)
+        source_task = session.source_task
+        if not session.source_content and source_task and source_task.done() and not source_task.cancelled():
+            session.source_content = source_task.result()
+            if session.source_content:
+                session.article_context = build_article_context(
+                    article,
+                    source_content=session.source_content,
+                    research_context=session.research_context,
+                    header=session.article_header,
+                )
 
         # StyleBrief에서 통합 스타일 가이드 생성
         brief = session.style_brief
@@ -479,7 +764,8 @@ class LinkedInAgent:
 
 """
 
-        prompt = f"""다음 정보를 바탕으로 LinkedIn 포스트 초안을 작성해주세요.
+        prompt = (
+            f"""다음 정보를 바탕으로 LinkedIn 포스트 초안을 작성해주세요.
 
 ## 사용할 훅 (반드시 이 훅으로 시작)
 {session.selected_hook}
@@ -499,96 +785,47 @@ class LinkedInAgent:
 - 본문 구조: {scenario_info['structure']}
 - 마무리: {scenario_info['closing']}
 
-{build_article_context(article, source_content=session.source_content, research_context=session.research_context)}
+{session.article_context}
 {instructions_section}
-## LinkedIn 포맷팅 규칙
-- 줄바꿈으로 단락을 명확히 구분하세요
-- 짧은 문장과 긴 문장을 섞어 자연스러운 리듬감을 만드세요 (단문만 반복하면 AI스러워집니다)
-- 도치문("~뭘까요.", "~보입니다.")은 글 전체에서 1-2회만 허용합니다. 남발하면 부자연스럽습니다
-- 넘버링(1, 2, 3)을 활용하여 가독성을 높이세요
-- 구분선(ㅡ)을 활용하여 시각적으로 정리하세요
-
-## 길이 제약 (매우 중요)
-반드시 1800자 이상 2800자 이하로 작성하세요.
-이상적 길이는 2200-2600자입니다. 이 범위를 벗어나면 조절하세요.
+"""
+            + DRAFT_PROMPT_RULES + article.url + DRAFT_PROMPT_PRINCIPLES
+        )
 
-## 출력 형식
-- 제목/헤더 없이 본문만 출력하세요. 첫 줄이 곧 훅입니다.
-- 설명이나 주석 없이 바로 사용 가능한 형태로 작성하세요.
-- 마지막에 원문 링크 한 줄: {article.url}
-
-## 작성 원칙
-
-### 1. 원문 소재 충실 활용 (최우선 원칙)
-원문 콘텐츠를 깊이 읽고 구체적 수치, 직접 인용구, 고유 사례, 대비 소재를 반드시 추출하여 포스트 전반에 녹이세요.
-표면적 요약을 반복하지 말고, 원문의 '살아있는 디테일'을 활용하세요.
-원문에 없는 내용을 만들어내지 마세요 — 팩트 기반으로 작성하세요.
-
-### 2. 테제(Thesis) 주도
-한 문장으로 포스트 전체를 관통하는 핵심 주장 선언.
-좋은 예: "에이전트 시대에 살아남는 소프트웨어의 조건이 3가지로 수렴했습니다"
-나쁜 예: "최근 AI 업계에서 여러 움직임이 있었습니다" (테제 없음)
-
-### 3. 문화적 훅
-업계 격언/유명 문구를 비틀어 인지적 마찰 생성.
-예: "Make something people want" → "Make something agents want"
-
-### 4. 점진적 논증
-각 포인트가 이전 포인트 위에 쌓여야 함 (병렬 나열 금지).
-예: 문서(쉬움) → harness(어려움) → 도메인(불가능)
-
-### 5. 구체적 대비
-승자 vs 패자를 이름/숫자로 보여주기.
-예: "Supabase vs SendGrid", "2시간→3분"
-
-### 6. 종합 마무리
-전체 논증을 한 문장으로 응축.
-예: "코드에서 문서로, 문서에서 harness로, harness에서 도메인으로."
-
-## 다음과 같이 작성하지 마세요 (anti-pattern)
-1. 너무 일반적인 서론 ("오늘은 ~에 대해...")
-2. "~에 대해 이야기하겠습니다"
-3. "결론적으로~"
-4. "요약하면~"
-5. 표면적 정보 나열 — 원문 요약 반복은 포스팅이 아님
-6. 병렬 구조만 사용 — "첫째, 둘째, 셋째" 나열은 기계적
-7. 테제 없는 나열 — 뉴스 요약이지 포스팅이 아님"""
-
-        draft = await self._call_claude(prompt, session)
+        chunks: list = []
+        async for event in self._stream_step(prompt, 3, chunks, max_chars=DRAFT_STREAM_ABORT_CHARS):
+            yield event
+        draft = "".join(chunks)
         session.draft = draft
 
         yield self._sse("step_complete", {
             "step": 3,
-            "content": draft,
+            "length": len(draft),
             "reference_data": {"reference_examples": brief.reference_examples},
         })
 
     # ── Step 4: 검토 & 개선 ──────────────────────────────────────────
 
-    async def _step_review(self, session: AgentSession) -> AsyncGenerator[str, None]:
+    async def _step_review(self, session: AgentSession) -> AsyncGenerator[bytes, None]:
         """Step 4: Auto evaluate-fix loop (max 3x) + user feedback."""
         session.current_step = 4
-        yield self._sse("step_start", {"step": 4, "name": "검토 & 개선"})
+        yield _STEP_START_EVENTS[4]
 
         brief = session.style_brief
         guidelines_text = brief.to_reviewer_prompt_section() if brief else "기본 LinkedIn 포스팅 규칙"
 
         current_draft = session.draft
         max_iterations = 3
+        checklist_items: list = []
 
         # Phase A: 자동 평가-수정 루프
         for i in range(max_iterations):
             session.iteration_count = i + 1
 
             # 1. 평가
-            eval_result = await self._evaluate_draft_async(current_draft, session, mode="full")
+            eval_result, eval_data = await self._evaluate_draft_async(current_draft, session, mode="full")
 
-            try:
-                eval_data = json.loads(eval_result)
-                overall_score = eval_data.get("overall_score", 100)
-                fail_items = [item for item in eval_data.get("items", []) if not item.get("pass", True)]
-            except (json.JSONDecodeError, KeyError):
-                # 평가 파싱 실패 → 루프 종료
+            if "error" in eval_data:
+                # 평가 파싱/호출 실패 → 루프 종료
                 session.evaluation = eval_result
                 yield self._sse("step_content", {
                     "step": 4,
@@ -599,23 +836,28 @@ class LinkedInAgent:
                 })
                 break
 
+            overall_score = eval_data.get("overall_score", 100)
+            # 항목 목록은 한 번만 꺼내 체크리스트와 FAIL 집계에 공용 (기본값은 할당 없는 빈 튜플)
+            checklist_items = eval_data.get("items", ())
+            fail_items = [item for item in checklist_items if not item.get("pass", True)]
+            fail_count = len(fail_items)
             session.evaluation = eval_result
 
             yield self._sse("step_content", {
                 "step": 4,
                 "iteration": i + 1,
                 "score": overall_score,
-                "fail_count": len(fail_items),
-                "message": f"점수 {overall_score}, FAIL {len(fail_items)}개",
+                "fail_count": fail_count,
+                "message": f"점수 {overall_score}, FAIL {fail_count}개",
             })
 
             # 2. 통과 조건: score >= 70 and FAIL < 3
-            if overall_score >= 70 and len(fail_items) < 3:
+            if overall_score >= 70 and fail_count < 3:
                 yield self._sse("step_content", {
                     "step": 4,
                     "iteration": i + 1,
                     "score": overall_score,
-                    "fail_count": len(fail_items),
+                    "fail_count": fail_count,
                     "message": "통과",
                     "passed": True,
                 })
@@ -639,12 +881,17 @@ class LinkedInAgent:
 - LinkedIn 포스트 본문만 출력하세요
 - 설명 없이 바로 사용 가능한 형태"""
 
-            current_draft = await self._call_claude(fix_prompt, session)
+            current_draft = await self._call_claude(fix_prompt, session, STEP_MAX_TOKENS[4])
 
         session.improved_draft = current_draft
 
-        # 가이드라인 체크리스트 (Step 4에서 내부 생성)
-        checklist_prompt = f"""다음 지침서에서 이번 포스팅에 적용된 규칙을 체크리스트로 정리해주세요.
+        # 가이드라인 체크리스트: 평가 루프의 항목별 결과를 그대로 사용 (별도 Claude 호출 없음).
+        # 평가 파싱에 실패한 경우에만 Claude로 생성 — 사용자 피드백 대기와 동시에 실행
+        checklist_task = None
+        if checklist_items:
+            session.guidelines_checklist = _format_checklist(checklist_items)
+        else:
+            checklist_prompt = f"""다음 지침서에서 이번 포스팅에 적용된 규칙을 체크리스트로 정리해주세요.
 
 ## 지침서
 {guidelines_text}
@@ -654,15 +901,19 @@ class LinkedInAgent:
 
 적용된 규칙을 간략히 정리:"""
 
-        session.guidelines_checklist = await self._call_claude(checklist_prompt, session)
+            checklist_task = asyncio.create_task(
+                self._call_claude(checklist_prompt, session, CHECKLIST_MAX_TOKENS)
+            )
 
         # Phase B: 사용자 피드백
+        # 평가 JSON은 Step 5에서 최종본 기준으로 보내므로 여기서는 본문 + 메타만
         session.status = "waiting"
+        session.sent_draft = current_draft
         yield self._sse("step_complete", {
             "step": 4,
             "content": current_draft,
-            "evaluation": session.evaluation,
             "iterations": session.iteration_count,
+            "length": len(current_draft),
         })
 
         yield self._sse("waiting_for_input", {
@@ -671,9 +922,7 @@ class LinkedInAgent:
             "type": "draft_feedback",
         })
 
-        try:
-            session.input_event.clear()
-            await asyncio.wait_for(session.input_event.wait(), timeout=600)
+        if await wait_for_input(session):
             session.user_feedback = session.input_data.get("feedback", "")
             session.status = "running"
             yield self._sse("input_received", {"step": 4, "feedback": session.user_feedback})
@@ -693,101 +942,157 @@ class LinkedInAgent:
 - LinkedIn 포스트 본문만 출력하세요
 - 설명 없이 바로 사용 가능한 형태"""
 
-                session.improved_draft = await self._call_claude(feedback_prompt, session)
+                session.improved_draft = await self._call_claude(feedback_prompt, session, STEP_MAX_TOKENS[4])
                 session.review_notes = f"사용자 피드백 반영 완료: {session.user_feedback[:100]}"
-
-        except asyncio.TimeoutError:
+        else:
             session.user_feedback = ""
             session.status = "running"
             yield self._sse("input_timeout", {"step": 4})
 
-    async def _evaluate_draft_async(self, content: str, session: AgentSession, mode: str = "full") -> str:
-        """Run evaluation via LinkedInEvaluator in executor thread."""
+        if checklist_task is not None:
+            session.guidelines_checklist = await checklist_task
+
+    async def _evaluate_draft_async(
+        self, content: str, session: AgentSession, mode: str = "full",
+    ) -> tuple[str, dict]:
+        """Run evaluation via LinkedInEvaluator in executor thread. Returns (json_str, parsed)."""
         evaluator = LinkedInEvaluator(self.db, session.style_brief)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, lambda: evaluator.evaluate(content, mode=mode)
+            _LLM_POOL, lambda: evaluator.evaluate_with_data(content, mode=mode)
         )
 
     # ── Step 5: 최종 발행 ──────────────────────────────────────────────
 
-    async def _step_finalize(self, session: AgentSession, article: Article) -> AsyncGenerator[str, None]:
+    async def _step_finalize(self, session: AgentSession, article: Article) -> AsyncGenerator[bytes, None]:
         """Step 5: Final evaluation + save to DB."""
         session.current_step = 5
-        yield self._sse("step_start", {"step": 5, "name": "최종 발행"})
+        yield _STEP_START_EVENTS[5]
 
-        # 최종 평가 1회
+        # 최종 평가 1회 — EVAL_VIA_BATCH면 배치로 제출하고 결과는 백그라운드에서 저장
+        # (그동안 초안에는 Step 4의 마지막 평가가 예비로 남음)
         final_draft = session.improved_draft or session.draft
-        session.evaluation = await self._evaluate_draft_async(final_draft, session, mode="full")
+        if EVAL_VIA_BATCH:
+            session.eval_batch_id = await self._submit_batch_evaluation(final_draft, session)
+        if not session.eval_batch_id:
+            session.evaluation, _ = await self._evaluate_draft_async(final_draft, session, mode="full")
 
-        # Save to database
-        draft_record = self._save_draft(session, article)
-        session.draft_id = draft_record.id
+        # Save to database — 백그라운드로 시작하고 run()이 agent_complete 이후에 결과를 기다림
+        # (스트림이 먼저 끊겨도 태스크는 세션이 참조하고 자체 DB 세션을 쓰므로 끝까지 저장됨)
+        session.save_task = asyncio.create_task(self._save_draft_async(session, article.id))
+        session.save_task.add_done_callback(_log_save_failure)
 
-        yield self._sse("step_complete", {"step": 5, "content": session.evaluation})
+        yield self._sse("step_complete", {
+            "step": 5,
+            "content": session.evaluation,
+            "eval_pending": bool(session.eval_batch_id),
+        })
 
-    # ── Claude 호출 ──────────────────────────────────────────────────
+    async def _save_draft_async(self, session: AgentSession, article_id: int) -> int:
+        """Run _save_draft on the DB pool and record the new draft id on the session."""
+        # 세션 필드는 이벤트 루프 스레드에서 스냅샷 — 워커는 평범한 값만 받음
+        final_content = session.improved_draft or session.draft
+        fields = {
+            "scenario": session.scenario,
+            "draft_content": final_content,
+            "generation_mode": "agent",
+            "analysis": session.analysis,
+            "direction": session.selected_hook,
+            "review_notes": session.review_notes,
+            "evaluation": session.evaluation,
+            "user_feedback": session.user_feedback,
+            "iteration_count": session.iteration_count,
+            "guidelines_checklist": session.guidelines_checklist,
+            "eval_batch_id": session.eval_batch_id or None,
+            "status": "final",
+        }
+        loop = asyncio.get_running_loop()
+        draft_id = await loop.run_in_executor(_DB_POOL, _save_draft, article_id, fields)
+        session.draft_id = draft_id
 
-    async def _call_claude(self, prompt: str, session: AgentSession) -> str:
-        """Call Claude API (always Opus)."""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self._call_claude_sync(prompt)
-        )
-        return result
+        if session.eval_batch_id:
+            notify_batch_submitted()
+        return draft_id
 
-    def _call_claude_sync(self, prompt: str) -> str:
-        """Synchronous Claude API call (always MODEL_WRITING/Opus)."""
-        response = self.client.messages.create(
+    async def _submit_batch_evaluation(self, content: str, session: AgentSession) -> str:
+        """Submit the final evaluation as a Message Batch. Returns "" on failure (→ sync fallback)."""
+        evaluator = LinkedInEvaluator(self.db, session.style_brief)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                _LLM_POOL, evaluator.submit_batch_evaluation, content, f"agent-{session.session_id}",
+            )
+        except Exception as e:
+            print(f"[Agent] 배치 평가 제출 실패, 동기 평가로 진행: {e}")
+            return ""
+
+    # ── Claude 호출 ──────────────────────────────────────────────────
+
+    async def _call_claude(
+        self, prompt: str, session: AgentSession, max_tokens: int = DEFAULT_MAX_TOKENS,
+    ) -> str:
+        """Call Claude API (always Opus) natively on the event loop."""
+        response = await self.async_client.messages.create(
             model=MODEL_WRITING,
-            max_tokens=4000,
+            max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
         )
         return response.content[0].text
 
-    def _save_draft(self, session: AgentSession, article: Article) -> LinkedInDraft:
-        """Save the final draft to database."""
-        existing_count = (
-            self.db.query(LinkedInDraft)
-            .filter(LinkedInDraft.article_id == article.id)
-            .count()
-        )
+    async def _stream_step(
+        self, prompt: str, step: int, chunks: list, max_chars: Optional[int] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream a step's Claude output as coalesced 'token' events; deltas are appended to `chunks`.
 
-        final_content = session.improved_draft or session.draft
+        Stops the stream early once the output exceeds `max_chars` (runaway generation).
+        """
+        coalescer = TokenCoalescer()
+        char_count = 0
+        deltas = self._stream_claude(prompt, STEP_MAX_TOKENS[step])
+        try:
+            async for delta in deltas:
+                chunks.append(delta)
+                char_count += len(delta)
+                flushed = coalescer.add(delta)
+                if flushed:
+                    yield self._sse("token", {"step": step, "delta": flushed})
+                if max_chars and char_count > max_chars:
+                    print(f"[Agent] Step {step} 출력 길이 초과로 스트림 중단: {char_count}자")
+                    break
+        finally:
+            await deltas.aclose()  # 스트림(연결)을 즉시 닫아 생성 중단
+        rest = coalescer.drain()
+        if rest:
+            yield self._sse("token", {"step": step, "delta": rest})
+
+    async def _stream_claude(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> AsyncGenerator[str, None]:
+        """Stream Claude output (always Opus), yielding text deltas as they arrive."""
+        async with self.async_client.messages.stream(
+            model=MODEL_WRITING,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
 
-        draft = LinkedInDraft(
-            article_id=article.id,
-            scenario=session.scenario,
-            draft_content=final_content,
-            version=existing_count + 1,
-            generation_mode="agent",
-            analysis=session.analysis,
-            direction=session.selected_hook,
-            review_notes=session.review_notes,
-            evaluation=session.evaluation,
-            user_feedback=session.user_feedback,
-            iteration_count=session.iteration_count,
-            guidelines_checklist=session.guidelines_checklist,
-            status="final",
+    def _call_claude_sync(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
+        """Synchronous Claude API call (always MODEL_WRITING/Opus)."""
+        response = self.client.messages.create(
+            model=MODEL_WRITING,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
         )
-        self.db.add(draft)
-        article.linkedin_status = "generated"
-        self.db.commit()
-        self.db.refresh(draft)
-        return draft
+        return response.content[0].text
 
     def chat_refine(self, session: AgentSession, user_message: str) -> dict:
         """Refine draft via chat message. Returns updated draft and chat history."""
-        import time as _time
-
         current_draft = session.improved_draft or session.draft
 
         # Build chat context
-        chat_context = ""
-        for msg in session.chat_messages:
-            role_label = "사용자" if msg["role"] == "user" else "어시스턴트"
-            chat_context += f"\n[{role_label}]: {msg['content']}\n"
+        chat_context = "".join(
+            f"\n[{'사용자' if msg['role'] == 'user' else '어시스턴트'}]: {msg['content']}\n"
+            for msg in session.chat_messages
+        )
 
         # 시나리오/참고예시 컨텍스트
         brief = session.style_brief
@@ -837,15 +1142,16 @@ class LinkedInAgent:
 
         # Update session
         session.improved_draft = revised
-        timestamp = _time.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.utcnow().isoformat(timespec="seconds")  # user/assistant 메시지 공용
         session.chat_messages.append({"role": "user", "content": user_message, "timestamp": timestamp})
         session.chat_messages.append({"role": "assistant", "content": f"수정 완료 ({len(revised)}자)", "timestamp": timestamp})
 
         # Update DB
-        draft_record = self.db.query(LinkedInDraft).filter(LinkedInDraft.id == session.draft_id).first()
+        # draft_id는 초안 저장(save_task) 완료 전이면 None
+        draft_record = self.db.get(LinkedInDraft, session.draft_id) if session.draft_id else None
         if draft_record:
             draft_record.draft_content = revised
-            draft_record.chat_history = json.dumps(session.chat_messages, ensure_ascii=False)
+            draft_record.add_chat_turn(user_message, session.chat_messages[-1]["content"], timestamp)
             self.db.commit()
 
         return {
@@ -855,6 +1161,11 @@ class LinkedInAgent:
             "validation_warnings": warnings,
         }
 
-    def _sse(self, event: str, data: dict) -> str:
-        """Format an SSE event string."""
-        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    def _sse(self, event: str, data: dict) -> bytes:
+        """Format an SSE event (UTF-8 bytes, written to the response as-is)."""
+        return b"event: %s\ndata: %s\n\n" % (event.encode(), json_compat.dumps_bytes(data))
+
+    @staticmethod
+    def _sse_prebuilt(event: str, data_json: bytes) -> bytes:
+        """Format an SSE event from an already-serialized JSON payload."""
+        return b"event: %s\ndata: %s\n\n" % (event.encode(), data_json)
@@ -1,31 +1,107 @@
 """LinkedIn service with Jake's guidelines for post generation."""
 
-import json
+import asyncio
 import re
-import sys
-from pathlib import Path
+import threading
 from datetime import datetime
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
-from web.models import Article, LinkedInDraft
-from web.config import ANTHROPIC_API_KEY
+from web.config import DRAFT_MAX_CONCURRENCY, EVAL_VIA_BATCH
+from web.database import SessionLocal
+from web.models import Article, DraftBatch, LinkedInDraft
+from web.services import json_compat
+from web.services.anthropic_client import (
+    cached_system, get_async_client, get_client,
+)
 from web.services.source_fetcher import fetch as fetch_source_content
 from web.services.web_researcher import research_article
-from web.services.style_brief import StyleBriefBuilder
-from web.services.article_context import build_article_context
-from web.services.evaluator import LinkedInEvaluator
+from web.services.style_brief import StyleBrief, StyleBriefBuilder, invalidate_brief_cache
+from web.services.ttl_cache import TTLCache
+from web.services.article_context import article_header_key, build_article_context
+from web.services.eval_batch import notify_batch_submitted
+from web.services.evaluator import DRAFT_SELF_CHECKLIST, LinkedInEvaluator, autofix, build_fix_prompt
 
 # Writing-critical steps use Opus for quality; classification/evaluation use Haiku/Sonnet
 MODEL_WRITING = "claude-opus-4-20250514"
 MODEL_SUPPORT = "claude-sonnet-4-20250514"
 MODEL_CLASSIFY = "claude-haiku-4-5-20251001"
 
+# 생성 입력 L1 캐시 (article_id 키) — 크기·수명 제한, 스레드 안전 (executor에서 접근)
+# L2는 Article.scenario_json / Article.research_text 컬럼
+_SCENARIO_CACHE = TTLCache(maxsize=1024, ttl=86400)  # -> {scenario, confidence, reason, alternatives}
+_RESEARCH_CACHE = TTLCache(maxsize=512, ttl=86400)   # -> research_text
+# 조립된 기사 컨텍스트 (훅 → 초안 흐름에서 같은 입력으로 두 번 조립하지 않도록)
+# 키: (article_header_key, source_content, research_context) — 원문·리서치는 각자의 캐시에서 같은 str 객체로
+# 나오므로 해시/비교 비용이 작음. 기사 메타데이터(점수·요약)가 바뀌면 키가 달라져 즉시 반영
+_CONTEXT_CACHE = TTLCache(maxsize=256, ttl=600)
+# Claude 감지 실패 시의 키워드 폴백 결과는 짧게만 보관 (일시적 429/529로 하루 동안 품질 저하 방지)
+_SCENARIO_FALLBACK_CACHE = TTLCache(maxsize=256, ttl=300)
+# 같은 기사를 동시에 감지하는 요청은 하나만 Claude 호출 (나머지는 대기 후 L1 재사용)
+# article_id % N 스트라이프 락 — 기사별 락 dict처럼 커지지 않음
+_SCENARIO_LOCKS = tuple(threading.Lock() for _ in range(32))
+
+# Simple 모드 백그라운드 평가-수정 루프 횟수 (생성 시 자체 검증 후 안전망 1회)
+SIMPLE_FIX_ITERATIONS = 1
+
+# 시나리오 감지 호출의 SDK 재시도 횟수 (429/529/5xx·연결 오류에 지수 백오프 + jitter, retry-after 준수)
+SCENARIO_DETECT_MAX_RETRIES = 3
+# 시나리오 감지 프롬프트에 넣을 요약 최대 길이
+SCENARIO_DETECT_SUMMARY_CHARS = 400
+# 여러 기사 생성 시 Claude 시나리오 감지 한 번에 묶을 기사 수
+SCENARIO_BATCH_SIZE = 10
+
+# 키워드 기반 시나리오 감지 (Claude 실패 시 fallback) — 우선순위 순서 (먼저 걸리는 시나리오 선택)
+_SCENARIO_KEYWORDS = {
+    "B": ("출시", "release", "launch", "announced", "공개"),
+    "A": ("연구", "paper", "research", "study", "논문"),
+    "E": ("결정", "decision", "선택", "chose", "pivot"),
+    "D": ("트렌드", "trend", "시장", "market", "signal"),
+    "C": ("경험", "experience", "learned", "배운"),
+    "F": ("권위자", "expert", "통념", "학습", "fomo", "배워야", "역설", "misconception", "myth", "contrary"),
+}
+_SCENARIO_KEYWORD_PRIORITY = tuple(_SCENARIO_KEYWORDS)
+_SCENARIO_KEYWORD_RANK = {scenario: i for i, scenario in enumerate(_SCENARIO_KEYWORD_PRIORITY)}
+# 시나리오별 named group 교대 하나로 합쳐 본문을 한 번만 스캔 (match.lastgroup = 시나리오)
+# 전방탐색(?=...)으로 감싸 겹치는 키워드도 모두 잡음 (예: "출시장" → 출시 + 시장).
+# 다른 키워드의 접두어인 키워드가 없으므로 위치당 한 키워드 = 단일 패스 다중 패턴 매칭
+_SCENARIO_KEYWORD_RE = re.compile("(?=" + "|".join(
+    f"(?P<{scenario}>{'|'.join(map(re.escape, keywords))})"
+    for scenario, keywords in _SCENARIO_KEYWORDS.items()
+) + ")")
+# 한 시나리오에서 서로 다른 키워드가 이만큼 이상 (단독 1위로) 잡히면 Claude 감지 생략
+KEYWORD_CONFIDENT_MIN_HITS = 2
+KEYWORD_CONFIDENCE = 0.75
+# 키워드 미검출 시 카테고리 기반 기본값
+_CATEGORY_SCENARIO = {
+    "bigtech": "B",
+    "research": "A",
+    "vc": "D",
+    "viral": "D",
+    "news": "A",
+}
+
+# 다이제스트 일괄 생성(Message Batches) 결과 폴링 간격 (초)
+DRAFT_BATCH_POLL_SECONDS = 10
+# 폴링 중 일시적 API 오류(연결·429·5xx) 시 재시도 간격 상한 — 배치는 최대 24시간 걸리므로 포기하지 않음
+DRAFT_BATCH_RETRY_MAX_SECONDS = 600
+
+# 스트리밍 초안이 최대 길이(2800자)의 1.2배를 넘으면 생성 중단 — 폭주 생성 비용 차단
+# (잘린 초안은 평가-수정 루프가 길이 규칙에 맞춰 다시 다듬음)
+DRAFT_STREAM_ABORT_CHARS = int(2800 * 1.2)
+
+# 초안 생성 호출의 SDK 재시도 횟수 (429/529는 retry-after를 따르며 지수 백오프)
+DRAFT_MAX_RETRIES = 4
+# 일괄 생성 시 동시 Opus 스트림 상한 — gather가 한꺼번에 열어 rate limit에 걸리지 않도록
+_DRAFT_SLOTS = asyncio.Semaphore(DRAFT_MAX_CONCURRENCY)
+
+# 초안 저장 후 백그라운드로 도는 평가-수정 태스크 (참조 유지 — GC로 취소되지 않도록)
+_EVAL_TASKS: set = set()
+
+# 진행 중인 초안 배치 수집 태스크 (GC 방지용 참조)
+_BATCH_TASKS: set = set()
+
 
 # Jake's LinkedIn Post Scenarios
 SCENARIOS = {
@@ -73,18 +149,146 @@ SCENARIOS = {
     },
 }
 
+# 시나리오 감지 프롬프트용 목록 (키: 이름 한 줄씩 — 설명은 글 구조용이라 감지에는 불필요)
+_SCENARIO_CATALOG = "\n".join(f"- {key}: {val['name']}" for key, val in SCENARIOS.items())
+
+
+# 프롬프트의 불변 부분 — 요청마다 f-string으로 다시 포맷하지 않고 동적 헤더 뒤에 이어 붙임
+# (_HOOK_PROMPT_RULES는 {count}만 채우는 템플릿, 초안 규칙/작성 원칙은 Agent 모드와 공용)
+_HOOK_PROMPT_RULES = """## 훅 작성 규칙
+- 각 훅은 1-3줄 (최대 210자 이내 — LinkedIn '더보기' 접힘점 기준)
+- {count}개의 훅은 각각 다른 접근법/스타일이어야 함
+- 금지: 이모지, "여러분", "혁명", "패러다임 시프트" 등 과장 표현
+- 문체: 하십시오체 기본, 자연스러운 톤
+- 훅만 작성 (본문 전개 X)
+
+## 훅 스타일 분류
+각 훅에 다음 중 하나의 스타일을 태깅하세요:
+- 숫자형: 충격적 수치/통계로 시작
+- 질문형: 독자의 호기심을 자극하는 질문
+- 역설: 통념을 뒤집는 반전 제시
+- 선언: 강한 의견이나 행동 선언
+- 스토리: 개인 경험/관찰로 시작
+
+## 출력 형식
+emit_hooks 도구로 훅 {count}개를 반환하세요 (reasoning: 왜 이 훅이 효과적인지 한 문장)."""
+
+_HOOK_STYLES = ["숫자형", "질문형", "역설", "선언", "스토리"]
+
+# 훅 생성은 도구 호출 강제(tool_choice)로 받음 — 응답이 스키마대로 파싱된 dict라 괄호 탐색·JSON 파싱 불필요
+_HOOKS_TOOL = {
+    "name": "emit_hooks",
+    "description": "생성한 LinkedIn 훅 후보 목록을 반환합니다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "hooks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "hook": {"type": "string"},
+                        "style": {"type": "string", "enum": _HOOK_STYLES},
+                        "reasoning": {"type": "string"},
+                    },
+                    "required": ["hook", "style", "reasoning"],
+                },
+            },
+        },
+        "required": ["hooks"],
+    },
+}
+
+DRAFT_PROMPT_RULES = """## LinkedIn 포맷팅 규칙
+- 줄바꿈으로 단락을 명확히 구분하세요
+- 짧은 문장과 긴 문장을 섞어 자연스러운 리듬감을 만드세요 (단문만 반복하면 AI스러워집니다)
+- 도치문("~뭘까요.", "~보입니다.")은 글 전체에서 1-2회만 허용합니다. 남발하면 부자연스럽습니다
+- 넘버링(1, 2, 3)을 활용하여 가독성을 높이세요
+- 구분선(ㅡ)을 활용하여 시각적으로 정리하세요
+
+## 길이 제약 (매우 중요)
+반드시 1800자 이상 2800자 이하로 작성하세요.
+이상적 길이는 2200-2600자입니다. 이 범위를 벗어나면 조절하세요.
+
+## 출력 형식
+- 제목/헤더 없이 본문만 출력하세요. 첫 줄이 곧 훅입니다.
+- 설명이나 주석 없이 바로 사용 가능한 형태로 작성하세요.
+- 마지막에 원문 링크 한 줄: """
+
+DRAFT_PROMPT_PRINCIPLES = """
+
+## 작성 원칙
+
+### 1. 원문 소재 충실 활용 (최우선 원칙)
+원문 콘텐츠를 깊이 읽고 구체적 수치, 직접 인용구, 고유 사례, 대비 소재를 반드시 추출하여 포스트 전반에 녹이세요.
+표면적 요약을 반복하지 말고, 원문의 '살아있는 디테일'을 활용하세요.
+원문에 없는 내용을 만들어내지 마세요 — 팩트 기반으로 작성하세요.
+
+### 2. 테제(Thesis) 주도
+한 문장으로 포스트 전체를 관통하는 핵심 주장 선언.
+좋은 예: "에이전트 시대에 살아남는 소프트웨어의 조건이 3가지로 수렴했습니다"
+나쁜 예: "최근 AI 업계에서 여러 움직임이 있었습니다" (테제 없음)
+
+### 3. 문화적 훅
+업계 격언/유명 문구를 비틀어 인지적 마찰 생성.
+예: "Make something people want" → "Make something agents want"
+
+### 4. 점진적 논증
+각 포인트가 이전 포인트 위에 쌓여야 함 (병렬 나열 금지).
+예: 문서(쉬움) → harness(어려움) → 도메인(불가능)
+
+### 5. 구체적 대비
+승자 vs 패자를 이름/숫자로 보여주기.
+예: "Supabase vs SendGrid", "2시간→3분"
+
+### 6. 종합 마무리
+전체 논증을 한 문장으로 응축.
+예: "코드에서 문서로, 문서에서 harness로, harness에서 도메인으로."
+
+## 다음과 같이 작성하지 마세요 (anti-pattern)
+1. 너무 일반적인 서론 ("오늘은 ~에 대해...")
+2. "~에 대해 이야기하겠습니다"
+3. "결론적으로~"
+4. "요약하면~"
+5. 표면적 정보 나열 — 원문 요약 반복은 포스팅이 아님
+6. 병렬 구조만 사용 — "첫째, 둘째, 셋째" 나열은 기계적
+7. 테제 없는 나열 — 뉴스 요약이지 포스팅이 아님"""
+
+
+def _render_scenario_section(scenario: str, scenario_info: dict) -> str:
+    """Draft-prompt scenario section (ends with a blank line before the article section)."""
+    return f"""## 시나리오 {scenario}: {scenario_info['name']}
+- 설명: {scenario_info['description']}
+- 훅 스타일: {scenario_info['hook_style']}
+- 본문 구조: {scenario_info['structure']}
+- 마무리: {scenario_info['closing']}
+
+"""
+
+
+# 초안 프롬프트 = (system, user). system은 시나리오·스타일별로 불변이라 prompt caching 대상
+# (같은 시나리오의 연속 생성·재생성·일괄 생성이 캐시된 prefix를 재사용), user는 기사별 내용.
+# 정적 부분은 import 시 한 번 만들어 두고 _build_prompt는 동적 슬롯만 채워 join
+DraftPrompt = tuple[str, str]
+
+_DRAFT_SYSTEM_HEAD = "당신은 LinkedIn 포스팅 전문가입니다. 사용자가 전달하는 기사를 바탕으로 LinkedIn 포스트를 작성합니다.\n\n"
+_DRAFT_SCENARIO_SECTIONS = {key: _render_scenario_section(key, info) for key, info in SCENARIOS.items()}
+_DRAFT_SYSTEM_TAIL = DRAFT_PROMPT_RULES + "기사 정보와 함께 주어진 원문 URL" + DRAFT_PROMPT_PRINCIPLES + DRAFT_SELF_CHECKLIST + "\n"
+_DRAFT_USER_TAIL = "위 기사로 LinkedIn 포스트를 작성해주세요.\n원문 URL: "
+
+
+def _draft_message_params(prompt: DraftPrompt) -> dict:
+    """messages.create/stream kwargs for a draft prompt: cached system block + per-article user turn."""
+    system, user = prompt
+    return {"system": cached_system(system), "messages": [{"role": "user", "content": user}]}
+
 
 class LinkedInService:
     """Service for generating LinkedIn posts using Jake's guidelines."""
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
-
-    # 시나리오 감지 결과 캐시 (article_id -> {scenario, confidence, reason})
-    _scenario_cache: dict = {}
-    # 리서치 결과 캐시 (article_id -> research_text)
-    _research_cache: dict = {}
+        self.client = get_client()
 
     def detect_scenario(self, article: Article) -> str:
         """Detect the best scenario for an article (returns scenario letter only)."""
@@ -97,78 +301,245 @@ class LinkedInService:
         Returns:
             dict: {scenario: str, confidence: float, reason: str}
         """
-        # 캐시 확인
-        if article.id in self._scenario_cache:
-            return self._scenario_cache[article.id]
+        result = self._detect_scenario_result(article)
+        self._write_back_scenario(article)
+        return result
+
+    def _detect_scenario_result(self, article: Article) -> dict:
+        """detect_scenario_detailed() without the L2 column write — safe in executor threads.
+
+        Only reads already-loaded `article` attributes; callers run
+        _write_back_scenario() on the Session's thread afterwards.
+        """
+        cached = self._cached_scenario(article.id)
+        if cached is not None:
+            return cached
+        with _SCENARIO_LOCKS[article.id % len(_SCENARIO_LOCKS)]:
+            # 락 대기 중 다른 요청이 감지를 끝냈으면 그 결과 사용
+            cached = self._cached_scenario(article.id)
+            if cached is not None:
+                return cached
+            return self._detect_scenario_uncached(article)
+
+    @staticmethod
+    def _cached_scenario(article_id: int) -> Optional[dict]:
+        """L1 (or short-lived keyword fallback) scenario result, if any."""
+        cached = _SCENARIO_CACHE.get(article_id)
+        if cached is None:
+            cached = _SCENARIO_FALLBACK_CACHE.get(article_id)
+        return cached
+
+    def _detect_scenario_uncached(self, article: Article) -> dict:
+        """L2 column → keyword short-circuit → Claude → keyword fallback; fills the caches."""
+        result = self._detect_scenario_local(article)
+        if result is not None:
+            return result
 
         # Claude API 기반 분석 시도
         try:
             result = self._detect_scenario_with_claude(article)
-            self._scenario_cache[article.id] = result
+            self._store_scenario(article, result)
             return result
-        except Exception:
-            # API 실패 시 키워드 기반 폴백
+        except Exception as e:
+            # 재시도 소진 후에만 키워드 기반 폴백 — 짧게 캐시하고 L2에는 저장하지 않음
+            print(f"[LinkedIn] 시나리오 감지 실패, 키워드 폴백: {e}")
             scenario = self._detect_scenario_keyword(article)
             result = {"scenario": scenario, "confidence": 0.5, "reason": "키워드 기반 자동 감지 (AI 분석 실패)"}
-            self._scenario_cache[article.id] = result
+            _SCENARIO_FALLBACK_CACHE[article.id] = result
             return result
 
+    @staticmethod
+    def _store_scenario(article: Article, result: dict):
+        """Write a detection result to L1 (the L2 column follows in _write_back_scenario())."""
+        _SCENARIO_CACHE[article.id] = result
+
+    @staticmethod
+    def _write_back_scenario(article: Article):
+        """Copy the L1 scenario result to Article.scenario_json (L2).
+
+        Session 스레드에서만 호출 — 속성만 설정하고 commit은 호출자의 트랜잭션(초안 저장 등)에 맡김.
+        키워드 폴백 결과는 L1(_SCENARIO_CACHE)에 없으므로 저장되지 않음
+        """
+        result = _SCENARIO_CACHE.get(article.id)
+        if result is not None and not article.scenario_json:
+            article.scenario_json = json_compat.dumps(result)
+
+    def _detect_scenario_local(self, article: Article) -> Optional[dict]:
+        """Scenario without a Claude call — L2 column or a confident keyword match — else None."""
+        if article.scenario_json:
+            try:
+                result = json_compat.loads(article.scenario_json)
+                _SCENARIO_CACHE[article.id] = result
+                return result
+            except json_compat.JSONDecodeError:
+                pass
+
+        # 키워드 신호가 강하면 Claude 호출 생략 (모호한 기사만 Claude로)
+        scenario, score = self._score_keyword(article)
+        if score >= KEYWORD_CONFIDENT_MIN_HITS:
+            result = {
+                "scenario": scenario,
+                "confidence": KEYWORD_CONFIDENCE,
+                "reason": f"키워드 기반 자동 감지 (시나리오 {scenario} 키워드 {score}개 일치)",
+                "alternatives": [],
+            }
+            self._store_scenario(article, result)
+            return result
+        return None
+
+    def detect_scenarios_batch(self, articles: List[Article], batch_size: int = SCENARIO_BATCH_SIZE) -> dict[int, str]:
+        """Detect scenarios for several articles, packing Claude-bound ones into shared prompts.
+
+        Cached / keyword-confident articles skip Claude as in detect_scenario();
+        the rest go `batch_size` per call. Articles missing from a batch reply
+        (or a failed call) fall back to the per-article path. Like
+        _detect_scenario_result(), this leaves the L2 column to the caller.
+
+        Returns:
+            {article_id: scenario}
+        """
+        scenarios = {}
+        pending = []
+        for article in articles:
+            result = self._cached_scenario(article.id)
+            if result is None:
+                result = self._detect_scenario_local(article)
+            if result is None:
+                pending.append(article)
+            else:
+                scenarios[article.id] = result["scenario"]
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            try:
+                detected = self._detect_scenarios_with_claude(chunk)
+            except Exception as e:
+                print(f"[LinkedIn] 시나리오 일괄 감지 실패, 기사별 감지로 전환: {e}")
+                detected = {}
+            for article in chunk:
+                result = detected.get(article.id)
+                if result is None:
+                    scenarios[article.id] = self._detect_scenario_result(article)["scenario"]
+                else:
+                    self._store_scenario(article, result)
+                    scenarios[article.id] = result["scenario"]
+        return scenarios
+
     def _detect_scenario_with_claude(self, article: Article) -> dict:
-        """Use Claude API to analyze article and detect best scenario (top-2)."""
-        scenarios_desc = "\n".join(
-            f"- {key}: {val['name']} - {val['description']}"
-            for key, val in SCENARIOS.items()
-        )
+        """Use Claude API to analyze article and detect best scenario (top-2).
 
+        The reply is prefilled with "{" and stopped at the closing "}}" of the
+        nested `alternative` object, so decoding ends with the JSON.
+        """
+        summary = (article.ai_summary or article.summary or "없음")[:SCENARIO_DETECT_SUMMARY_CHARS]
         prompt = f"""다음 기사에 가장 적합한 LinkedIn 포스팅 시나리오(A-F)를 분석해주세요.
-1순위와 2순위 시나리오를 각각 confidence와 함께 반환하세요.
+1순위와 2순위 시나리오를 각각 confidence와 한 문장 이유와 함께 반환하세요.
 
 ## 기사
 - 제목: {article.title}
 - 출처: {article.source or '알 수 없음'}
-- 요약: {article.ai_summary or article.summary or '없음'}
+- 요약: {summary}
 
 ## 시나리오 목록
-{scenarios_desc}
+{_SCENARIO_CATALOG}
 
 ## 출력 형식 (JSON만 출력)
-{{"scenario": "A", "confidence": 0.85, "reason": "1순위 시나리오 적합 이유", "alternative": {{"scenario": "D", "confidence": 0.6, "reason": "2순위 시나리오 적합 이유"}}}}"""
+{{"scenario": "A", "confidence": 0.85, "reason": "1순위 적합 이유", "alternative": {{"scenario": "D", "confidence": 0.6, "reason": "2순위 적합 이유"}}}}"""
 
-        response = self.client.messages.create(
+        response = self.client.with_options(max_retries=SCENARIO_DETECT_MAX_RETRIES).messages.create(
             model=MODEL_CLASSIFY,
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}],
+            max_tokens=200,
+            messages=[
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": "{"},
+            ],
+            stop_sequences=["}}"],
         )
 
-        raw = response.content[0].text
-        json_start = raw.find("{")
-        json_end = raw.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            data = json.loads(raw[json_start:json_end])
-            scenario = data.get("scenario", "A")
-            if scenario not in SCENARIOS:
-                scenario = "A"
-
-            # 대안 시나리오 파싱
-            alternatives = []
-            alt_data = data.get("alternative")
-            if alt_data and isinstance(alt_data, dict):
-                alt_scenario = alt_data.get("scenario", "")
-                if alt_scenario in SCENARIOS and alt_scenario != scenario:
-                    alternatives.append({
-                        "scenario": alt_scenario,
-                        "confidence": float(alt_data.get("confidence", 0.5)),
-                        "reason": alt_data.get("reason", ""),
-                    })
-
-            return {
-                "scenario": scenario,
-                "confidence": float(data.get("confidence", 0.8)),
-                "reason": data.get("reason", ""),
-                "alternatives": alternatives,
-            }
+        raw = "{" + response.content[0].text
+        if response.stop_reason == "stop_sequence":
+            raw += "}}"
+        try:
+            data = json_compat.loads(raw)
+        except json_compat.JSONDecodeError:
+            raise ValueError("Failed to parse Claude response")
+        if not isinstance(data, dict):
+            raise ValueError("Failed to parse Claude response")
+        return self._parse_scenario_result(data)
+
+    def _detect_scenarios_with_claude(self, articles: List[Article]) -> dict[int, dict]:
+        """One Claude call detecting scenarios (top-2) for several articles. Returns {article_id: result}."""
+        listing = "\n\n".join(
+            f"""### id {article.id}
+- 제목: {article.title}
+- 출처: {article.source or '알 수 없음'}
+- 요약: {(article.ai_summary or article.summary or '없음')[:SCENARIO_DETECT_SUMMARY_CHARS]}"""
+            for article in articles
+        )
+        prompt = f"""다음 기사 {len(articles)}개 각각에 가장 적합한 LinkedIn 포스팅 시나리오(A-F)를 분석해주세요.
+기사마다 1순위와 2순위 시나리오를 각각 confidence와 한 문장 이유와 함께 반환하세요.
+
+## 기사
+{listing}
+
+## 시나리오 목록
+{_SCENARIO_CATALOG}
+
+## 출력 형식 (JSON 배열만 출력, 기사마다 하나씩)
+[{{"id": 1, "scenario": "A", "confidence": 0.85, "reason": "1순위 적합 이유", "alternative": {{"scenario": "D", "confidence": 0.6, "reason": "2순위 적합 이유"}}}}]"""
 
-        raise ValueError("Failed to parse Claude response")
+        response = self.client.with_options(max_retries=SCENARIO_DETECT_MAX_RETRIES).messages.create(
+            model=MODEL_CLASSIFY,
+            max_tokens=200 * len(articles),
+            messages=[
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": "["},
+            ],
+        )
+
+        try:
+            data = json_compat.loads("[" + response.content[0].text)
+        except json_compat.JSONDecodeError:
+            raise ValueError("Failed to parse Claude response")
+
+        wanted = {article.id for article in articles}
+        results = {}
+        for item in data if isinstance(data, list) else ():
+            if not isinstance(item, dict):
+                continue
+            try:
+                article_id = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if article_id in wanted:
+                results[article_id] = self._parse_scenario_result(item)
+        return results
+
+    @staticmethod
+    def _parse_scenario_result(data: dict) -> dict:
+        """Normalize a Claude scenario reply into {scenario, confidence, reason, alternatives}."""
+        scenario = data.get("scenario", "A")
+        if scenario not in SCENARIOS:
+            scenario = "A"
+
+        # 대안 시나리오 파싱
+        alternatives = []
+        alt_data = data.get("alternative")
+        if alt_data and isinstance(alt_data, dict):
+            alt_scenario = alt_data.get("scenario", "")
+            if alt_scenario in SCENARIOS and alt_scenario != scenario:
+                alternatives.append({
+                    "scenario": alt_scenario,
+                    "confidence": float(alt_data.get("confidence", 0.5)),
+                    "reason": alt_data.get("reason", ""),
+                })
+
+        return {
+            "scenario": scenario,
+            "confidence": float(data.get("confidence", 0.8)),
+            "reason": data.get("reason", ""),
+            "alternatives": alternatives,
+        }
 
     def detect_scenario_with_alternatives(self, article: Article) -> dict:
         """Detect the best scenario with alternatives for low-confidence cases.
@@ -180,6 +551,7 @@ class LinkedInService:
             }
         """
         result = self.detect_scenario_detailed(article)
+        self._commit_cache_writes()  # 시나리오 조회 API는 다른 쓰기가 없으므로 L2 캐시만 저장
         return {
             "primary": {
                 "scenario": result["scenario"],
@@ -189,56 +561,78 @@ class LinkedInService:
             "alternatives": result.get("alternatives", []),
         }
 
-    def _detect_scenario_keyword(self, article: Article) -> str:
-        """Keyword-based scenario detection (fallback)."""
+    def _keyword_hits(self, article: Article) -> dict[str, set[str]]:
+        """Distinct scenario keywords found in the title/summary, per scenario."""
         title = article.title.lower()
         summary = (article.ai_summary or article.summary or "").lower()
-        content = f"{title} {summary}"
-
-        if any(kw in content for kw in ["출시", "release", "launch", "announced", "공개"]):
-            return "B"
-        if any(kw in content for kw in ["연구", "paper", "research", "study", "논문"]):
-            return "A"
-        if any(kw in content for kw in ["결정", "decision", "선택", "chose", "pivot"]):
-            return "E"
-        if any(kw in content for kw in ["트렌드", "trend", "시장", "market", "signal"]):
-            return "D"
-        if any(kw in content for kw in ["경험", "experience", "learned", "배운"]):
-            return "C"
-        if any(kw in content for kw in ["권위자", "expert", "통념", "학습", "fomo", "배워야", "역설", "misconception", "myth", "contrary"]):
-            return "F"
-
-        category_map = {
-            "bigtech": "B",
-            "research": "A",
-            "vc": "D",
-            "viral": "D",
-            "news": "A",
-        }
-        return category_map.get(article.category, "A")
 
-    def _research_topic(self, article: Article) -> str:
+        # 제목·요약을 각각 한 번씩 스캔 (키워드에 공백이 없으므로 두 문자열을 이어 붙일 필요 없음)
+        hits: dict[str, set[str]] = {}
+        for text in (title, summary):
+            for m in _SCENARIO_KEYWORD_RE.finditer(text):
+                hits.setdefault(m.lastgroup, set()).add(m.group(m.lastgroup))
+        return hits
+
+    def _score_keyword(self, article: Article) -> tuple[Optional[str], int]:
+        """Return (top scenario, distinct keyword count); count is 0 when tied or no match."""
+        hits = self._keyword_hits(article)
+        ranked = sorted(hits, key=lambda s: (-len(hits[s]), _SCENARIO_KEYWORD_RANK[s]))
+        if not ranked:
+            return None, 0
+        top = ranked[0]
+        score = len(hits[top])
+        if len(ranked) > 1 and len(hits[ranked[1]]) == score:
+            return top, 0  # 동점 → 모호
+        return top, score
+
+    def _detect_scenario_keyword(self, article: Article) -> str:
+        """Keyword-based scenario detection (fallback)."""
+        # 등장한 시나리오 중 우선순위가 가장 높은 것
+        hits = self._keyword_hits(article)
+        for scenario in _SCENARIO_KEYWORD_PRIORITY:
+            if scenario in hits:
+                return scenario
+
+        return _CATEGORY_SCENARIO.get(article.category, "A")
+
+    async def _gather_research(self, article: Article) -> str:
+        """Research context for `article`: the L2 column, else _research_topic() in an executor thread.
+
+        The column is read here on the Session's thread; the worker only gets plain values.
+        """
+        if article.research_text:
+            return article.research_text
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._research_topic, article.id, article.title, article.ai_summary or article.summary or "",
+        )
+
+    @staticmethod
+    def _research_topic(article_id: int, title: str, summary: str) -> str:
         """Research the article topic using Google Custom Search.
 
         Returns research context string, or empty string if unavailable.
         Results are cached per article_id.
         """
-        if article.id in self._research_cache:
-            return self._research_cache[article.id]
+        cached = _RESEARCH_CACHE.get(article_id)
+        if cached is not None:
+            return cached
 
         try:
-            result = research_article(
-                title=article.title,
-                summary=article.ai_summary or article.summary or "",
-            )
-            research_text = result or ""
+            research_text = research_article(title=title, summary=summary) or ""
         except Exception:
             research_text = ""
 
-        self._research_cache[article.id] = research_text
+        _RESEARCH_CACHE[article_id] = research_text
         return research_text
 
-    def generate_hooks(
+    def _write_back_inputs(self, article: Article, research_text: str):
+        """Set the scenario/research L2 columns from worker results (Session thread; commit is the caller's)."""
+        self._write_back_scenario(article)
+        # 빈 결과는 일시적 실패일 수 있으므로 L2에는 남기지 않음
+        if research_text and not article.research_text:
+            article.research_text = research_text
+
+    async def generate_hooks(
         self,
         article: Article,
         scenario: Optional[str] = None,
@@ -256,24 +650,10 @@ class LinkedInService:
         Returns:
             list[dict] — 각 {hook: str, style: str, reasoning: str}
         """
-        if scenario is None:
-            scenario = self.detect_scenario(article)
-
-        # StyleBrief 빌드 (guidelines + StyleProfile + references)
-        builder = StyleBriefBuilder(self.db)
-        brief = builder.build(scenario)
-
+        scenario, brief, source_content, research_context = await self._prepare_generation(article, scenario)
         scenario_info = brief.scenario_info
 
-        # Fetch source content for deeper hooks
-        source_content = self._fetch_source_content(article.url)
-
-        # Run research
-        research_context = self._research_topic(article)
-
-        article_context = build_article_context(
-            article, source_content=source_content, research_context=research_context,
-        )
+        article_context = self._article_context(article, source_content, research_context)
 
         # Hook prompt section from brief
         hook_guidelines = ""
@@ -281,8 +661,6 @@ class LinkedInService:
         if hook_section_text:
             hook_guidelines = f"\n{hook_section_text}"
 
-        persona = brief.persona
-
         # 추가 지시 섹션
         instructions_section = ""
         if instructions and instructions.strip():
@@ -293,71 +671,41 @@ class LinkedInService:
 
         prompt = f"""당신은 LinkedIn 포스팅 전문가입니다. 다음 기사에 대해 LinkedIn 포스트의 훅(첫 1-3줄)을 {count}개 생성해주세요.
 
-## 페르소나
-{persona}
-
 ## 시나리오 {scenario}: {scenario_info['name']}
 - 훅 스타일: {scenario_info['hook_style']}
 - 설명: {scenario_info['description']}
 
 {article_context}
 {hook_guidelines}{instructions_section}
-## 훅 작성 규칙
-- 각 훅은 1-3줄 (최대 210자 이내 — LinkedIn '더보기' 접힘점 기준)
-- {count}개의 훅은 각각 다른 접근법/스타일이어야 함
-- 금지: 이모지, "여러분", "혁명", "패러다임 시프트" 등 과장 표현
-- 문체: 하십시오체 기본, 자연스러운 톤
-- 훅만 작성 (본문 전개 X)
-
-## 훅 스타일 분류
-각 훅에 다음 중 하나의 스타일을 태깅하세요:
-- 숫자형: 충격적 수치/통계로 시작
-- 질문형: 독자의 호기심을 자극하는 질문
-- 역설: 통념을 뒤집는 반전 제시
-- 선언: 강한 의견이나 행동 선언
-- 스토리: 개인 경험/관찰로 시작
-
-## 출력 형식 (JSON 배열만 출력)
-```json
-[
-  {{"hook": "훅 텍스트", "style": "숫자형", "reasoning": "왜 이 훅이 효과적인지 한 문장"}},
-  ...
-]
-```
+""" + _HOOK_PROMPT_RULES.format(count=count)
 
-JSON만 출력하세요. 다른 설명은 불필요합니다."""
-
-        response = self.client.messages.create(
+        response = await get_async_client().messages.create(
             model=MODEL_SUPPORT,
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}],
+            tools=[_HOOKS_TOOL],
+            tool_choice={"type": "tool", "name": _HOOKS_TOOL["name"]},
         )
-
-        raw = response.content[0].text
-
-        # JSON 배열 파싱
-        try:
-            json_start = raw.find("[")
-            json_end = raw.rfind("]") + 1
-            if json_start >= 0 and json_end > json_start:
-                hooks = json.loads(raw[json_start:json_end])
-                # 필수 필드 검증
-                validated = []
-                for h in hooks:
-                    if isinstance(h, dict) and "hook" in h:
-                        validated.append({
-                            "hook": h["hook"],
-                            "style": h.get("style", "기타"),
-                            "reasoning": h.get("reasoning", ""),
-                        })
-                return validated[:count]
-        except (json.JSONDecodeError, ValueError):
-            pass
-
-        # 파싱 실패 시 빈 리스트 반환
-        return []
-
-    def generate_draft(
+        self._commit_cache_writes()  # 훅 경로는 다른 쓰기가 없으므로 캐시만 저장
+
+        tool_input = next((block.input for block in response.content if block.type == "tool_use"), None)
+        hooks = tool_input.get("hooks") if isinstance(tool_input, dict) else None
+        if not isinstance(hooks, list):
+            # 도구 호출이 없으면 빈 리스트 반환
+            return []
+
+        # 필수 필드 검증 (스키마 강제는 best-effort)
+        validated = []
+        for h in hooks:
+            if isinstance(h, dict) and "hook" in h:
+                validated.append({
+                    "hook": h["hook"],
+                    "style": h.get("style", "기타"),
+                    "reasoning": h.get("reasoning", ""),
+                })
+        return validated[:count]
+
+    async def generate_draft(
         self,
         article: Article,
         scenario: Optional[str] = None,
@@ -376,76 +724,118 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
         Returns:
             LinkedInDraft record
         """
-        if scenario is None:
-            scenario = self.detect_scenario(article)
+        scenario, brief, prompt = await self._prepare_draft_prompt(article, scenario, hook, instructions)
 
-        # StyleBrief 빌드 (guidelines + StyleProfile + references)
-        builder = StyleBriefBuilder(self.db)
-        brief = builder.build(scenario)
+        # Generate with Claude (Opus for writing quality)
+        draft_content = await self._stream_draft_text(prompt)
 
-        scenario_info = brief.scenario_info
+        draft, _ = await self._finish_draft(article, scenario, brief, draft_content, prompt)
+        return draft
 
-        # Fetch source content for deep reading
-        source_content = self._fetch_source_content(article.url)
+    async def generate_draft_stream(
+        self,
+        article: Article,
+        scenario: Optional[str] = None,
+        hook: Optional[str] = None,
+        instructions: Optional[str] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Same as generate_draft(), streamed as SSE bytes.
 
-        # Run research
-        research_context = self._research_topic(article)
+        Events: status {message} → token {delta}... → draft_complete
+        {draft, detected_scenario} → evaluated {draft}, or error {message}.
+        The draft is saved before evaluation; `evaluated` carries the evaluated
+        (possibly fixed) version.
+        """
+        from web.services.linkedin_agent import TokenCoalescer
 
-        # Build the prompt
+        try:
+            yield self._sse("status", {"message": "원문·리서치 준비 중"})
+            scenario, brief, prompt = await self._prepare_draft_prompt(article, scenario, hook, instructions)
+
+            yield self._sse("status", {"message": "초안 작성 중"})
+            chunks: list = []
+            char_count = 0
+            coalescer = TokenCoalescer()
+            async with get_async_client().with_options(max_retries=DRAFT_MAX_RETRIES).messages.stream(
+                model=MODEL_WRITING,
+                max_tokens=4000,
+                **_draft_message_params(prompt),
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    char_count += len(text)
+                    flushed = coalescer.add(text)
+                    if flushed:
+                        yield self._sse("token", {"delta": flushed, "chars": char_count})
+                    if char_count > DRAFT_STREAM_ABORT_CHARS:
+                        # async with 종료 시 스트림(연결)이 닫혀 생성도 중단됨
+                        print(f"[LinkedIn] 초안 길이 초과로 스트림 중단: {char_count}자")
+                        break
+            rest = coalescer.drain()
+            if rest:
+                yield self._sse("token", {"delta": rest, "chars": char_count})
+
+            draft, eval_task = await self._finish_draft(article, scenario, brief, "".join(chunks), prompt)
+            yield self._sse("draft_complete", {"draft": draft.to_dict(), "detected_scenario": scenario})
+
+            # 평가는 백그라운드 태스크 — 클라이언트가 끊겨도 shield로 계속 진행
+            yield self._sse("status", {"message": "평가 및 수정 중"})
+            await asyncio.shield(eval_task)
+            self.db.refresh(draft)
+            yield self._sse("evaluated", {"draft": draft.to_dict()})
+        except Exception as e:
+            yield self._sse("error", {"message": str(e)})
+
+    async def _prepare_draft_prompt(
+        self, article: Article, scenario: Optional[str], hook: Optional[str], instructions: Optional[str],
+    ) -> tuple[str, StyleBrief, DraftPrompt]:
+        """Gather inputs and build the draft prompt. Returns (scenario, brief, prompt)."""
+        scenario, brief, source_content, research_context = await self._prepare_generation(article, scenario)
         prompt = self._build_prompt(
-            article, scenario, scenario_info, brief,
+            article, scenario, brief.scenario_info, brief,
             hook=hook, source_content=source_content,
             research_context=research_context, instructions=instructions,
         )
+        return scenario, brief, prompt
 
-        # Generate with Claude (Opus for writing quality)
-        response = self.client.messages.create(
-            model=MODEL_WRITING,
-            max_tokens=4000,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        draft_content = response.content[0].text
-
-        # AI 평가-수정 루프 (정규식 + full AI 평가 → 타겟 수정, 최대 2회)
-        evaluator = LinkedInEvaluator(self.db, brief)
-        draft_content, evaluation, iteration_count = evaluator.evaluate_and_fix(
-            draft_content, article.url, max_iterations=2
-        )
-
-        # Get next version number
-        existing_drafts = (
-            self.db.query(LinkedInDraft)
-            .filter(LinkedInDraft.article_id == article.id)
-            .count()
-        )
-        version = existing_drafts + 1
+    async def _finish_draft(
+        self, article: Article, scenario: str, brief: StyleBrief, draft_content: str,
+        prompt: Optional[DraftPrompt] = None,
+    ) -> tuple[LinkedInDraft, asyncio.Task]:
+        """Save a generated draft as a new version and start its evaluate-fix loop in the background.
 
-        # Create draft record
+        Returns (draft, eval_task); the draft is returned to the client before evaluation finishes.
+        """
+        # Create draft record (평가 전 원본 — 평가 완료 시 evaluate_draft_in_background가 갱신)
+        # version은 INSERT 안의 서브쿼리로 계산 (별도 SELECT 없음)
         draft = LinkedInDraft(
             article_id=article.id,
             scenario=scenario,
             draft_content=draft_content,
-            version=version,
-            evaluation=evaluation,
+            version=LinkedInDraft.next_version(article.id),
+            evaluating=True,
         )
         self.db.add(draft)
 
-        # Update article status
+        # Update article status — 초안 INSERT와 같은 트랜잭션
         article.linkedin_status = "generated"
         self.db.commit()
-        self.db.refresh(draft)
 
-        return draft
+        eval_task = asyncio.create_task(
+            evaluate_draft_in_background(draft.id, brief, article.url, draft_content, prompt)
+        )
+        _EVAL_TASKS.add(eval_task)
+        eval_task.add_done_callback(_EVAL_TASKS.discard)
+        return draft, eval_task
 
-    def regenerate_draft(self, draft_id: int) -> LinkedInDraft:
+    async def regenerate_draft(self, draft_id: int) -> LinkedInDraft:
         """Regenerate a draft with the same scenario."""
-        existing_draft = self.db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+        existing_draft = self.db.get(LinkedInDraft, draft_id)
         if not existing_draft:
             raise ValueError(f"Draft {draft_id} not found")
 
         article = existing_draft.article
-        return self.generate_draft(article, scenario=existing_draft.scenario)
+        return await self.generate_draft(article, scenario=existing_draft.scenario)
 
     def get_drafts_for_article(self, article_id: int) -> List[LinkedInDraft]:
         """Get all drafts for an article."""
@@ -456,6 +846,191 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
             .all()
         )
 
+    async def submit_drafts_batch(self, articles: List[Article]) -> tuple[str, dict]:
+        """Build Simple-mode draft prompts for several articles and submit them as one Message Batch.
+
+        Non-interactive digest generation: half the cost of N direct Opus calls.
+        Saved drafts are then evaluated as another batch (EVAL_VIA_BATCH) or by
+        the same background evaluate-fix loop as generate_draft().
+
+        Returns:
+            (batch_id, targets) — targets maps custom_id -> (article_id, scenario, article_url),
+            to be passed to start_draft_batch_collection(). The pair is also stored as a
+            DraftBatch row until its drafts are saved.
+        """
+        requests, targets = [], {}
+        for article, scenario, _, prompt in await self._build_bulk_prompts(articles):
+            custom_id = f"art-{article.id}"
+            requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": MODEL_WRITING,
+                    "max_tokens": 4000,
+                    **_draft_message_params(prompt),
+                },
+            })
+            targets[custom_id] = (article.id, scenario, article.url)
+
+        batch = await get_async_client().messages.batches.create(requests=requests)
+        print(f"[LinkedIn] 초안 배치 제출: {batch.id} ({len(requests)}건)")
+
+        # 배치는 수 시간 걸릴 수 있으므로 DB에 남겨 재시작 후에도 수집 재개 (resume_draft_batches)
+        self.db.add(DraftBatch(batch_id=batch.id, targets=json_compat.dumps(targets)))
+        self.db.commit()
+        return batch.id, targets
+
+    async def generate_drafts_many(self, articles: List[Article]) -> tuple[List[LinkedInDraft], dict[int, str]]:
+        """Generate Simple-mode drafts for several articles now, with the Opus calls in parallel.
+
+        The interactive counterpart of submit_drafts_batch(): wall time is roughly
+        the slowest single draft instead of the sum. Each draft's evaluate-fix
+        loop runs in the background as in generate_draft().
+
+        Returns (drafts, failed) — one failed generation does not discard the
+        others; `failed` maps article id -> error message.
+        """
+        prepared = await self._build_bulk_prompts(articles)
+
+        async def generate(prompt: DraftPrompt) -> str:
+            async with _DRAFT_SLOTS:
+                return await self._stream_draft_text(prompt)
+
+        # 한 건이 실패해도 이미 끝난(비용이 나간) 초안은 저장
+        contents = await asyncio.gather(
+            *(generate(prompt) for _, _, _, prompt in prepared), return_exceptions=True,
+        )
+
+        # 저장은 순차로 — DB 세션 공유
+        drafts, failed = [], {}
+        for (article, scenario, brief, prompt), draft_content in zip(prepared, contents):
+            if isinstance(draft_content, BaseException):
+                print(f"[LinkedIn] 초안 생성 실패 [article {article.id}]: {draft_content}")
+                failed[article.id] = str(draft_content)
+                continue
+            draft, _ = await self._finish_draft(article, scenario, brief, draft_content, prompt)
+            drafts.append(draft)
+        return drafts, failed
+
+    async def _build_bulk_prompts(self, articles: List[Article]) -> list[tuple[Article, str, StyleBrief, DraftPrompt]]:
+        """Build draft prompts for several articles: [(article, scenario, brief, prompt)].
+
+        Scenario detection, source fetch, and research run concurrently across
+        articles; StyleBriefs are built once per scenario.
+        """
+        loop = asyncio.get_running_loop()
+
+        # 원문·리서치는 기사별로 동시에, 시나리오 감지는 묶음 호출로 그와 병행
+        # (워커는 값만 반환 — ORM 속성 쓰기는 gather 후 이 스레드에서)
+        async def gather_inputs(article: Article):
+            return await asyncio.gather(
+                loop.run_in_executor(None, self._fetch_source_content, article.url),
+                self._gather_research(article),
+            )
+
+        scenarios, fetched = await asyncio.gather(
+            loop.run_in_executor(None, self.detect_scenarios_batch, articles),
+            asyncio.gather(*(gather_inputs(a) for a in articles)),
+        )
+        inputs = []
+        for article, (source_content, research_context) in zip(articles, fetched):
+            self._write_back_inputs(article, research_context)
+            inputs.append((scenarios[article.id], source_content, research_context))
+
+        # StyleBrief는 시나리오별 1회 — DB 세션은 한 스레드에서만 사용
+        def build_prompts() -> list:
+            briefs = {}
+            prepared = []
+            for article, (scenario, source_content, research_context) in zip(articles, inputs):
+                if scenario not in briefs:
+                    briefs[scenario] = StyleBriefBuilder(self.db).build_cached(scenario)
+                brief = briefs[scenario]
+                prompt = self._build_prompt(
+                    article, scenario, brief.scenario_info, brief,
+                    source_content=source_content, research_context=research_context,
+                )
+                prepared.append((article, scenario, brief, prompt))
+            return prepared
+
+        prepared = await loop.run_in_executor(None, build_prompts)
+        self._commit_cache_writes()
+        return prepared
+
+    async def _prepare_generation(
+        self, article: Article, scenario: Optional[str],
+    ) -> tuple[str, StyleBrief, str, str]:
+        """Gather generation inputs concurrently: (scenario, brief, source_content, research_context).
+
+        Scenario detection, source fetch, and web research are independent
+        blocking I/O, so they run side by side in executor threads. The workers
+        only return values; the ORM writes and the StyleBrief build (DB queries)
+        follow on one thread after the gather.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def detect() -> str:
+            if scenario:
+                return scenario
+            result = await loop.run_in_executor(None, self._detect_scenario_result, article)
+            return result["scenario"]
+
+        detected, source_content, research_context = await asyncio.gather(
+            detect(),
+            loop.run_in_executor(None, self._fetch_source_content, article.url),
+            self._gather_research(article),
+        )
+        # 캐시 컬럼 write-back은 여기서 commit하지 않음 — 초안 경로는 초안 저장과 한 트랜잭션
+        self._write_back_inputs(article, research_context)
+        # StyleBrief 빌드 (guidelines + StyleProfile + references) — 다른 워커가 끝난 뒤 Session 단독 사용
+        brief = await loop.run_in_executor(None, StyleBriefBuilder(self.db).build_cached, detected)
+        return detected, brief, source_content, research_context
+
+    @staticmethod
+    def _sse(event: str, data: dict) -> bytes:
+        """Format an SSE event (UTF-8 bytes)."""
+        return b"event: %s\ndata: %s\n\n" % (event.encode(), json_compat.dumps_bytes(data))
+
+    def _commit_cache_writes(self):
+        """Commit scenario/research cache columns set during input gathering (L2 write-back).
+
+        Only for paths with no other write; the draft path commits them with the draft.
+        """
+        if self.db.dirty:
+            self.db.commit()
+
+    async def _stream_draft_text(self, prompt: DraftPrompt) -> str:
+        """Generate a draft body via streaming, stopping once it runs past DRAFT_STREAM_ABORT_CHARS.
+
+        Non-SSE counterpart of generate_draft_stream(): the text is collected
+        here instead of being forwarded, so an overlong generation is cut off
+        instead of running to max_tokens.
+        """
+        chunks: list = []
+        char_count = 0
+        async with get_async_client().with_options(max_retries=DRAFT_MAX_RETRIES).messages.stream(
+            model=MODEL_WRITING,
+            max_tokens=4000,
+            **_draft_message_params(prompt),
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                char_count += len(text)
+                if char_count > DRAFT_STREAM_ABORT_CHARS:
+                    print(f"[LinkedIn] 초안 길이 초과로 생성 중단: {char_count}자")
+                    break
+        return "".join(chunks)
+
+    @staticmethod
+    def _article_context(article: Article, source_content: str, research_context: str) -> str:
+        """build_article_context() memoized per (article fields, source, research) for the hooks → draft flow."""
+        key = (article_header_key(article), source_content, research_context)
+        context = _CONTEXT_CACHE.get(key)
+        if context is None:
+            context = build_article_context(
+                article, source_content=source_content, research_context=research_context,
+            )
+            _CONTEXT_CACHE[key] = context
+        return context
+
     def _fetch_source_content(self, url: str) -> str:
         """Fetch source article content for deep reading."""
         try:
@@ -464,10 +1039,14 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
         except Exception:
             return ""
 
-    def _build_prompt(self, article: Article, scenario: str, scenario_info: dict, brief, hook: Optional[str] = None, source_content: str = "", research_context: str = "", instructions: Optional[str] = None) -> str:
-        """Build the generation prompt using StyleBrief."""
+    def _build_prompt(self, article: Article, scenario: str, scenario_info: dict, brief, hook: Optional[str] = None, source_content: str = "", research_context: str = "", instructions: Optional[str] = None) -> DraftPrompt:
+        """Build the generation prompt using StyleBrief, as (system, user).
+
+        The system block depends only on the brief and scenario, so it is sent
+        with cache_control and reused across articles; the article goes in user.
+        """
         # 기사 정보 섹션 (풍부한 맥락 포함)
-        article_section = build_article_context(article, source_content=source_content, research_context=research_context)
+        article_section = self._article_context(article, source_content, research_context)
 
         # StyleBrief에서 통합 스타일 가이드 생성
         style_section = brief.to_writer_prompt_section()
@@ -481,6 +1060,7 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
 {hook}
 
 이 훅을 그대로 사용하되, 문맥에 맞게 미세 조정은 허용됩니다. 의미나 구조를 변경하지 마세요.
+
 """
 
         # 추가 지시 섹션
@@ -491,71 +1071,29 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
 
 """
 
-        return f"""당신은 LinkedIn 포스팅 전문가입니다. 다음 기사를 바탕으로 LinkedIn 포스트를 작성해주세요.
-
-{style_section}
-
-## 시나리오 {scenario}: {scenario_info['name']}
-- 설명: {scenario_info['description']}
-- 훅 스타일: {scenario_info['hook_style']}
-- 본문 구조: {scenario_info['structure']}
-- 마무리: {scenario_info['closing']}
-
-{article_section}
-
-{hook_section}{instructions_section}## LinkedIn 포맷팅 규칙
-- 줄바꿈으로 단락을 명확히 구분하세요
-- 짧은 문장과 긴 문장을 섞어 자연스러운 리듬감을 만드세요 (단문만 반복하면 AI스러워집니다)
-- 도치문("~뭘까요.", "~보입니다.")은 글 전체에서 1-2회만 허용합니다. 남발하면 부자연스럽습니다
-- 넘버링(1, 2, 3)을 활용하여 가독성을 높이세요
-- 구분선(ㅡ)을 활용하여 시각적으로 정리하세요
-
-## 길이 제약 (매우 중요)
-반드시 1800자 이상 2800자 이하로 작성하세요.
-이상적 길이는 2200-2600자입니다. 이 범위를 벗어나면 조절하세요.
-
-## 출력 형식
-- 제목/헤더 없이 본문만 출력하세요. 첫 줄이 곧 훅입니다.
-- 설명이나 주석 없이 바로 사용 가능한 형태로 작성하세요.
-- 마지막에 원문 링크 한 줄: {article.url}
-
-## 작성 원칙
-
-### 1. 원문 소재 충실 활용 (최우선 원칙)
-원문 콘텐츠를 깊이 읽고 구체적 수치, 직접 인용구, 고유 사례, 대비 소재를 반드시 추출하여 포스트 전반에 녹이세요.
-표면적 요약을 반복하지 말고, 원문의 '살아있는 디테일'을 활용하세요.
-원문에 없는 내용을 만들어내지 마세요 — 팩트 기반으로 작성하세요.
-
-### 2. 테제(Thesis) 주도
-한 문장으로 포스트 전체를 관통하는 핵심 주장 선언.
-좋은 예: "에이전트 시대에 살아남는 소프트웨어의 조건이 3가지로 수렴했습니다"
-나쁜 예: "최근 AI 업계에서 여러 움직임이 있었습니다" (테제 없음)
-
-### 3. 문화적 훅
-업계 격언/유명 문구를 비틀어 인지적 마찰 생성.
-예: "Make something people want" → "Make something agents want"
-
-### 4. 점진적 논증
-각 포인트가 이전 포인트 위에 쌓여야 함 (병렬 나열 금지).
-예: 문서(쉬움) → harness(어려움) → 도메인(불가능)
-
-### 5. 구체적 대비
-승자 vs 패자를 이름/숫자로 보여주기.
-예: "Supabase vs SendGrid", "2시간→3분"
-
-### 6. 종합 마무리
-전체 논증을 한 문장으로 응축.
-예: "코드에서 문서로, 문서에서 harness로, harness에서 도메인으로."
-
-## 다음과 같이 작성하지 마세요 (anti-pattern)
-1. 너무 일반적인 서론 ("오늘은 ~에 대해...")
-2. "~에 대해 이야기하겠습니다"
-3. "결론적으로~"
-4. "요약하면~"
-5. 표면적 정보 나열 — 원문 요약 반복은 포스팅이 아님
-6. 병렬 구조만 사용 — "첫째, 둘째, 셋째" 나열은 기계적
-7. 테제 없는 나열 — 뉴스 요약이지 포스팅이 아님
-"""
+        # 시나리오 섹션은 import 시 미리 렌더링한 것 사용 (목록 밖 시나리오만 즉석 렌더링)
+        scenario_section = _DRAFT_SCENARIO_SECTIONS.get(scenario) if scenario_info is SCENARIOS.get(scenario) else None
+        if scenario_section is None:
+            scenario_section = _render_scenario_section(scenario, scenario_info)
+
+        # system: 스타일 + 시나리오 + 불변 규칙 (기사와 무관 — 캐시 prefix)
+        system = "".join([
+            _DRAFT_SYSTEM_HEAD,
+            style_section,
+            "\n\n",
+            scenario_section,
+            _DRAFT_SYSTEM_TAIL,
+        ])
+        # user: 기사 정보 + (선택) 훅/추가 지시 + 원문 URL
+        user = "".join([
+            article_section,
+            "\n\n",
+            hook_section,
+            instructions_section,
+            _DRAFT_USER_TAIL,
+            article.url,
+        ])
+        return system, user
 
     def chat_refine_by_draft(self, draft_id: int, user_message: str) -> dict:
         """Refine draft via chat message using draft from DB (no session needed).
@@ -567,27 +1105,17 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
         Returns:
             dict with revised_draft, char_count, chat_history, updated_content, validation_warnings
         """
-        import time as _time
-
-        draft = self.db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+        draft = self.db.get(LinkedInDraft, draft_id)
         if not draft:
             raise ValueError(f"Draft {draft_id} not found")
 
         current_content = draft.draft_content
 
-        # 기존 채팅 이력 로드
-        chat_messages = []
-        if draft.chat_history:
-            try:
-                chat_messages = json.loads(draft.chat_history)
-            except json.JSONDecodeError:
-                chat_messages = []
-
-        # 채팅 컨텍스트 구성
-        chat_context = ""
-        for msg in chat_messages:
-            role_label = "사용자" if msg["role"] == "user" else "어시스턴트"
-            chat_context += f"\n[{role_label}]: {msg['content']}\n"
+        # 기존 채팅 이력 로드 (draft_messages 행) → 채팅 컨텍스트 구성
+        chat_context = "".join(
+            f"\n[{'사용자' if msg['role'] == 'user' else '어시스턴트'}]: {msg['content']}\n"
+            for msg in draft.chat_messages
+        )
 
         # StyleBrief 로드 (시나리오/참고예시 컨텍스트)
         brief = None
@@ -595,7 +1123,7 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
         reference_section = ""
         if draft.scenario:
             builder = StyleBriefBuilder(self.db)
-            brief = builder.build(draft.scenario)
+            brief = builder.build_cached(draft.scenario)
             scenario_info = brief.scenario_info
 
             scenario_section = f"""
@@ -651,24 +1179,319 @@ JSON만 출력하세요. 다른 설명은 불필요합니다."""
         validation = evaluator.validate(revised, "")
         warnings = validation["issues"] if not validation["valid"] else []
 
-        # 채팅 이력 업데이트
-        timestamp = _time.strftime("%Y-%m-%d %H:%M:%S")
-        chat_messages.append({"role": "user", "content": user_message, "timestamp": timestamp})
-        chat_messages.append({"role": "assistant", "content": f"수정 완료 ({len(revised)}자)", "timestamp": timestamp})
-
-        # DB 업데이트
+        # DB 업데이트 — 이번 턴의 메시지 2개만 INSERT (전체 이력 재직렬화 없음)
+        timestamp = datetime.utcnow().isoformat(timespec="seconds")  # user/assistant 메시지 공용
         draft.draft_content = revised
-        draft.chat_history = json.dumps(chat_messages, ensure_ascii=False)
+        draft.add_chat_turn(user_message, f"수정 완료 ({len(revised)}자)", timestamp)
         self.db.commit()
 
         return {
             "revised_draft": revised,
             "char_count": len(revised),
-            "chat_history": chat_messages,
+            "chat_history": draft.chat_messages,
             "updated_content": revised,
             "validation_warnings": warnings,
         }
 
+    def clear_generation_caches(self) -> int:
+        """Drop cached scenario/research results (memory and DB) and StyleBriefs. Returns rows cleared."""
+        _SCENARIO_CACHE.clear()
+        _SCENARIO_FALLBACK_CACHE.clear()
+        _RESEARCH_CACHE.clear()
+        _CONTEXT_CACHE.clear()
+        invalidate_brief_cache()
+        cleared = (
+            self.db.query(Article)
+            .filter((Article.scenario_json.isnot(None)) | (Article.research_text.isnot(None)))
+            .update({Article.scenario_json: None, Article.research_text: None}, synchronize_session=False)
+        )
+        self.db.commit()
+        return cleared
+
     def get_scenarios(self) -> dict:
         """Get all available scenarios."""
         return SCENARIOS
+
+
+async def evaluate_draft_in_background(
+    draft_id: int, brief: StyleBrief, article_url: str, draft_content: str,
+    prompt: Optional[DraftPrompt] = None,
+) -> None:
+    """Run the evaluate-fix loop for a saved Simple-mode draft and write the result back.
+
+    Runs after the draft has been returned to the client, so it uses its own DB session.
+    With the generation `prompt`, fixes continue that conversation (cached system prefix).
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        # AI 평가-수정 루프 (정규식 + full AI 평가 → 타겟 수정) — 동기 호출이므로 스레드에서
+        # 생성 프롬프트가 자체 검증 체크리스트를 포함하므로 수정은 안전망 1회
+        evaluator = LinkedInEvaluator(None, brief)
+        fixed, evaluation, iteration_count = await loop.run_in_executor(
+            None, evaluator.evaluate_and_fix, draft_content, article_url, SIMPLE_FIX_ITERATIONS, prompt
+        )
+    except Exception as e:
+        print(f"[LinkedIn] 초안 평가 실패 [draft {draft_id}]: {e}")
+        fixed, evaluation, iteration_count = draft_content, None, 1
+    await loop.run_in_executor(
+        None, _save_draft_evaluation, draft_id, draft_content, fixed, evaluation, iteration_count
+    )
+
+
+def _save_draft_evaluation(
+    draft_id: int, original: str, fixed: str, evaluation: Optional[str], iteration_count: int,
+):
+    """Write a background evaluation result to the draft (own session)."""
+    db = SessionLocal()
+    try:
+        draft = db.get(LinkedInDraft, draft_id)
+        if draft is None:
+            return  # 평가 중 삭제됨
+        # 평가 중 사용자가 편집/채팅으로 내용을 바꿨다면 수정본·평가로 덮어쓰지 않음
+        if draft.draft_content == original:
+            draft.draft_content = fixed
+            draft.evaluation = evaluation
+            draft.iteration_count = iteration_count
+        draft.evaluating = False
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _wait_batch_results(client, batch_id: str) -> dict:
+    """Poll a Message Batch until it ends; return {custom_id: text} for succeeded entries.
+
+    Transient API errors (connection, 408/409/429, 5xx) are retried with
+    exponential backoff; anything else (e.g. 404 for an unknown batch) is raised.
+    """
+    retry_delay = DRAFT_BATCH_POLL_SECONDS
+    while True:
+        try:
+            batch = await client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return await _read_batch_results(client, batch_id)
+            retry_delay = DRAFT_BATCH_POLL_SECONDS
+            await asyncio.sleep(DRAFT_BATCH_POLL_SECONDS)
+        except Exception as e:
+            if not _is_transient_api_error(e):
+                raise
+            print(f"[LinkedIn] 배치 폴링 오류, {retry_delay}초 후 재시도: {batch_id}: {e}")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, DRAFT_BATCH_RETRY_MAX_SECONDS)
+
+
+async def _read_batch_results(client, batch_id: str) -> dict:
+    contents = {}
+    async for entry in await client.messages.batches.results(batch_id):
+        if entry.result.type == "succeeded":
+            contents[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            print(f"[LinkedIn] 배치 항목 실패 [{entry.custom_id}]: {entry.result.type}")
+    return contents
+
+
+def _is_transient_api_error(error: Exception) -> bool:
+    """True for errors worth retrying: connection/timeout, or 408/409/429/5xx."""
+    from anthropic import APIConnectionError, APIStatusError
+
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and (error.status_code in (408, 409, 429) or error.status_code >= 500)
+
+
+def start_draft_batch_collection(batch_id: str, targets: dict, repair_batch_id: Optional[str] = None):
+    """Collect a draft batch in a background task (kept referenced until it finishes)."""
+    task = asyncio.create_task(collect_draft_batch(batch_id, targets, repair_batch_id))
+    _BATCH_TASKS.add(task)
+    task.add_done_callback(_BATCH_TASKS.discard)
+
+
+async def resume_draft_batches() -> int:
+    """Restart collection for draft batches left pending by a previous process. Returns the count."""
+    def load() -> list[tuple[str, dict, Optional[str]]]:
+        db = SessionLocal()
+        try:
+            return [(row.batch_id, row.target_map, row.repair_batch_id) for row in db.query(DraftBatch).all()]
+        finally:
+            db.close()
+
+    pending = await asyncio.get_running_loop().run_in_executor(None, load)
+    for batch_id, targets, repair_batch_id in pending:
+        print(f"[LinkedIn] 초안 배치 수집 재개: {batch_id}")
+        start_draft_batch_collection(batch_id, targets, repair_batch_id)
+    return len(pending)
+
+
+async def collect_draft_batch(batch_id: str, targets: dict, repair_batch_id: Optional[str] = None) -> int:
+    """Wait for a draft batch from submit_drafts_batch() to end and save its drafts.
+
+    Drafts that fail the regex validation get one repair pass, submitted
+    together as a second batch (not fixed one by one). Runs as a background
+    task after the request returns, so it uses its own DB session.
+    `repair_batch_id` resumes an already submitted repair batch after a restart.
+    Returns the number of drafts saved.
+    """
+    client = get_async_client()
+    loop = asyncio.get_running_loop()
+    try:
+        contents = await _wait_batch_results(client, batch_id)
+
+        # 원문 링크 자동 보충 후에도 규칙 검증 실패분만 수정 프롬프트로 묶어 2차 배치 1회
+        validator = LinkedInEvaluator(None)
+        repair_requests = []
+        for custom_id, draft_content in contents.items():
+            if custom_id not in targets:
+                continue
+            article_url = targets[custom_id][2]
+            draft_content = contents[custom_id] = autofix(draft_content, article_url)
+            validation = validator.validate(draft_content, article_url)
+            if validation["valid"]:
+                continue
+            issues = [f"- [규칙] {issue}" for issue in validation["issues"]]
+            repair_requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": MODEL_WRITING,
+                    "max_tokens": 4000,
+                    "messages": [{"role": "user", "content": build_fix_prompt(draft_content, issues, article_url)}],
+                },
+            })
+        if repair_requests and not repair_batch_id:
+            repair = await client.messages.batches.create(requests=repair_requests)
+            repair_batch_id = repair.id
+            print(f"[LinkedIn] 초안 수정 배치 제출: {repair_batch_id} ({len(repair_requests)}건)")
+            await loop.run_in_executor(None, _record_repair_batch, batch_id, repair_batch_id)
+        if repair_batch_id:
+            # 수정에 실패한 항목은 1차 초안을 그대로 저장
+            contents.update(await _wait_batch_results(client, repair_batch_id))
+
+        saved = await loop.run_in_executor(None, _save_batch_drafts, batch_id, contents, targets)
+    except Exception as e:
+        # 백그라운드 태스크 → 예외를 받을 호출자가 없으므로 로그만
+        print(f"[LinkedIn] 초안 배치 수집 실패: {batch_id}: {e}")
+        return 0
+    print(f"[LinkedIn] 초안 배치 완료: {batch_id} ({len(saved)}/{len(targets)}건 저장)")
+
+    if not saved:
+        return 0
+    if EVAL_VIA_BATCH:
+        # 저장된 초안의 평가도 건별 호출 대신 하나의 배치로 — 결과는 eval_batch poller가 기록
+        try:
+            eval_batch_id = await loop.run_in_executor(None, _submit_batch_evaluations, saved)
+            print(f"[LinkedIn] 초안 평가 배치 제출: {eval_batch_id} ({len(saved)}건)")
+            notify_batch_submitted()
+        except Exception as e:
+            print(f"[LinkedIn] 초안 평가 배치 제출 실패: {batch_id}: {e}")
+    else:
+        # 배치 poller가 없으므로 /generate와 같은 백그라운드 평가-수정 루프
+        await _start_batch_draft_evaluations(saved)
+    return len(saved)
+
+
+async def _start_batch_draft_evaluations(saved: list[tuple[int, str, str, str]]):
+    """Start evaluate_draft_in_background() for each saved batch draft (EVAL_VIA_BATCH off)."""
+    def build_briefs(scenarios: set[str]) -> dict[str, StyleBrief]:
+        db = SessionLocal()
+        try:
+            builder = StyleBriefBuilder(db)
+            return {scenario: builder.build_cached(scenario) for scenario in scenarios}
+        finally:
+            db.close()
+
+    loop = asyncio.get_running_loop()
+    try:
+        briefs = await loop.run_in_executor(None, build_briefs, {scenario for _, scenario, _, _ in saved})
+    except Exception as e:
+        print(f"[LinkedIn] 배치 초안 평가 시작 실패: {e}")
+        await loop.run_in_executor(None, _clear_evaluating, [draft_id for draft_id, _, _, _ in saved])
+        return
+    for draft_id, scenario, draft_content, article_url in saved:
+        task = asyncio.create_task(
+            evaluate_draft_in_background(draft_id, briefs[scenario], article_url, draft_content)
+        )
+        _EVAL_TASKS.add(task)
+        task.add_done_callback(_EVAL_TASKS.discard)
+
+
+def _clear_evaluating(draft_ids: list[int]):
+    """Drop the `evaluating` mark from drafts whose evaluation could not start."""
+    db = SessionLocal()
+    try:
+        db.query(LinkedInDraft).filter(LinkedInDraft.id.in_(draft_ids)).update(
+            {LinkedInDraft.evaluating: False}, synchronize_session=False,
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _record_repair_batch(batch_id: str, repair_batch_id: str):
+    """Remember the repair batch on the pending DraftBatch row (so a restart does not resubmit it)."""
+    db = SessionLocal()
+    try:
+        db.query(DraftBatch).filter(DraftBatch.batch_id == batch_id).update(
+            {DraftBatch.repair_batch_id: repair_batch_id}, synchronize_session=False,
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _save_batch_drafts(batch_id: str, contents: dict, targets: dict) -> list[tuple[int, str, str, str]]:
+    """Persist batch results as new draft versions and drop the pending DraftBatch row (one commit).
+
+    Returns (draft_id, scenario, content, article_url) for each saved draft.
+    """
+    db = SessionLocal()
+    try:
+        db.query(DraftBatch).filter(DraftBatch.batch_id == batch_id).delete(synchronize_session=False)
+        drafts = []
+        for custom_id, draft_content in contents.items():
+            if custom_id not in targets:
+                continue
+            article_id, scenario, article_url = targets[custom_id]
+            article = db.query(Article).filter(Article.id == article_id).first()
+            if not article:
+                continue
+            draft = LinkedInDraft(
+                article_id=article_id,
+                scenario=scenario,
+                draft_content=draft_content,
+                version=LinkedInDraft.next_version(article_id),
+                evaluating=not EVAL_VIA_BATCH,  # 백그라운드 평가-수정 루프가 끝나면 해제
+            )
+            db.add(draft)
+            drafts.append((draft, article_url))
+            article.linkedin_status = "generated"
+        db.commit()
+        return [(d.id, d.scenario, d.draft_content, article_url) for d, article_url in drafts]
+    finally:
+        db.close()
+
+
+def _submit_batch_evaluations(saved: list[tuple[int, str, str, str]]) -> str:
+    """Submit full evaluations for batch-generated drafts as one Message Batch.
+
+    Each draft gets `eval_batch_id` set; eval_batch.poll_pending_batches()
+    matches results back by the `draft-<id>` custom_id.
+    """
+    db = SessionLocal()
+    try:
+        builder = StyleBriefBuilder(db)
+        evaluators: dict[str, LinkedInEvaluator] = {}
+        requests = []
+        for draft_id, scenario, draft_content, _ in saved:
+            if scenario not in evaluators:
+                evaluators[scenario] = LinkedInEvaluator(None, builder.build_cached(scenario))
+            requests.append(evaluators[scenario].batch_request(draft_content, f"draft-{draft_id}"))
+        batch = get_client().messages.batches.create(requests=requests)
+
+        (
+            db.query(LinkedInDraft)
+            .filter(LinkedInDraft.id.in_([draft_id for draft_id, _, _, _ in saved]))
+            .update({LinkedInDraft.eval_batch_id: batch.id}, synchronize_session=False)
+        )
+        db.commit()
+        return batch.id
+    finally:
+        db.close()
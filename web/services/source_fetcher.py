@@ -2,10 +2,14 @@
 
 import re
 import time as _time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+if TYPE_CHECKING:
+    # bs4 import는 첫 HTML 파싱 시점으로 미룸 (LinkedIn 서비스 모듈 import 비용 절감)
+    from bs4 import BeautifulSoup
 
 
 # Domains that block scraping or return useless content
@@ -40,14 +44,14 @@ def _is_skip_domain(url: str) -> bool:
     if url.startswith("manual://"):
         return True
     try:
-        from urllib.parse import urlparse
         hostname = urlparse(url).hostname or ""
-        return any(domain in hostname for domain in SKIP_DOMAINS)
+        # 도메인 자체 또는 서브도메인만 (부분 문자열 비교면 "t.co"가 microsoft.com에도 걸림)
+        return any(hostname == domain or hostname.endswith("." + domain) for domain in SKIP_DOMAINS)
     except Exception:
         return False
 
 
-def _clean_html(soup: BeautifulSoup) -> str:
+def _clean_html(soup: "BeautifulSoup") -> str:
     """Remove noise elements and extract clean text."""
     for selector in NOISE_SELECTORS:
         for element in soup.select(selector):
@@ -137,6 +141,8 @@ def _fetch_impl(url: str) -> Optional[str]:
         if "html" not in content_type.lower() and "text" not in content_type.lower():
             return None
 
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(response.text, "html.parser")
         text = _clean_html(soup)
         text = _collapse_whitespace(text)
@@ -4,11 +4,11 @@ import json
 from datetime import datetime
 from typing import Optional
 
-from anthropic import Anthropic
 from sqlalchemy.orm import Session
 
 from web.models import ReferencePost, LinkedInDraft, StyleProfile
-from web.config import ANTHROPIC_API_KEY
+from web.services import json_compat
+from web.services.anthropic_client import get_client
 
 
 class StyleAnalyzer:
@@ -16,7 +16,7 @@ class StyleAnalyzer:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.client = get_client()
 
     def get_current_profile(self) -> Optional[dict]:
         """최신 StyleProfile 반환. 없으면 None (guidelines fallback)."""
@@ -47,8 +47,8 @@ class StyleAnalyzer:
             }
             if post.analysis:
                 try:
-                    entry["analysis"] = json.loads(post.analysis)
-                except json.JSONDecodeError:
+                    entry["analysis"] = json_compat.loads(post.analysis)
+                except json_compat.JSONDecodeError:
                     entry["analysis_raw"] = post.analysis
             analyses.append(entry)
 
@@ -124,7 +124,7 @@ JSON만 출력하세요."""
             new_version = (latest.version + 1) if latest else 1
 
             profile = StyleProfile(
-                profile_data=json.dumps(profile_data, ensure_ascii=False),
+                profile_data=json_compat.dumps(profile_data),
                 version=new_version,
                 source_post_count=len(analyses) + len(draft_samples),
                 created_at=datetime.utcnow(),
@@ -182,7 +182,7 @@ JSON만 출력하세요."""
             source_count = (latest.source_post_count + 1) if latest else 1
 
             profile = StyleProfile(
-                profile_data=json.dumps(updated_data, ensure_ascii=False),
+                profile_data=json_compat.dumps(updated_data),
                 version=new_version,
                 source_post_count=source_count,
                 created_at=datetime.utcnow(),
@@ -241,7 +241,7 @@ JSON만 출력하세요."""
             new_version = (latest.version + 1) if latest else 1
 
             profile = StyleProfile(
-                profile_data=json.dumps(updated_data, ensure_ascii=False),
+                profile_data=json_compat.dumps(updated_data),
                 version=new_version,
                 source_post_count=latest.source_post_count if latest else 0,
                 created_at=datetime.utcnow(),
@@ -261,7 +261,7 @@ JSON만 출력하세요."""
         Called after publish or manual trigger. Determines positive/negative based on
         eval score and collects feedback from user_feedback + chat_history.
         """
-        draft = self.db.query(LinkedInDraft).filter(LinkedInDraft.id == draft_id).first()
+        draft = self.db.get(LinkedInDraft, draft_id)
         if not draft:
             return {"error": f"Draft {draft_id} not found"}
 
@@ -272,9 +272,9 @@ JSON만 출력하세요."""
         eval_score = 0
         if draft.evaluation:
             try:
-                eval_data = json.loads(draft.evaluation)
+                eval_data = json_compat.loads(draft.evaluation)
                 eval_score = eval_data.get("overall_score", 0)
-            except (json.JSONDecodeError, KeyError):
+            except (json_compat.JSONDecodeError, KeyError):
                 pass
 
         is_positive = eval_score >= 70
@@ -284,14 +284,9 @@ JSON만 출력하세요."""
         if draft.user_feedback and draft.user_feedback.strip():
             feedback_parts.append(draft.user_feedback.strip())
 
-        if draft.chat_history:
-            try:
-                chats = json.loads(draft.chat_history)
-                for msg in chats:
-                    if msg.get("role") == "user":
-                        feedback_parts.append(msg["content"][:200])
-            except (json.JSONDecodeError, KeyError):
-                pass
+        for msg in draft.chat_messages:
+            if msg.get("role") == "user":
+                feedback_parts.append(msg.get("content", "")[:200])
 
         feedback = "\n".join(feedback_parts)
 
@@ -316,7 +311,7 @@ JSON만 출력하세요."""
             json_start = raw.find("{")
             json_end = raw.rfind("}") + 1
             if json_start >= 0 and json_end > json_start:
-                return json.loads(raw[json_start:json_end])
-        except json.JSONDecodeError:
+                return json_compat.loads(raw[json_start:json_end])
+        except json_compat.JSONDecodeError:
             pass
         return {"error": "JSON 파싱 실패", "raw": raw}
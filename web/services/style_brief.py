@@ -7,15 +7,100 @@ Data Sources → StyleBriefBuilder.build() → StyleBrief → Consumers
   Past Learnings                                         Chat Refine
 """
 
-import json
 import re
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Optional
 
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
-from web.models import LinkedInDraft, ReferencePost, StyleProfile
+from web.models import DraftMessage, LinkedInDraft, ReferencePost, StyleProfile
 from web.config import LINKEDIN_GUIDELINES_PATH
+from web.services import json_compat
+from web.services.ttl_cache import TTLCache
+
+
+# 섹션 추출 실패 시 평가 프롬프트에 넣을 원문 최대 길이
+MAX_RAW_GUIDELINES_CHARS = 6000
+
+# guidelines.md 캐시 (st_mtime_ns, text) — 파일이 바뀔 때만 다시 읽음
+_guidelines_cache: Optional[tuple[int, str]] = None
+
+# 시나리오별 파싱 결과 캐시 {(st_mtime_ns, scenario): (persona, scenario_guidelines, guideline_example)}
+# 파일을 다시 읽을 때 비움
+_sections_cache: dict[tuple[int, str], tuple[str, str, str]] = {}
+
+
+# 시나리오별 StyleBrief 캐시 {(scenario, guidelines st_mtime_ns, 최신 StyleProfile id): StyleBrief}
+# 지침 파일 수정·프로필 갱신(새 버전 행 추가)은 키가 바뀌어 즉시 반영,
+# 참고 예시·past learnings 변경은 invalidate_brief_cache() 또는 TTL(10분)로 반영
+_BRIEF_CACHE = TTLCache(maxsize=16, ttl=600)
+
+# 시나리오별 참고 예시 섹션 캐시 {(scenario, 최신 ReferencePost id, 지침서 예시): text}
+# 브리프가 다른 이유(프로필 갱신·TTL)로 다시 빌드될 때 ReferencePost 조회를 건너뜀.
+# 새 행은 키로, 수정·삭제는 invalidate_brief_cache()로 반영
+_REFERENCE_CACHE = TTLCache(maxsize=16, ttl=600)
+
+# past learnings 결과 캐시 {limit: text} — 일괄 생성처럼 시나리오별 브리프를 연달아 빌드할 때
+# 같은 최근 드래프트 조회(2회)를 반복하지 않도록 짧게 공유. 평가 반영은 최대 30초 지연
+_LEARNINGS_TEXT_CACHE = TTLCache(maxsize=4, ttl=30)
+
+
+def load_guidelines() -> str:
+    """Current guidelines.md text ("" if missing), re-read only when its mtime changes.
+
+    The one process-wide copy — every reader (StyleBrief, GuidelinesLearner,
+    settings page) shares this str instead of decoding the file again.
+    """
+    global _guidelines_cache
+    try:
+        mtime = LINKEDIN_GUIDELINES_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ""
+
+    if _guidelines_cache and _guidelines_cache[0] == mtime:
+        return _guidelines_cache[1]
+
+    try:
+        text = LINKEDIN_GUIDELINES_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+    _guidelines_cache = (mtime, text)
+    _sections_cache.clear()
+    return text
+
+
+def invalidate_brief_cache():
+    """Drop cached StyleBriefs and reference examples (call after ReferencePost edits)."""
+    _BRIEF_CACHE.clear()
+    _LEARNINGS_TEXT_CACHE.clear()
+    _REFERENCE_CACHE.clear()
+
+
+# guidelines.md 섹션 추출 패턴 — 4개 섹션을 named group 교대(alternation) 하나로 묶어
+# finditer 한 번에 추출 (시나리오는 A-F 6개뿐이므로 전부 미리 컴파일)
+_SCENARIO_LETTERS = "ABCDEF"
+_PERSONA_PATTERN = r"## Persona\n(?P<persona>.*?)(?=\n---)"
+_COMMON_RULES_PATTERN = r"## 공통 규칙\n(?P<common>.*?)(?=\n## |$)"
+_SECTIONS_RE = {
+    c: re.compile(
+        _PERSONA_PATTERN
+        + rf"|(?P<scenario>### 시나리오 {c}:.*?(?=\n---|\n### 시나리오 [A-F]:|$))"
+        + "|" + _COMMON_RULES_PATTERN
+        + rf"|### 시나리오 {c} 예시.*?```\n(?P<example>.*?)```",
+        re.DOTALL,
+    )
+    for c in _SCENARIO_LETTERS
+}
+# 알 수 없는 시나리오: 페르소나와 공통 규칙만
+_SECTIONS_RE_DEFAULT = re.compile(_PERSONA_PATTERN + "|" + _COMMON_RULES_PATTERN, re.DOTALL)
+
+DEFAULT_PERSONA = (
+    "- VC 심사역 + ML 엔지니어 출신 AI 빌더\n"
+    "- 최신 AI 기술과 시장 동향에 깊은 이해\n"
+    "- 실무 경험을 바탕으로 인사이트 공유"
+)
 
 
 @dataclass
@@ -45,7 +130,7 @@ class StyleBrief:
     positive_patterns: list = field(default_factory=list)   # StyleProfile
     negative_patterns: list = field(default_factory=list)   # StyleProfile
 
-    # Raw (review/evaluation needs full guidelines)
+    # Raw (review/evaluation fallback when no sections could be extracted)
     guidelines_raw: str = ""
 
     def to_writer_prompt_section(self) -> str:
@@ -99,13 +184,13 @@ class StyleBrief:
 
     def to_reviewer_prompt_section(self) -> str:
         """Reviewer(Step 4) prompt block — evaluation criteria focus."""
-        sections = []
+        sections = [f"## 페르소나\n{self.persona}"]
 
         # Scenario guidelines as evaluation criteria
         if self.scenario_guidelines:
             sections.append(f"## 평가 기준 지침서\n{self.scenario_guidelines}")
         elif self.guidelines_raw:
-            sections.append(f"## 평가 기준 지침서\n{self.guidelines_raw}")
+            sections.append(f"## 평가 기준 지침서\n{self.guidelines_raw[:MAX_RAW_GUIDELINES_CHARS]}")
 
         # Negative patterns as things to check
         if self.negative_patterns:
@@ -115,7 +200,7 @@ class StyleBrief:
         if self.forbidden_phrases:
             sections.append("## 금지 표현\n" + "\n".join(f"- {p}" for p in self.forbidden_phrases))
 
-        return "\n\n".join(sections) if sections else "기본 LinkedIn 포스팅 규칙"
+        return "\n\n".join(sections)
 
     def to_outline_prompt_section(self) -> str:
         """Outline(Step 2) prompt block — structure patterns + reference examples."""
@@ -183,7 +268,7 @@ class StyleBriefBuilder:
                 .first()
             )
             if profile and profile.profile_data:
-                pdata = json.loads(profile.profile_data)
+                pdata = json_compat.loads(profile.profile_data)
                 # Tone
                 tone = pdata.get("tone", {})
                 if tone:
@@ -214,15 +299,17 @@ class StyleBriefBuilder:
         except Exception:
             pass  # StyleProfile 없거나 파싱 실패 → graceful skip
 
+        persona, scenario_guidelines, guideline_example = self._get_guideline_sections(scenario, guidelines)
+
         return StyleBrief(
             scenario=scenario,
             scenario_name=scenario_info["name"],
             scenario_info=scenario_info,
-            persona=self._extract_persona(guidelines),
+            persona=persona,
             tone_guidance=tone_guidance,
-            scenario_guidelines=self._extract_scenario_guidelines(scenario, guidelines),
+            scenario_guidelines=scenario_guidelines,
             structure_patterns=structure_patterns,
-            reference_examples=self._get_reference_examples(scenario, guidelines),
+            reference_examples=self._get_reference_examples(scenario, guideline_example),
             preferred_phrases=preferred_phrases,
             forbidden_phrases=forbidden_phrases,
             past_learnings=self._get_past_learnings(),
@@ -231,108 +318,110 @@ class StyleBriefBuilder:
             guidelines_raw=guidelines,
         )
 
-    def _load_guidelines(self) -> str:
-        """Load LinkedIn guidelines from file."""
+    def build_cached(self, scenario: str) -> StyleBrief:
+        """Return a cached StyleBrief for `scenario`, building it on miss.
+
+        Briefs are shared read-only between sessions — callers must not mutate them.
+        """
         try:
-            return LINKEDIN_GUIDELINES_PATH.read_text(encoding="utf-8")
+            mtime = LINKEDIN_GUIDELINES_PATH.stat().st_mtime_ns
         except FileNotFoundError:
-            return ""
-
-    def _extract_scenario_guidelines(self, scenario: str, guidelines: str) -> str:
-        """Extract common rules + specific scenario section from guidelines."""
-        if not guidelines:
-            return ""
-
-        sections = []
-
-        # 1. Persona section
-        persona_match = re.search(
-            r'## Persona\n(.*?)(?=\n---)',
-            guidelines, re.DOTALL,
-        )
-        if persona_match:
-            sections.append(f"## 페르소나\n{persona_match.group(1).strip()}")
-
-        # 2. Specific scenario guide
-        scenario_pattern = rf'### 시나리오 {scenario}:.*?(?=\n---|\n### 시나리오 [A-F]:|$)'
-        scenario_match = re.search(scenario_pattern, guidelines, re.DOTALL)
-        if scenario_match:
-            sections.append(scenario_match.group(0).strip())
-
-        # 3. Common rules
-        common_match = re.search(
-            r'## 공통 규칙\n(.*?)(?=\n## |$)',
-            guidelines, re.DOTALL,
-        )
-        if common_match:
-            sections.append(f"## 공통 규칙\n{common_match.group(1).strip()}")
-
-        # 4. Specific scenario example
-        example_pattern = rf'### 시나리오 {scenario} 예시.*?```\n(.*?)```'
-        example_match = re.search(example_pattern, guidelines, re.DOTALL)
-        if example_match:
-            sections.append(f"## 이 시나리오의 예시\n```\n{example_match.group(1).strip()}\n```")
+            mtime = 0
+        try:
+            profile_id = self.db.query(func.max(StyleProfile.id)).scalar()
+        except Exception:
+            profile_id = None
 
-        return "\n\n".join(sections)
+        key = (scenario, mtime, profile_id)
+        brief = _BRIEF_CACHE.get(key)
+        if brief is None:
+            brief = self.build(scenario)
+            _BRIEF_CACHE[key] = brief
+        return brief
 
-    def _extract_persona(self, guidelines: str) -> str:
-        """Extract persona section from guidelines, with default fallback."""
+    def _load_guidelines(self) -> str:
+        """Load LinkedIn guidelines from file (see load_guidelines())."""
+        return load_guidelines()
+
+    def _get_guideline_sections(self, scenario: str, guidelines: str) -> tuple[str, str, str]:
+        """Return (persona, scenario_guidelines, guideline_example), parsed once per file version."""
+        # 캐시된 파일 내용일 때만 캐시 사용 (동일 객체 여부로 판정)
+        cached = _guidelines_cache
+        key = (cached[0], scenario) if cached and guidelines is cached[1] else None
+        if key in _sections_cache:
+            return _sections_cache[key]
+
+        sections = self._parse_guideline_sections(scenario, guidelines)
+        if key is not None:
+            _sections_cache[key] = sections
+        return sections
+
+    def _parse_guideline_sections(self, scenario: str, guidelines: str) -> tuple[str, str, str]:
+        """Extract (persona, scenario_guidelines, guideline_example) in a single scan.
+
+        scenario_guidelines holds the scenario section + common rules only —
+        persona and the example reach consumers via `persona` /
+        `reference_examples`, so they are not sent twice.
+        """
+        found: dict[str, str] = {}
         if guidelines:
-            persona_match = re.search(
-                r'## Persona\n(.*?)(?=\n---)',
-                guidelines, re.DOTALL,
-            )
-            if persona_match:
-                return persona_match.group(1).strip()
-
-        return ("- VC 심사역 + ML 엔지니어 출신 AI 빌더\n"
-                "- 최신 AI 기술과 시장 동향에 깊은 이해\n"
-                "- 실무 경험을 바탕으로 인사이트 공유")
-
-    def _get_reference_examples(self, scenario: str, guidelines: str) -> str:
-        """Get reference post examples for the given scenario (scenario-filtered)."""
-        examples = []
-
-        # 1. Same-scenario ReferencePost (up to 2)
-        ref_posts = (
-            self.db.query(ReferencePost)
-            .filter(ReferencePost.scenario == scenario)
-            .order_by(ReferencePost.created_at.desc())
-            .limit(2)
-            .all()
+            sections_re = _SECTIONS_RE.get(scenario, _SECTIONS_RE_DEFAULT)
+            wanted = len(sections_re.groupindex)
+            for match in sections_re.finditer(guidelines):
+                # 섹션별 첫 매치만 사용 (기존 개별 search와 동일)
+                found.setdefault(match.lastgroup, match.group(match.lastgroup).strip())
+                if len(found) == wanted:
+                    break
+
+        guideline_parts = []
+        if found.get("scenario"):
+            guideline_parts.append(found["scenario"])
+        if "common" in found:
+            guideline_parts.append(f"## 공통 규칙\n{found['common']}")
+
+        return (
+            found.get("persona", DEFAULT_PERSONA),
+            "\n\n".join(guideline_parts),
+            found.get("example", ""),
         )
-        for post in ref_posts:
-            examples.append(post.content)
-
-        # Fallback: other scenarios if insufficient
-        if len(examples) < 2:
-            remaining = 2 - len(examples)
-            existing_ids = [p.id for p in ref_posts]
-            query = self.db.query(ReferencePost)
-            if existing_ids:
-                query = query.filter(ReferencePost.id.notin_(existing_ids))
-            fallback_posts = (
-                query
-                .order_by(ReferencePost.created_at.desc())
-                .limit(remaining)
+
+    def _get_reference_examples(self, scenario: str, guideline_example: str) -> str:
+        """Get reference post examples for the given scenario (cached; see _REFERENCE_CACHE)."""
+        try:
+            latest_id = self.db.query(func.max(ReferencePost.id)).scalar()
+        except Exception:
+            return self._build_reference_examples(scenario, guideline_example)
+
+        key = (scenario, latest_id, guideline_example)
+        text = _REFERENCE_CACHE.get(key)
+        if text is None:
+            text = self._build_reference_examples(scenario, guideline_example)
+            _REFERENCE_CACHE[key] = text
+        return text
+
+    def _build_reference_examples(self, scenario: str, guideline_example: str) -> str:
+        """Query reference posts (same scenario first) and format the examples section."""
+        # 1. ReferencePost (up to 2): same scenario first, other scenarios as fallback — one query
+        same_scenario_first = case((ReferencePost.scenario == scenario, 0), else_=1)
+        examples = [
+            content for (content,) in (
+                self.db.query(ReferencePost.content)
+                .order_by(same_scenario_first, ReferencePost.created_at.desc())
+                .limit(2)
                 .all()
             )
-            for post in fallback_posts:
-                examples.append(post.content)
+        ]
 
         # 2. Example from guidelines
-        if guidelines:
-            pattern = rf"### 시나리오 {scenario} 예시.*?```\n(.*?)```"
-            match = re.search(pattern, guidelines, re.DOTALL)
-            if match:
-                examples.append(match.group(1).strip())
+        if guideline_example:
+            examples.append(guideline_example)
 
         if not examples:
             return ""
 
-        examples_text = ""
-        for i, ex in enumerate(examples, 1):
-            examples_text += f"\n### 예시 {i}\n{ex}\n"
+        examples_text = "".join(
+            f"\n### 예시 {i}\n{ex}\n" for i, ex in enumerate(examples, 1)
+        )
 
         return f"""## 참고 예시
 
@@ -343,60 +432,81 @@ class StyleBriefBuilder:
         """Extract learnings from past drafts (FAIL patterns, user feedback).
 
         Returns a formatted string of past mistakes to avoid, limited to ~500 chars.
+        Shared for a few seconds across brief builds (see _LEARNINGS_TEXT_CACHE).
         """
+        text = _LEARNINGS_TEXT_CACHE.get(limit)
+        if text is None:
+            text = self._query_past_learnings(limit)
+            _LEARNINGS_TEXT_CACHE[limit] = text
+        return text
+
+    def _query_past_learnings(self, limit: int) -> str:
+        """Query the latest evaluated drafts and format their learnings (uncached)."""
         try:
-            past_drafts = (
-                self.db.query(LinkedInDraft)
+            # ORM 객체 대신 필요한 컬럼만 조회
+            rows = (
+                self.db.query(
+                    LinkedInDraft.id,
+                    LinkedInDraft.evaluation,
+                    LinkedInDraft.user_feedback,
+                )
                 .filter(LinkedInDraft.evaluation.isnot(None))
                 .order_by(LinkedInDraft.created_at.desc())
                 .limit(limit)
                 .all()
             )
 
-            if not past_drafts:
+            if not rows:
                 return ""
 
-            fail_patterns = []
-            success_patterns = []
-            user_corrections = []
+            # 위 드래프트들의 사용자 채팅 메시지 (draft_messages) — 쿼리 1회
+            user_messages: dict[int, list[str]] = {}
+            message_rows = (
+                self.db.query(DraftMessage.draft_id, DraftMessage.content)
+                .filter(
+                    DraftMessage.draft_id.in_([row[0] for row in rows]),
+                    DraftMessage.role == "user",
+                )
+                .order_by(DraftMessage.id)
+                .all()
+            )
+            for draft_id, content in message_rows:
+                user_messages.setdefault(draft_id, []).append(content)
+
+            # dict = 삽입 순서를 유지하는 O(1) 중복 제거 집합
+            fail_patterns: dict[str, None] = {}
+            success_patterns: dict[str, None] = {}
+            user_corrections: dict[str, None] = {}
 
-            for draft in past_drafts:
+            for draft_id, evaluation, user_feedback in rows:
                 # Extract patterns from evaluation
-                if draft.evaluation:
+                if evaluation:
                     try:
-                        eval_data = json.loads(draft.evaluation)
+                        eval_data = json_compat.loads(evaluation)
                         overall_score = eval_data.get("overall_score", 0)
 
+                        items = eval_data.get("items", ())
+
                         # 실패 패턴 (기존)
-                        for item in eval_data.get("items", []):
+                        for item in items:
                             if not item.get("pass", True):
-                                fail_msg = f"[{item.get('category', '')}] {item.get('rule', '')}"
-                                if fail_msg not in fail_patterns:
-                                    fail_patterns.append(fail_msg)
+                                fail_patterns[f"[{item.get('category', '')}] {item.get('rule', '')}"] = None
 
                         # 성공 패턴 (고득점 드래프트)
                         if overall_score >= 80:
-                            for item in eval_data.get("items", []):
+                            for item in items:
                                 if item.get("pass") and len(item.get("comment", "")) > 5:
-                                    msg = f"[{item.get('category', '')}] {item.get('comment', '')}"
-                                    if msg not in success_patterns:
-                                        success_patterns.append(msg)
-                    except (json.JSONDecodeError, KeyError):
+                                    success_patterns[f"[{item.get('category', '')}] {item.get('comment', '')}"] = None
+                    except (json_compat.JSONDecodeError, KeyError):
                         pass
 
                 # Extract user feedback
-                if draft.user_feedback and draft.user_feedback.strip():
-                    user_corrections.append(draft.user_feedback.strip()[:100])
+                if user_feedback and user_feedback.strip():
+                    user_corrections[user_feedback.strip()[:100]] = None
 
                 # Extract user corrections from chat history
-                if draft.chat_history:
-                    try:
-                        chats = json.loads(draft.chat_history)
-                        for msg in chats:
-                            if msg.get("role") == "user":
-                                user_corrections.append(msg["content"][:100])
-                    except (json.JSONDecodeError, KeyError):
-                        pass
+                for content in user_messages.get(draft_id, ()):
+                    user_corrections[content[:100]] = None
 
             if not fail_patterns and not success_patterns and not user_corrections:
                 return ""
@@ -404,17 +514,17 @@ class StyleBriefBuilder:
             result_parts = []
             if fail_patterns:
                 result_parts.append("## 반복 실수 방지 (이전 드래프트에서 FAIL된 항목)")
-                for p in fail_patterns[:5]:
+                for p in islice(fail_patterns, 5):
                     result_parts.append(f"- {p}")
 
             if success_patterns:
                 result_parts.append("\n## 효과적이었던 패턴 (이전 고득점 드래프트)")
-                for p in success_patterns[:3]:
+                for p in islice(success_patterns, 3):
                     result_parts.append(f"- {p}")
 
             if user_corrections:
                 result_parts.append("\n## 사용자 수정 이력 (이전 피드백)")
-                for c in user_corrections[:3]:
+                for c in islice(user_corrections, 3):
                     result_parts.append(f"- {c}")
 
             result = "\n".join(result_parts)
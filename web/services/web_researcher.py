@@ -5,9 +5,8 @@ import time
 from typing import Optional
 
 import httpx
-from anthropic import Anthropic
 
-from web.config import ANTHROPIC_API_KEY
+from web.services.anthropic_client import get_client
 from web.services.source_fetcher import fetch as fetch_source_content
 
 # Use Haiku for query generation (fast, cheap)
@@ -27,7 +26,7 @@ def _get_cse_config() -> tuple[Optional[str], Optional[str]]:
 def _generate_search_queries(title: str, summary: str) -> list[str]:
     """Generate two effective search queries from article title/summary using Haiku."""
     try:
-        client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        client = get_client()
         prompt = f"""다음 기사 제목과 요약에서 Google 검색에 적합한 영어 검색 쿼리를 2개 생성해주세요.
 - 쿼리 1: 배경 지식, 업계 맥락을 조사할 수 있는 쿼리
 - 쿼리 2: 경쟁사 비교, 대안 기술, 반론 등을 조사할 수 있는 쿼리